@@ -0,0 +1,168 @@
+"""
+AsyncOrchestrator: run connectors for many funds on a single asyncio event loop.
+
+Connectors may optionally implement the async protocol:
+
+    async def afind_portfolio(self, fund_input: str) -> List[Dict[str, Any]]
+
+Connectors that only expose the legacy blocking `find_portfolio` are run in the
+orchestrator's shared worker pool via `loop.run_in_executor`, so both kinds can be mixed.
+A bounded semaphore (`async.max_concurrency` in config.yaml) caps the number of in-flight
+connector calls across all funds. Fund and connector deadlines (`deadlines` in config.yaml)
+apply as in Orchestrator.run_many: an async connector's budget starts once it holds the
+semaphore, a sync connector's once a pool worker starts it, and a fund's clock starts with
+its first connector, so time spent queued behind other funds does not count.
+"""
+from typing import Callable, List, Dict, Any, Iterable, AsyncIterator, Optional, Tuple
+import asyncio
+import inspect
+import logging
+import time
+
+from leet_apps.instrumentation import span
+from leet_apps.orchestrator import Orchestrator
+from leet_apps.resilience import IncompleteResult
+
+_TIMED_OUT = object()
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOrchestrator(Orchestrator):
+    def __init__(self, connectors: List[Any] = None, max_workers: int = None, max_concurrency: int = None):
+        super().__init__(connectors=connectors, max_workers=max_workers)
+        self.max_concurrency = max_concurrency or self.config.get("async", {}).get("max_concurrency", 100)
+
+    async def _arun_connector(self, connector, fund_input: str, semaphore: asyncio.Semaphore,
+                              on_start: Optional[Callable[[float], None]] = None) -> List[Dict[str, Any]]:
+        async with semaphore:
+            try:
+                budget = self.connector_budget(connector)
+                afind = getattr(connector, "afind_portfolio", None)
+                if afind is not None and inspect.iscoroutinefunction(afind):
+                    if on_start is not None:
+                        on_start(time.monotonic())
+                    with span(f"connector.{type(connector).__name__}", trace_key=fund_input, fund=fund_input):
+                        return await asyncio.wait_for(afind(fund_input), budget) or []
+                return await self._arun_sync_connector(connector, fund_input, budget, on_start)
+            except asyncio.TimeoutError:
+                return _TIMED_OUT
+            except IncompleteResult as e:
+                return e
+            except Exception as e:
+                logger.warning("Connector %s failed: %s", getattr(connector, "__class__", type(connector)), e)
+                return []
+
+    async def _arun_sync_connector(self, connector, fund_input: str, budget: Optional[float],
+                                   on_start: Optional[Callable[[float], None]]) -> List[Dict[str, Any]]:
+        # Legacy sync connector: run it on the shared worker pool (traced in _run_connector). Its
+        # budget starts when a worker picks the call up, not while it waits behind other funds
+        loop = asyncio.get_running_loop()
+        started, start = asyncio.Event(), []
+
+        def run():
+            start.append(time.monotonic())
+            loop.call_soon_threadsafe(started.set)
+            return self._run_connector(connector, fund_input)
+
+        call = loop.run_in_executor(self._get_executor(), run)
+        waiter = asyncio.ensure_future(started.wait())
+        try:
+            await asyncio.wait([call, waiter], return_when=asyncio.FIRST_COMPLETED)
+            if on_start is not None:
+                on_start(start[0])
+            remaining = None if budget is None else max(budget - (time.monotonic() - start[0]), 0.0)
+            return await asyncio.wait_for(call, remaining) or []
+        finally:
+            waiter.cancel()
+            # Cancelled (fund deadline) before a worker took it: drop the queued call
+            call.cancel()
+
+    async def _arun_fund(self, fund_input: str, semaphore: asyncio.Semaphore) -> Tuple[str, Dict[str, Any]]:
+        fund_start = []
+        first_started = asyncio.Event()
+
+        def on_start(when: float):
+            if not fund_start:
+                fund_start.append(when)
+                first_started.set()
+
+        tasks = [asyncio.ensure_future(self._arun_connector(c, fund_input, semaphore, on_start)) for c in self.connectors]
+        if self.fund_deadline is None:
+            await asyncio.wait(tasks)
+        else:
+            # The fund's clock starts when its first connector starts, not when the fund is scheduled
+            pending = set(tasks)
+            starter = asyncio.ensure_future(first_started.wait())
+            try:
+                while pending and not first_started.is_set():
+                    _, pending = await asyncio.wait(pending | {starter}, return_when=asyncio.FIRST_COMPLETED)
+                    pending.discard(starter)
+            finally:
+                starter.cancel()
+            if pending:
+                await asyncio.wait(pending, timeout=max(fund_start[0] + self.fund_deadline - time.monotonic(), 0.0))
+        per_connector, timed_out, incomplete = [], [], []
+        for connector, task in zip(self.connectors, tasks):
+            result = task.result() if task.done() else _TIMED_OUT
+            task.cancel()
+            name = type(connector).__name__
+            if result is _TIMED_OUT:
+                timed_out.append(name)
+                logger.warning("Connector %s missed its deadline for %s; returning partial results", name, fund_input)
+                result = None
+            elif isinstance(result, IncompleteResult):
+                incomplete.append(name)
+                result = result.records or []
+            per_connector.append(result)
+        return fund_input, self._finalize_batch(fund_input, per_connector, timed_out=timed_out, incomplete=incomplete)
+
+    async def arun(self, fund_input: str) -> Dict[str, Any]:
+        """Async equivalent of Orchestrator.run for a single fund."""
+        async for _, normalized in self.arun_many([fund_input]):
+            return normalized
+        return {"fund": {"id": fund_input}, "companies": [], "investments": []}
+
+    async def arun_many(self, fund_inputs: Iterable[str]) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Run all connectors for many funds concurrently on the current event loop.
+
+        Yields (fund_input, normalized) tuples in completion order. At most `max_pending_funds`
+        funds are scheduled at once; in-flight connector calls are bounded by `max_concurrency`.
+        """
+        if not self.connectors:
+            for fund_input in fund_inputs:
+                yield fund_input, {"fund": {"id": fund_input}, "companies": [], "investments": []}
+            return
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        inputs = iter(fund_inputs)
+        pending = set()
+
+        def submit_next() -> bool:
+            fund_input = next(inputs, None)
+            if fund_input is None:
+                return False
+            pending.add(asyncio.ensure_future(self._arun_fund(fund_input, semaphore)))
+            return True
+
+        try:
+            while len(pending) < self.max_pending_funds and submit_next():
+                pass
+
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                    yield task.result()
+                    submit_next()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def run_many_sync(self, fund_inputs: Iterable[str]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Convenience wrapper: drive arun_many on a fresh event loop and collect all results."""
+
+        async def _collect():
+            return [item async for item in self.arun_many(fund_inputs)]
+
+        return asyncio.run(_collect())
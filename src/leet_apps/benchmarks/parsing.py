@@ -0,0 +1,115 @@
+"""
+Microbenchmark for the amount/date parsers.
+
+Builds a synthetic corpus shaped like connector output (a few thousand distinct amount and
+date strings with a long-tail distribution, plus a share of one-off free-form values) and
+reports rows per second for the memoized parsers, the uncached fast path and the full
+`normalize_investment` call.
+
+    python -m leet_apps.benchmarks.parsing --rows 1000000
+"""
+from typing import List, Tuple
+import argparse
+import json
+import random
+import time
+
+from leet_apps import parsing
+from leet_apps.normalizer import normalize_investment
+
+_MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def _amount(rng: random.Random) -> str:
+    value = rng.choice([1, 2, 2.5, 3, 5, 7.5, 10, 12, 15, 20, 25, 30, 40, 50, 75, 100, 150, 250])
+    shape = rng.randrange(6)
+    if shape == 0:
+        return f"${int(value * 1_000_000):,}"
+    if shape == 1:
+        return f"USD {value}M"
+    if shape == 2:
+        return f"{value} million"
+    if shape == 3:
+        return f"€{value}M"
+    if shape == 4:
+        return f"£{int(value * 100)}k"
+    return f"approx {value}M USD (est.)"
+
+
+def _date(rng: random.Random) -> str:
+    y, m, d = rng.randint(2000, 2024), rng.randint(1, 12), rng.randint(1, 28)
+    shape = rng.randrange(5)
+    if shape == 0:
+        return f"{y}-{m:02d}-{d:02d}"
+    if shape == 1:
+        return f"{y}-{m:02d}"
+    if shape == 2:
+        return f"{m:02d}/{d:02d}/{y}"
+    if shape == 3:
+        return f"{_MONTHS[m - 1]} {d}, {y}"
+    return f"{y}-{m:02d}-{d:02d}T12:00:00"
+
+
+def make_corpus(rows: int, distinct: int = 5000, unique_ratio: float = 0.02, seed: int = 7) -> List[Tuple[str, str]]:
+    """(amount, date) pairs drawn from `distinct` recurring values with a Zipf-like skew;
+    `unique_ratio` of rows carry one-off amounts that never repeat."""
+    rng = random.Random(seed)
+    amounts = [_amount(rng) for _ in range(distinct)]
+    dates = [_date(rng) for _ in range(distinct)]
+    weights = [1.0 / (i + 1) for i in range(distinct)]
+    picked_a = rng.choices(amounts, weights=weights, k=rows)
+    picked_d = rng.choices(dates, weights=weights, k=rows)
+    corpus = []
+    for i in range(rows):
+        a = picked_a[i]
+        if rng.random() < unique_ratio:
+            a = f"${rng.randint(1, 10 ** 9):,}"
+        corpus.append((a, picked_d[i]))
+    return corpus
+
+
+def _timed(fn, corpus) -> float:
+    start = time.perf_counter()
+    fn(corpus)
+    return time.perf_counter() - start
+
+
+def _parse_cached(corpus):
+    pa, pd = parsing.parse_amount, parsing.parse_date
+    for a, d in corpus:
+        pa(a)
+        pd(d)
+
+
+def _parse_uncached(corpus):
+    pa, pd = parsing._parse_amount, parsing._parse_date
+    for a, d in corpus:
+        pa(a)
+        pd(d)
+
+
+def _normalize(corpus):
+    for a, d in corpus:
+        normalize_investment({"company_name": "x", "investment": {"amount": a, "date": d}}, "bench-fund")
+
+
+def run(rows: int) -> dict:
+    corpus = make_corpus(rows)
+    parsing.clear_caches()
+    results = {"rows": rows}
+    for name, fn in (("parse_cached", _parse_cached), ("parse_uncached", _parse_uncached), ("normalize_investment", _normalize)):
+        elapsed = _timed(fn, corpus)
+        results[name] = {"seconds": round(elapsed, 3), "rows_per_second": int(rows / elapsed) if elapsed else None}
+    results["cache"] = parsing.cache_info()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark amount/date parsing throughput")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.rows), indent=2))
+
+
+if __name__ == "__main__":
+    main()
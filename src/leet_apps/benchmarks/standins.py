@@ -0,0 +1,210 @@
+"""
+Synthetic portfolios and local HTTP stand-ins for the benchmark suite.
+
+SyntheticUniverse deterministically generates companies and per-fund portfolios (with
+near-duplicate names and domains across sources, like real connector output). StandInServer
+serves them over a local ThreadingHTTPServer in the shapes the connectors expect:
+- Crunchbase:  GET /v3.1/odm-organizations?query=<fund>  -> {"data": {"items": [...]}}
+- NewsAPI:     GET /v2/everything?q=<fund>                -> {"articles": [...]}
+- fund pages:  GET /fund/<slug>                           -> HTML with a portfolio list
+
+Each response waits `latency` seconds (+/- `jitter`) and fails with 503 at `error_rate`.
+LocalTransport rewrites api.crunchbase.com / newsapi.org URLs to the stand-in, so the real
+connectors run unchanged.
+"""
+from typing import Any, Dict, List, Optional
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import hashlib
+import json
+import random
+import threading
+import time
+
+from leet_apps.transport import HttpTransport
+
+_PREFIXES = ["Acme", "Beta", "Gamma", "Delta", "Nova", "Quantum", "Blue", "Bright", "Iron", "Silver", "Vertex", "Orbit",
+             "Summit", "Harbor", "Pioneer", "Lumen", "Cobalt", "Atlas", "Ember", "Polar"]
+_SECTORS = ["Robotics", "Analytics", "Health", "Logistics", "Fintech", "Energy", "Bio", "Labs", "Security", "Mobility",
+            "Foods", "Cloud", "Materials", "Media", "Systems"]
+_INDUSTRIES = ["Robotics", "Analytics", "Healthcare", "Logistics", "Fintech", "Energy", "Biotech", "Security", "SaaS"]
+_CITIES = ["San Francisco, CA", "New York, NY", "Boston, MA", "Austin, TX", "London, UK", "Berlin, DE", "Chicago, IL"]
+_ROUNDS = ["Seed", "Series A", "Series B", "Series C", "Series D"]
+_INVESTORS = ["Sequoia Capital", "Accel", "Index Ventures", "Benchmark", "Greylock Partners", "Lightspeed",
+              "Founders Fund", "General Catalyst", "Insight Partners", "Tiger Global"]
+
+
+def _rng(*parts: Any) -> random.Random:
+    digest = hashlib.sha256("|".join(map(str, parts)).encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+class SyntheticUniverse:
+    def __init__(self, n_companies: int = 10000, seed: int = 7):
+        self.seed = seed
+        rng = random.Random(seed)
+        self.companies = []
+        for i in range(n_companies):
+            name = f"{rng.choice(_PREFIXES)} {rng.choice(_SECTORS)} {i}"
+            slug = name.lower().replace(" ", "")
+            self.companies.append({
+                "name": name,
+                "homepage_url": f"https://www.{slug}.example",
+                "primary_organization_type": rng.choice(_INDUSTRIES),
+                "city": rng.choice(_CITIES),
+                "founded_on": f"{rng.randint(2000, 2022)}-{rng.randint(1, 12):02d}-01",
+                "short_description": f"{name} builds products for {rng.choice(_INDUSTRIES).lower()} teams.",
+                "status": rng.choice(["active", "active", "active", "acquired", "closed"]),
+                "last_funding_type": rng.choice(_ROUNDS),
+                "last_funding_on": f"{rng.randint(2010, 2024)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                "last_funding_total": f"${rng.choice([0.5, 1, 2, 5, 10, 25, 50, 100])}M",
+                "investors": rng.sample(_INVESTORS, rng.randint(0, 3)),
+            })
+
+    def portfolio(self, fund: str, size: int) -> List[Dict[str, Any]]:
+        """The same `size` companies for a fund on every call (Crunchbase-style properties)."""
+        rng = _rng(self.seed, fund)
+        return [self.companies[i] for i in rng.sample(range(len(self.companies)), min(size, len(self.companies)))]
+
+    def raw_records(self, n: int, duplicate_ratio: float = 0.2) -> List[Dict[str, Any]]:
+        """`n` raw connector records; `duplicate_ratio` of them re-mention an earlier company
+        under a variant name or domain, as a second source would."""
+        rng = random.Random(self.seed + 1)
+        records = []
+        for i in range(n):
+            props = dict(self.companies[i % len(self.companies)])
+            if records and rng.random() < duplicate_ratio:
+                props = dict(self.companies[rng.randrange(min(i, len(self.companies)))])
+                props["name"] = rng.choice([props["name"] + ", Inc.", props["name"].upper(), props["name"] + " LLC"])
+            records.append(_raw_record(props))
+        return records
+
+
+def _raw_record(props: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "company_name": props["name"], "website": props["homepage_url"], "industry": props["primary_organization_type"],
+        "hq": props["city"], "founding_date": props["founded_on"], "description": props["short_description"],
+        "status": props["status"],
+        "investment": {"round_type": props["last_funding_type"], "date": props["last_funding_on"],
+                       "amount": props["last_funding_total"], "co_investors": list(props["investors"]),
+                       "source_links": [props["homepage_url"]]},
+        "source_links": [props["homepage_url"]],
+    }
+
+
+class StandInServer:
+    """Local HTTP server impersonating Crunchbase, NewsAPI and fund pages."""
+
+    def __init__(self, universe: SyntheticUniverse, portfolio_size: int = 200, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, articles: int = 20, seed: int = 7):
+        self.universe = universe
+        self.portfolio_size = portfolio_size
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.articles = articles
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def fund_url(self, fund: str) -> str:
+        return f"{self.base_url}/fund/{fund}"
+
+    def _delay_and_fail(self) -> bool:
+        with self._rng_lock:
+            self.requests += 1
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+            fail = self._rng.random() < self.error_rate
+            if fail:
+                self.errors += 1
+        if delay:
+            time.sleep(delay)
+        return fail
+
+    def _crunchbase(self, query: Dict[str, List[str]]) -> Any:
+        fund = (query.get("query") or [""])[0]
+        return {"data": {"items": [{"properties": props} for props in self.universe.portfolio(fund, self.portfolio_size)]}}
+
+    def _news(self, query: Dict[str, List[str]]) -> Any:
+        fund = (query.get("q") or [""])[0]
+        size = int((query.get("pageSize") or [self.articles])[0])
+        companies = self.universe.portfolio(fund, self.portfolio_size)[:size]
+        return {"articles": [{"title": f"{c['name']} Raises {c['last_funding_type']} Round",
+                              "description": f"{c['short_description']}",
+                              "url": f"https://news.example/{i}"} for i, c in enumerate(companies)]}
+
+    def _fund_page(self, fund: str) -> str:
+        items = "".join(f"<li>{c['name']}</li>" for c in self.universe.portfolio(self.fund_url(fund), self.portfolio_size))
+        return f"<html><body><h1>{fund}</h1><h2>Portfolio companies</h2><ul>{items}</ul></body></html>"
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                query = parse_qs(parts.query)
+                if standin._delay_and_fail():
+                    return self._send(503, b'{"error": "unavailable"}', "application/json")
+                if parts.path.endswith("/odm-organizations"):
+                    body = json.dumps(standin._crunchbase(query)).encode("utf-8")
+                    return self._send(200, body, "application/json")
+                if parts.path == "/v2/everything":
+                    return self._send(200, json.dumps(standin._news(query)).encode("utf-8"), "application/json")
+                if parts.path.startswith("/fund/"):
+                    return self._send(200, standin._fund_page(parts.path[len("/fund/"):]).encode("utf-8"), "text/html")
+                return self._send(404, b"not found", "text/plain")
+
+            def _send(self, status: int, body: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class LocalTransport(HttpTransport):
+    """HttpTransport that sends requests for the real API hosts to a stand-in server."""
+
+    API_HOSTS = ("https://api.crunchbase.com", "https://newsapi.org")
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    def request(self, method: str, url: str, hedge: Optional[bool] = None, **kwargs):
+        for host in self.API_HOSTS:
+            if url.startswith(host):
+                url = self.base_url + url[len(host):]
+                break
+        return super().request(method, url, hedge=hedge, **kwargs)
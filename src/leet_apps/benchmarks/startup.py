@@ -0,0 +1,69 @@
+"""
+CLI cold-start benchmark.
+
+Runs `python -m leet_apps.cli --help` and a bare `import leet_apps.cli` in fresh
+interpreters and reports the median wall time, plus which heavy dependencies (requests,
+bs4, yaml, ...) the import pulled in. Connectors and exporters are meant to be imported
+lazily, so the import should load none of them.
+
+    python -m leet_apps.benchmarks.startup --runs 10
+"""
+from typing import List
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("requests", "urllib3", "bs4", "yaml", "pyarrow", "orjson", "sqlite3", "multiprocessing", "concurrent.futures")
+
+_PROBE = (
+    "import sys, leet_apps.cli; "
+    "print(','.join(m for m in {heavy!r} if m in sys.modules))"
+)
+
+
+def _env():
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH")) if p)
+    return env
+
+
+def _median_seconds(cmd: List[str], runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=_env())
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def heavy_imports() -> List[str]:
+    """Heavy modules loaded by `import leet_apps.cli` in a fresh interpreter."""
+    out = subprocess.run([sys.executable, "-c", _PROBE.format(heavy=HEAVY_MODULES)], check=True,
+                         capture_output=True, text=True, env=_env()).stdout.strip()
+    return [m for m in out.split(",") if m]
+
+
+def run(runs: int) -> dict:
+    return {
+        "runs": runs,
+        "python_startup_seconds": round(_median_seconds([sys.executable, "-c", "pass"], runs), 4),
+        "import_cli_seconds": round(_median_seconds([sys.executable, "-c", "import leet_apps.cli"], runs), 4),
+        "cli_help_seconds": round(_median_seconds([sys.executable, "-m", "leet_apps.cli", "--help"], runs), 4),
+        "heavy_imports": heavy_imports(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark CLI cold start")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.runs), indent=2))
+
+
+if __name__ == "__main__":
+    main()
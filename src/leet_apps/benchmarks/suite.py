@@ -0,0 +1,216 @@
+"""
+End-to-end and per-stage benchmark suite.
+
+Runs the real connectors against local HTTP stand-ins (leet_apps.benchmarks.standins) with
+configurable latency and error rates, then times each offline stage on a synthetic record
+set of `--records` raw connector records:
+
+- orchestrator: `Orchestrator.run_many` wall time for a batch of `--funds` funds (partial
+  results, transport stats), then `--solo-funds` more funds each timed with its own
+  `Orchestrator.run` for per-fund latency percentiles (`fund_seconds_*`)
+- dedupe: `dedupe_records`
+- normalize / normalize_columnar: `normalize_results` and `normalize_results_columnar`
+- summary: `generate_summary`
+- export_json / export_jsonl / export_csv / export_parquet (skipped without pyarrow)
+
+Results are written as JSON; `--compare` checks them against an earlier run and exits 1 when
+a stage got slower by more than `--tolerance`. The PRD target (a medium fund, 200-500
+companies, in under 120 s) is reported as `targets.medium_fund`, checked against the
+slowest single-fund run.
+
+    python -m leet_apps.benchmarks.suite --funds 20 --portfolio 300 --records 50000 \\
+        --latency 0.05 --error-rate 0.02 --output bench.json
+    python -m leet_apps.benchmarks.suite --output new.json --compare bench.json
+"""
+from typing import Any, Callable, Dict, List, Optional
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from leet_apps.benchmarks.standins import LocalTransport, StandInServer, SyntheticUniverse
+
+MEDIUM_FUND_TARGET_SECONDS = 120.0
+
+
+def _timed(fn: Callable[[], Any]):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def _stage(seconds: float, items: int) -> Dict[str, Any]:
+    return {"seconds": round(seconds, 4), "items": items, "items_per_second": int(items / seconds) if seconds else None}
+
+
+def _percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(q * len(values)))], 4)
+
+
+def bench_orchestrator(universe: SyntheticUniverse, funds: int, portfolio: int, latency: float, jitter: float,
+                       error_rate: float, max_workers: Optional[int] = None, solo_funds: int = 3) -> Dict[str, Any]:
+    """Run every default connector for `funds` funds against the stand-in server.
+
+    The batch gives throughput; per-fund latency comes from `solo_funds` further funds run
+    one at a time, since completion times inside a batch include the funds queued before it.
+    """
+    from leet_apps.connectors.crunchbase import CrunchbaseConnector
+    from leet_apps.connectors.news import NewsConnector
+    from leet_apps.connectors.official_fund import OfficialFundConnector
+    from leet_apps.orchestrator import Orchestrator, _load_config
+    from leet_apps.resilience import SourceGuards
+
+    with StandInServer(universe, portfolio_size=portfolio, latency=latency, jitter=jitter,
+                       error_rate=error_rate) as server:
+        # No rate limiter: the stand-in has no quotas, and the benchmark measures our own overhead
+        transport = LocalTransport(server.base_url, guards=SourceGuards.from_config(_load_config()))
+        connectors = [CrunchbaseConnector(api_key="bench", backoff_seconds=0.05),
+                      NewsConnector(api_key="bench", backoff_seconds=0.05),
+                      OfficialFundConnector()]
+        fund_inputs = [server.fund_url(f"fund-{i}") for i in range(funds)]
+        orch = Orchestrator(connectors=connectors, max_workers=max_workers, transport=transport)
+        companies, partial, fund_seconds = 0, 0, []
+        try:
+            start = time.perf_counter()
+            for _, result in orch.run_many(fund_inputs):
+                companies += len(result["companies"])
+                partial += bool(result["fund"].get("partial"))
+            wall = time.perf_counter() - start
+            # Snapshot the batch's traffic before the single-fund runs add to it
+            stats = transport.stats()
+            http_requests, http_errors = server.requests, server.errors
+            for i in range(solo_funds):
+                # Fresh funds, so no response or robots cache entry from the batch is reused
+                seconds, _ = _timed(lambda: orch.run(server.fund_url(f"fund-{funds + i}")))
+                fund_seconds.append(seconds)
+        finally:
+            orch.close()
+            transport.close()
+        stats.pop("sources", None)
+        return {
+            **_stage(wall, funds),
+            "companies": companies,
+            "partial_funds": partial,
+            "fund_samples": len(fund_seconds),
+            "fund_seconds_p50": _percentile(fund_seconds, 0.5),
+            "fund_seconds_p95": _percentile(fund_seconds, 0.95),
+            "fund_seconds_max": _percentile(fund_seconds, 1.0),
+            "http_requests": http_requests,
+            "http_errors": http_errors,
+            "transport": stats,
+        }
+
+
+def bench_stages(universe: SyntheticUniverse, records: int, duplicate_ratio: float) -> Dict[str, Dict[str, Any]]:
+    """Time dedup, normalization, summary and every exporter on `records` raw records."""
+    from leet_apps import exporter
+    from leet_apps.normalizer import normalize_results, normalize_results_columnar
+    from leet_apps.orchestrator import dedupe_records
+
+    raw = universe.raw_records(records, duplicate_ratio)
+    stages = {}
+    seconds, deduped = _timed(lambda: dedupe_records(raw))
+    stages["dedupe"] = {**_stage(seconds, len(raw)), "unique": len(deduped)}
+    seconds, normalized = _timed(lambda: normalize_results(deduped, "bench-fund"))
+    stages["normalize"] = _stage(seconds, len(deduped))
+    seconds, _ = _timed(lambda: normalize_results_columnar(deduped, "bench-fund"))
+    stages["normalize_columnar"] = _stage(seconds, len(deduped))
+    seconds, _ = _timed(lambda: exporter.generate_summary(normalized))
+    stages["summary"] = _stage(seconds, len(deduped))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        exports = {
+            "export_json": lambda: exporter.export_json(normalized, os.path.join(tmp, "out.json")),
+            "export_jsonl": lambda: exporter.export_jsonl(normalized, os.path.join(tmp, "out.jsonl")),
+            "export_csv": lambda: exporter.export_csv(normalized, os.path.join(tmp, "out")),
+            "export_parquet": lambda: exporter.export_parquet(normalized, os.path.join(tmp, "out")),
+        }
+        for name, fn in exports.items():
+            try:
+                seconds, _ = _timed(fn)
+            except ImportError as e:
+                stages[name] = {"skipped": str(e)}
+                continue
+            stages[name] = _stage(seconds, len(deduped))
+    return stages
+
+
+def run(funds: int = 10, portfolio: int = 300, records: int = 20000, latency: float = 0.02, jitter: float = 0.01,
+        error_rate: float = 0.0, duplicate_ratio: float = 0.2, max_workers: Optional[int] = None,
+        seed: int = 7, solo_funds: int = 3) -> Dict[str, Any]:
+    universe = SyntheticUniverse(n_companies=max(records, portfolio * 4), seed=seed)
+    params = {"funds": funds, "portfolio": portfolio, "records": records, "latency": latency, "jitter": jitter,
+              "error_rate": error_rate, "duplicate_ratio": duplicate_ratio, "max_workers": max_workers, "seed": seed,
+              "solo_funds": solo_funds}
+    results = {
+        "meta": {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+                 "platform": platform.platform(), "cpus": os.cpu_count(), "params": params},
+        "stages": {},
+    }
+    if funds:
+        results["stages"]["orchestrator"] = bench_orchestrator(universe, funds, portfolio, latency, jitter, error_rate,
+                                                               max_workers, solo_funds)
+    if records:
+        results["stages"].update(bench_stages(universe, records, duplicate_ratio))
+    orchestrator = results["stages"].get("orchestrator")
+    if orchestrator:
+        worst = orchestrator["fund_seconds_max"]
+        results["targets"] = {"medium_fund": {"target_seconds": MEDIUM_FUND_TARGET_SECONDS, "worst_fund_seconds": worst,
+                                              "met": worst is not None and worst <= MEDIUM_FUND_TARGET_SECONDS}}
+    return results
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2) -> List[Dict[str, Any]]:
+    """Stages present in both runs whose time grew by more than `tolerance` (0.2 = 20%)."""
+    regressions = []
+    for name, stage in current.get("stages", {}).items():
+        before = baseline.get("stages", {}).get(name, {}).get("seconds")
+        after = stage.get("seconds")
+        if not before or after is None:
+            continue
+        change = (after - before) / before
+        if change > tolerance:
+            regressions.append({"stage": name, "baseline_seconds": before, "seconds": after, "change": round(change, 3)})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline end to end and per stage")
+    parser.add_argument("--funds", type=int, default=10, help="Funds to run through the orchestrator (0 to skip)")
+    parser.add_argument("--portfolio", type=int, default=300, help="Companies per synthetic fund")
+    parser.add_argument("--records", type=int, default=20000, help="Raw records for the offline stages (0 to skip)")
+    parser.add_argument("--latency", type=float, default=0.02, help="Stand-in response latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of stand-in responses that are 503s")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=None, help="Orchestrator max_workers (default: config)")
+    parser.add_argument("--solo-funds", type=int, default=3, help="Funds run one at a time for per-fund latency")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="Write results JSON to this path")
+    parser.add_argument("--compare", help="Baseline results JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown per stage before failing")
+    args = parser.parse_args(argv)
+
+    results = run(funds=args.funds, portfolio=args.portfolio, records=args.records, latency=args.latency,
+                  jitter=args.jitter, error_rate=args.error_rate, duplicate_ratio=args.duplicate_ratio,
+                  max_workers=args.workers, seed=args.seed, solo_funds=args.solo_funds)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            results["regressions"] = compare(results, json.load(f), args.tolerance)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    if results.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
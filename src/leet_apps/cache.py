@@ -0,0 +1,267 @@
+"""
+Persistent response cache for connectors (N1: use caching).
+
+Responses are stored in a small SQLite database keyed by connector namespace plus a
+normalized query, so repeated CLI invocations for the same fund do not re-hit upstream
+APIs for data that rarely changes.
+
+Features:
+- Per-namespace TTLs (e.g. crunchbase: 7 days, news: 1 day)
+- Size-bounded eviction of least recently used entries
+- Stale-while-revalidate: entries past their TTL but within `stale_ttl` are served
+  immediately while a background thread refreshes them
+- Conditional revalidation: with `conditional=True`, expired entries are revalidated with
+  their stored ETag / Last-Modified validators and a 304 just refreshes the entry
+- Hit/miss counters via `stats()`
+
+The database file is only created on first use, so connectors running on stub data never
+touch the disk.
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Returned by conditional fetch functions when the upstream answered 304 Not Modified
+NOT_MODIFIED = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    validators TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access);
+"""
+
+
+def normalize_query(query: Any) -> str:
+    """Normalize a query into a stable cache key component.
+
+    Strings are lower-cased with whitespace collapsed; other values are JSON-encoded with
+    sorted keys.
+    """
+    if isinstance(query, str):
+        return " ".join(query.lower().split())
+    return json.dumps(query, sort_keys=True, default=str)
+
+
+def validators_from_response(resp: Any) -> Dict[str, str]:
+    """Extract cache validators (ETag / Last-Modified) from an HTTP response."""
+    headers = getattr(resp, "headers", None) or {}
+    out = {}
+    if headers.get("ETag"):
+        out["etag"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        out["last_modified"] = headers["Last-Modified"]
+    return out
+
+
+def conditional_headers(validators: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since request headers from stored validators."""
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+class ResponseCache:
+    def __init__(self, path: str = ":memory:", max_entries: int = 10000, default_ttl: float = 86400.0,
+                 ttls: Dict[str, float] = None, stale_ttl: float = 0.0, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._db = None
+        self._refreshing = set()
+        self._stats = {"hits": 0, "misses": 0, "stale_hits": 0, "revalidated": 0, "evictions": 0, "refresh_errors": 0}
+
+    def _conn(self) -> sqlite3.Connection:
+        # Callers must hold self._lock
+        if self._db is None:
+            if self.path != ":memory:":
+                parent = os.path.dirname(os.path.abspath(self.path))
+                os.makedirs(parent, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.executescript(_SCHEMA)
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(responses)")}
+            if "validators" not in columns:
+                # Databases created before conditional revalidation existed
+                self._db.execute("ALTER TABLE responses ADD COLUMN validators TEXT")
+        return self._db
+
+    @staticmethod
+    def make_key(namespace: str, query: Any) -> str:
+        return f"{namespace}:{normalize_query(query)}"
+
+    def ttl_for(self, namespace: str) -> float:
+        return self.ttls.get(namespace, self.default_ttl)
+
+    def get(self, namespace: str, query: Any) -> Optional[Tuple[Any, float]]:
+        """Return (value, age_seconds) for a cached entry regardless of freshness, or None."""
+        entry = self._get_entry(namespace, query)
+        return None if entry is None else entry[:2]
+
+    def _get_entry(self, namespace: str, query: Any) -> Optional[Tuple[Any, float, Dict[str, str]]]:
+        key = self.make_key(namespace, query)
+        with self._lock:
+            db = self._conn()
+            row = db.execute("SELECT value, stored_at, validators FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            now = self._clock()
+            db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            db.commit()
+        return json.loads(row[0]), now - row[1], json.loads(row[2]) if row[2] else {}
+
+    def touch(self, namespace: str, query: Any):
+        """Mark an entry as freshly validated without rewriting its value."""
+        key = self.make_key(namespace, query)
+        with self._lock:
+            db = self._conn()
+            now = self._clock()
+            db.execute("UPDATE responses SET stored_at = ?, last_access = ? WHERE key = ?", (now, now, key))
+            db.commit()
+
+    def set(self, namespace: str, query: Any, value: Any, validators: Dict[str, str] = None):
+        key = self.make_key(namespace, query)
+        payload = json.dumps(value)
+        with self._lock:
+            db = self._conn()
+            now = self._clock()
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, namespace, value, stored_at, last_access, validators) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, payload, now, now, json.dumps(validators) if validators else None),
+            )
+            self._evict()
+            db.commit()
+
+    def _evict(self):
+        # Callers must hold self._lock and be inside the write transaction. Other processes may
+        # share the file, so the table's own row count decides, not a per-instance counter;
+        # drop least recently used entries beyond max_entries
+        db = self._conn()
+        excess = db.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+        if excess <= 0:
+            return
+        db.execute(
+            "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_access ASC LIMIT ?)",
+            (excess,),
+        )
+        self._stats["evictions"] += excess
+
+    def get_or_fetch(self, namespace: str, query: Any, fetch_fn: Callable[..., Any], ttl: float = None,
+                     stale_ttl: float = None, conditional: bool = False) -> Any:
+        """Return a cached value if fresh, otherwise call fetch_fn and cache its result.
+
+        Entries older than `ttl` but within `ttl + stale_ttl` are returned as-is while a
+        background refresh runs (stale-while-revalidate).
+
+        With `conditional=True`, fetch_fn is called with the stored validators dict and must
+        return either `(value, validators)` or NOT_MODIFIED, in which case the cached value
+        is kept and its age reset.
+        """
+        ttl = self.ttl_for(namespace) if ttl is None else ttl
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        cached = self._get_entry(namespace, query)
+        if cached is not None:
+            value, age, validators = cached
+            if age <= ttl:
+                self._count("hits")
+                return value
+            if age <= ttl + stale_ttl:
+                self._count("stale_hits")
+                self._refresh_in_background(namespace, query, fetch_fn, conditional, validators)
+                return value
+
+        self._count("misses")
+        return self._fetch_and_store(namespace, query, fetch_fn, conditional, cached)
+
+    def _fetch_and_store(self, namespace: str, query: Any, fetch_fn: Callable[..., Any], conditional: bool,
+                         cached: Optional[Tuple[Any, float, Dict[str, str]]]) -> Any:
+        if not conditional:
+            value = fetch_fn()
+            self.set(namespace, query, value)
+            return value
+
+        # Only send validators when we still hold the body they describe
+        result = fetch_fn(cached[2] if cached is not None else {})
+        if result is NOT_MODIFIED and cached is not None:
+            self._count("revalidated")
+            self.touch(namespace, query)
+            return cached[0]
+        value, validators = result
+        self.set(namespace, query, value, validators)
+        return value
+
+    def _refresh_in_background(self, namespace: str, query: Any, fetch_fn: Callable[..., Any], conditional: bool = False,
+                               validators: Dict[str, str] = None):
+        key = self.make_key(namespace, query)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _refresh():
+            try:
+                cached = self._get_entry(namespace, query)
+                self._fetch_and_store(namespace, query, fetch_fn, conditional, cached)
+            except Exception as e:
+                self._count("refresh_errors")
+                logger.warning("Background refresh of %s failed: %s", key, e)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=_refresh, name=f"cache-refresh-{namespace}", daemon=True).start()
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            out = dict(self._stats)
+            out["entries"] = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0] if self._db is not None else 0
+        return out
+
+    def clear(self):
+        with self._lock:
+            db = self._conn()
+            db.execute("DELETE FROM responses")
+            db.commit()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def open_cache(config: Dict[str, Any]) -> Optional[ResponseCache]:
+    """Build a ResponseCache from the `cache` section of config.yaml, or None if disabled."""
+    cfg = (config or {}).get("cache", {}) or {}
+    if not cfg.get("enabled", False):
+        return None
+    path = os.path.expanduser(os.environ.get("FUND_TRACKER_CACHE_PATH") or cfg.get("path", "~/.cache/fund-tracker/responses.sqlite"))
+    return ResponseCache(
+        path=path,
+        max_entries=cfg.get("max_entries", 10000),
+        default_ttl=cfg.get("default_ttl_seconds", 86400),
+        ttls=cfg.get("ttl_seconds") or {},
+        stale_ttl=cfg.get("stale_ttl_seconds", 0),
+    )
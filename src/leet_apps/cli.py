@@ -1,59 +1,414 @@
 #!/usr/bin/env python3
 """
 CLI entrypoint for fund-investment-tracker (MVP)
+
+Connectors, the orchestrator and exporters are imported only once a run needs them (see
+leet_apps.connectors.registry), so `--help` and argument errors start quickly.
 """
 import argparse
+import functools
 import json
+import os
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
-from leet_apps.connectors.crunchbase import CrunchbaseConnector
-from leet_apps.normalizer import normalize_results
+from leet_apps.columnar import as_dict
+from leet_apps.utils import fund_slug
 
 
-def parse_args():
+def parse_args(argv=None):
     parser = argparse.ArgumentParser(description="Fund Investment Tracker CLI (MVP)")
-    parser.add_argument("--fund", required=True, help="Fund name, identifier, or profile URL")
-    parser.add_argument("--output", required=False, help="Output file path (without extension)")
-    parser.add_argument("--format", required=False, choices=["json", "csv"], default="json", help="Output format: json or csv (csv will produce two files)")
-    return parser.parse_args()
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--fund", help="Fund name, identifier, or profile URL")
+    source.add_argument("--funds-file", help="Batch mode: file with one fund name, identifier, or URL per line")
+    parser.add_argument("--output", required=False, help="Output file path (without extension); in batch mode, an output directory")
+    parser.add_argument("--format", required=False, choices=["json", "csv", "parquet", "arrow"], default="json",
+                        help="Output format: json, csv, parquet or arrow (csv/parquet/arrow produce companies and investments files; parquet/arrow need pyarrow)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the persistent response cache configured in config.yaml")
+    parser.add_argument("--incremental", action="store_true", help="Compare against the last stored snapshot; only re-export funds that changed and write a <output>_changes.json diff")
+    parser.add_argument("--state-dir", required=False, help="Snapshot directory for --incremental (default from config.yaml)")
+    parser.add_argument("--save", action="store_true", help="Also save results to the local portfolio store (see the query subcommand)")
+    parser.add_argument("--stream", action="store_true", help="Write upsert/remove events as records arrive (JSON Lines, or CSV change logs with --format csv)")
+    parser.add_argument("--connectors", help="Comma-separated connectors to run (default: connectors.enabled in config.yaml); "
+                                             "built-in: crunchbase, news, official_fund, linkedin, pitchbook")
+    parser.add_argument("--profile", action="store_true", help="Print a per-stage timing breakdown to stderr after the run")
+    parser.add_argument("--profile-output", help="Write stage metrics / traces to this file (format from --profile-format)")
+    parser.add_argument("--profile-format", choices=["json", "prometheus", "otlp"], default="json",
+                        help="--profile-output format: json (stages + spans), prometheus (text metrics) or otlp (OpenTelemetry JSON traces)")
+    args = parser.parse_args(argv)
+    if args.connectors is not None:
+        from leet_apps.connectors.registry import UnknownConnector, parse_names
 
+        try:
+            args.connectors = parse_names(args.connectors)
+        except UnknownConnector as e:
+            parser.error(str(e))
+        if not args.connectors:
+            parser.error("--connectors needs at least one connector name")
+    if args.stream and args.incremental:
+        parser.error("--stream cannot be combined with --incremental")
+    if args.stream and args.save:
+        parser.error("--save is not supported with --stream")
+    if args.format in ("parquet", "arrow"):
+        if args.stream:
+            parser.error("--stream supports json and csv output only")
+        if not args.output:
+            parser.error(f"--format {args.format} requires --output")
+    return args
+
+
+def _read_funds_file(path: str) -> Iterator[str]:
+    """Yield fund inputs from a file lazily, skipping blank lines and '#' comments."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            fund = line.strip()
+            if fund and not fund.startswith("#"):
+                yield fund
 
-def main(argv=None):
-    args = parse_args()
-    fund_input = args.fund
 
+def _build_orchestrator(args):
     # Use orchestrator to allow multiple connectors and deduplication
-    from leet_apps.orchestrator import Orchestrator
+    from leet_apps.orchestrator import Orchestrator, _load_config
+    from leet_apps.cache import open_cache
+    from leet_apps.connectors.registry import build_connectors
+    from leet_apps.robots import RobotsCache
+
+    config = _load_config()
+    cache = None if args.no_cache else open_cache(config)
+    robots = RobotsCache.from_config(config, cache=cache) if config.get("robots", {}).get("enabled", True) else None
+
+    if args.incremental:
+        from leet_apps.incremental import IncrementalOrchestrator, SnapshotStore
+
+        store = SnapshotStore(args.state_dir) if args.state_dir else None
+        orchestrator_cls = functools.partial(IncrementalOrchestrator, store=store)
+    else:
+        orchestrator_cls = Orchestrator
+
+    # Only the enabled connectors are imported (default: Crunchbase, News, OfficialFund)
+    return orchestrator_cls(connectors=build_connectors(config, args.connectors, cache=cache, robots=robots))
+
+
+def _write_output(normalized: Dict[str, Any], out_path: str, fmt: str, partitioned: bool = False):
+    changes = normalized.get("changes")
+    if changes is not None:
+        # Incremental mode: skip unchanged funds entirely and write the diff next to the output
+        if not changes.get("changed"):
+            print(f"No changes for {normalized.get('fund', {}).get('id')}; skipped export")
+            return
+        from leet_apps.exporter import export_changes
+
+        # A partitioned dataset root is shared by all funds, so each diff gets its own file
+        changes_path = (os.path.join(out_path, fund_slug(str(normalized.get("fund", {}).get("id"))))
+                        if partitioned else out_path) + "_changes.json"
+        export_changes(changes, changes_path)
+        print(f"Wrote changes to {changes_path}")
+
+    # Use exporter for output
+    if fmt in ("parquet", "arrow"):
+        from leet_apps import exporter
+
+        getattr(exporter, f"export_{fmt}")(normalized, out_path, partition_by_fund=partitioned)
+        where = f"{out_path}/companies and {out_path}/investments" if partitioned else f"{out_path}_companies.{fmt} and {out_path}_investments.{fmt}"
+        print(f"Wrote {fmt} output to {where}")
+    elif fmt == "json":
+        from leet_apps.exporter import export_json
+
+        export_json(normalized, out_path + ".json")
+        print(f"Wrote JSON output to {out_path}.json")
+    else:
+        from leet_apps.exporter import export_csv
+
+        export_csv(normalized, out_path)
+        print(f"Wrote CSV outputs to {out_path}_companies.csv and {out_path}_investments.csv")
+
+
+def _run_batch(orchestrator, args, store=None):
+    """Stream each fund's result to its own output file (or a JSON line on stdout) as it completes."""
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+    with orchestrator:
+        for fund_input, normalized in orchestrator.run_many(_read_funds_file(args.funds_file)):
+            _save(store, normalized)
+            if args.output and args.format in ("parquet", "arrow"):
+                # One dataset for the whole batch, partitioned by fund
+                _write_output(normalized, args.output, args.format, partitioned=True)
+            elif args.output:
+                _write_output(normalized, os.path.join(args.output, fund_slug(fund_input)), args.format)
+            else:
+                print(json.dumps(as_dict(normalized)), flush=True)
+
+
+def _run_stream(orchestrator, args):
+    """Stream each fund's events to <output>.jsonl / CSV change logs, or JSON lines on stdout."""
+    from leet_apps.exporter import export_csv_stream, export_jsonl_stream, write_jsonl
+
+    funds = _read_funds_file(args.funds_file) if args.funds_file else [args.fund]
+    if args.funds_file and args.output:
+        os.makedirs(args.output, exist_ok=True)
+    with orchestrator:
+        for fund_input in funds:
+            events = orchestrator.stream(fund_input)
+            if not args.output:
+                write_jsonl(events, sys.stdout)
+                continue
+            out_path = os.path.join(args.output, fund_slug(fund_input)) if args.funds_file else args.output
+            if args.format == "csv":
+                export_csv_stream(events, out_path)
+                print(f"Streamed CSV change logs to {out_path}_companies.csv and {out_path}_investments.csv")
+            else:
+                export_jsonl_stream(events, out_path + ".jsonl")
+                print(f"Streamed events to {out_path}.jsonl")
+
+
+def parse_query_args(argv=None):
+    parser = argparse.ArgumentParser(prog="fund-tracker query", description="Query the local portfolio store (no connectors are run)")
+    parser.add_argument("--company", help="Company name or website: which funds invested in it")
+    parser.add_argument("--fund", help="Only investments by this fund id")
+    parser.add_argument("--round", dest="round_type", help="Round type, e.g. 'Series B' (case-insensitive)")
+    parser.add_argument("--year", type=int, help="Investment year")
+    parser.add_argument("--from", dest="date_from", help="Earliest investment date (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", help="Latest investment date (YYYY-MM-DD)")
+    parser.add_argument("--co-investor", help="Only investments with this co-investor")
+    parser.add_argument("--limit", type=int, help="Maximum number of rows")
+    parser.add_argument("--list-funds", action="store_true", help="List stored funds instead of investments")
+    parser.add_argument("--top-co-investors", metavar="INVESTOR", help="Investors sharing the most portfolio companies with INVESTOR")
+    parser.add_argument("--shared", nargs=2, metavar=("INVESTOR_A", "INVESTOR_B"), help="Companies backed by both investors")
+    parser.add_argument("--network", metavar="INVESTOR", help="Co-investors of INVESTOR within --hops co-investment edges")
+    parser.add_argument("--hops", type=int, default=2, help="Hops for --network (default 2)")
+    parser.add_argument("--store", help="Store path (default from config.yaml or FUND_TRACKER_STORE_PATH)")
+    return parser.parse_args(argv)
+
+
+def query_main(argv=None):
+    from leet_apps.orchestrator import _load_config
+    from leet_apps.store import PortfolioStore
+
+    args = parse_query_args(argv)
+    with PortfolioStore.from_config(_load_config(), path=args.store) as store:
+        if args.list_funds:
+            rows = store.funds()
+        elif args.top_co_investors or args.shared or args.network:
+            rows = _graph_query(store, args)
+        else:
+            rows = store.find_investments(fund_id=args.fund, company=args.company, round_type=args.round_type, year=args.year,
+                                          date_from=args.date_from, date_to=args.date_to, co_investor=args.co_investor,
+                                          limit=args.limit)
+    print(json.dumps(rows, indent=2))
+
+
+def _graph_query(store, args):
+    from leet_apps.graph import CoInvestmentGraph
+
+    graph = CoInvestmentGraph.from_store(store)
+    if args.top_co_investors:
+        return [{"investor": name, "shared_companies": n}
+                for name, n in graph.top_coinvestors(args.top_co_investors, k=args.limit or 10)]
+    if args.shared:
+        return graph.shared_portfolio(*args.shared)
+    network = graph.expand(args.network, hops=args.hops, max_nodes=args.limit)
+    return [{"investor": name, "hops": hops} for name, hops in network.items()]
+
+
+def parse_schedule_args(argv=None):
+    parser = argparse.ArgumentParser(prog="fund-tracker schedule", description="Scheduled refresh daemon (see leet_apps.scheduler)")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--add", metavar="FUND", help="Track a fund (or update its importance)")
+    action.add_argument("--add-file", metavar="PATH", help="Track every fund in a file (one per line)")
+    action.add_argument("--remove", metavar="FUND", help="Stop tracking a fund")
+    action.add_argument("--status", action="store_true", help="Print tracked funds and queue metrics as JSON")
+    action.add_argument("--run", action="store_true", help="Refresh due funds until interrupted")
+    parser.add_argument("--importance", type=float, default=1.0, help="Refresh weight for --add/--add-file: 2 refreshes twice as often")
+    parser.add_argument("--once", action="store_true", help="With --run: refresh one batch of due funds and exit")
+    parser.add_argument("--output", help="With --run: directory for per-fund outputs (only funds that changed are re-exported)")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--save", action="store_true", help="With --run: also save refreshed funds to the portfolio store")
+    parser.add_argument("--state", help="Scheduler state file (default from config.yaml or FUND_TRACKER_SCHEDULER_STATE)")
+    parser.add_argument("--state-dir", help="Snapshot directory used to detect changes (default from config.yaml)")
+    parser.add_argument("--connectors", help="Comma-separated connectors to run (default: connectors.enabled in config.yaml)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the persistent response cache")
+    args = parser.parse_args(argv)
+    if args.connectors is not None:
+        from leet_apps.connectors.registry import UnknownConnector, parse_names
+
+        try:
+            args.connectors = parse_names(args.connectors)
+        except UnknownConnector as e:
+            parser.error(str(e))
+    if args.importance <= 0:
+        parser.error("--importance must be positive")
+    # Refreshes diff against the last snapshot, so unchanged funds are not re-exported
+    args.incremental = True
+    return args
 
-    # Default orchestrator uses multiple connectors (Crunchbase, News, OfficialFund)
-    orchestrator = Orchestrator(connectors=[CrunchbaseConnector(),
-                                           __import__('leet_apps.connectors.news', fromlist=['']).NewsConnector(),
-                                           __import__('leet_apps.connectors.official_fund', fromlist=['']).OfficialFundConnector()])
-    raw = orchestrator.run(fund_input)
+
+def schedule_main(argv=None):
+    from leet_apps.orchestrator import _load_config
+    from leet_apps.scheduler import RefreshScheduler
+
+    args = parse_schedule_args(argv)
+    config = _load_config()
+    if not args.run:
+        scheduler = RefreshScheduler.from_config(config, None, state_path=args.state)
+        if args.add:
+            scheduler.add(args.add, args.importance)
+        elif args.add_file:
+            scheduler.add_many(_read_funds_file(args.add_file), args.importance)
+        elif args.remove and not scheduler.remove(args.remove):
+            print(f"{args.remove} is not scheduled", file=sys.stderr)
+        print(json.dumps({"funds": scheduler.funds(), "metrics": scheduler.metrics()}, indent=2))
+        return
+
+    store = _open_store(args)
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+
+    def on_result(fund_input, normalized):
+        _save(store, normalized)
+        if args.output:
+            _write_output(normalized, os.path.join(args.output, fund_slug(fund_input)), args.format)
+
+    orchestrator = _build_orchestrator(args)
+    scheduler = RefreshScheduler.from_config(config, orchestrator, state_path=args.state, on_result=on_result)
+    try:
+        with orchestrator:
+            if args.once:
+                scheduler.run_once()
+            else:
+                scheduler.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if store is not None:
+            store.close()
+    print(json.dumps(scheduler.metrics(), indent=2), file=sys.stderr)
+
+
+def parse_serve_args(argv=None):
+    parser = argparse.ArgumentParser(prog="fund-tracker serve", description="Local HTTP API over a warm orchestrator (see leet_apps.server)")
+    parser.add_argument("--host", help="Bind address (default from config.yaml, 127.0.0.1)")
+    parser.add_argument("--port", type=int, help="Port (default from config.yaml, 8080)")
+    parser.add_argument("--connectors", help="Comma-separated connectors to run (default: connectors.enabled in config.yaml)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the persistent response cache")
+    parser.add_argument("--profile", action="store_true", help="Record per-stage metrics (served on /metrics)")
+    args = parser.parse_args(argv)
+    if args.connectors is not None:
+        from leet_apps.connectors.registry import UnknownConnector, parse_names
+
+        try:
+            args.connectors = parse_names(args.connectors)
+        except UnknownConnector as e:
+            parser.error(str(e))
+    args.incremental, args.state_dir = False, None
+    return args
+
+
+def serve_main(argv=None):
+    from leet_apps.orchestrator import _load_config
+    from leet_apps.server import serve_from_config
+
+    args = parse_serve_args(argv)
+    args.profile_output = None
+    _start_tracing(args)
+    print("Serving fund portfolios; Ctrl-C to stop", file=sys.stderr)
+    serve_from_config(_load_config(), _build_orchestrator(args), host=args.host, port=args.port)
+
+
+def _open_store(args):
+    if not args.save:
+        return None
+    from leet_apps.orchestrator import _load_config
+    from leet_apps.store import PortfolioStore
+
+    return PortfolioStore.from_config(_load_config())
+
+
+def _save(store, normalized: Dict[str, Any]):
+    if store is None:
+        return
+    saved = store.save_result(normalized)
+    print(f"Saved {saved} investments for {normalized.get('fund', {}).get('id')} to {store.path}", file=sys.stderr)
+
+
+def _run_single(orchestrator, args, store=None):
+    """Run one fund and write it to --output, or print it as JSON."""
+    fund_input = args.fund
+    with orchestrator:
+        raw = orchestrator.run(fund_input)
 
     # Orchestrator may return normalized data (dict) or a raw list of records
     if isinstance(raw, dict) and "companies" in raw:
         normalized = raw
     else:
+        from leet_apps.normalizer import normalize_results
+
         normalized = normalize_results(raw, fund_input)
+    _save(store, normalized)
 
-    # Use exporter for output
     if args.output:
-        out_path = args.output
-        if args.format == "json":
-            from leet_apps.exporter import export_json
+        _write_output(normalized, args.output, args.format)
+    else:
+        # Print JSON to stdout for readability
+        print(json.dumps(as_dict(normalized), indent=2))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == "query":
+        query_main(argv[1:])
+        return
+    if argv and argv[0] == "schedule":
+        schedule_main(argv[1:])
+        return
+    if argv and argv[0] == "serve":
+        serve_main(argv[1:])
+        return
+    args = parse_args(argv)
+    tracer = _start_tracing(args)
+    try:
+        _run(args)
+    finally:
+        _report_tracing(tracer, args)
 
-            export_json(normalized, out_path + ".json")
-            print(f"Wrote JSON output to {out_path}.json")
+
+def _run(args):
+    orchestrator = _build_orchestrator(args)
+
+    if args.stream:
+        _run_stream(orchestrator, args)
+        return
+
+    store = _open_store(args)
+    try:
+        if args.funds_file:
+            _run_batch(orchestrator, args, store)
         else:
-            from leet_apps.exporter import export_csv
+            _run_single(orchestrator, args, store)
+    finally:
+        if store is not None:
+            store.close()
 
-            export_csv(normalized, out_path)
-            print(f"Wrote CSV outputs to {out_path}_companies.csv and {out_path}_investments.csv")
-    else:
-        # Print JSON to stdout for readability
-        print(json.dumps(normalized, indent=2))
+
+def _start_tracing(args):
+    from leet_apps import instrumentation
+    from leet_apps.orchestrator import _load_config
+
+    config = _load_config()
+    if args.profile or args.profile_output:
+        return instrumentation.enable((config.get("instrumentation", {}) or {}).get("max_spans"))
+    tracer = instrumentation.configure(config)
+    return tracer if tracer.enabled else None
+
+
+def _report_tracing(tracer, args):
+    if tracer is None:
+        return
+    if args.profile_output:
+        with open(args.profile_output, "w", encoding="utf-8") as f:
+            f.write(tracer.export(args.profile_format))
+        print(f"Wrote {args.profile_format} profile to {args.profile_output}", file=sys.stderr)
+    if args.profile:
+        print(tracer.breakdown(), file=sys.stderr)
 
 
 if __name__ == "__main__":
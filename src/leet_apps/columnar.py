@@ -0,0 +1,274 @@
+"""
+Compact columnar form of a normalized result.
+
+The dict form built by `normalize_results` stores every key string, a `field_confidence`
+dict and an overall confidence per company and investment, which adds up for large funds
+held in memory. ColumnarResult keeps one column per field instead:
+- free text (names, descriptions, dates) as plain lists of references
+- low-cardinality fields (industry, hq, status, round type, currency, fund id) as
+  categorical columns: interned values plus an `array('I')` of codes
+- numeric amounts as an `array('d')` (NaN for missing)
+- list fields (source links, co-investors) as one flat column plus offsets
+
+`field_confidence` and `confidence` are not stored. They are presence-based in
+normalize_company / normalize_investment, so rows rebuild them on access.
+
+ColumnarResult is a read-only Mapping with the same top-level keys as the dict form, and
+`result["companies"][i]` builds a row dict on demand. The exporter reads the columns
+directly; use `to_dict()` (or `as_dict`) for code that needs plain dicts, e.g. json.dumps.
+"""
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+from array import array
+from collections import Counter
+from collections.abc import Mapping as MappingABC, Sequence as SequenceABC
+import math
+
+TEXT = "text"
+CATEGORY = "category"
+FLOAT = "float"
+TEXT_LIST = "text_list"
+CATEGORY_LIST = "category_list"
+
+COMPANY_SCHEMA = {
+    "id": TEXT, "name": TEXT, "website": TEXT, "industry": CATEGORY, "hq": CATEGORY, "founding_date": TEXT,
+    "description": TEXT, "status": CATEGORY, "source_links": TEXT_LIST,
+}
+COMPANY_CONFIDENCE_FIELDS = ("name", "website", "industry", "hq", "founding_date", "description", "status")
+
+INVESTMENT_SCHEMA = {
+    "fund_id": CATEGORY, "company_id": TEXT, "round_type": CATEGORY, "date": TEXT, "amount": CATEGORY,
+    "amount_value": FLOAT, "amount_currency": CATEGORY, "co_investors": CATEGORY_LIST, "investor_role": CATEGORY,
+    "source_links": TEXT_LIST,
+}
+INVESTMENT_CONFIDENCE_FIELDS = ("round_type", "date", "amount", "co_investors", "investor_role")
+
+
+class Categorical:
+    """Interned values plus one integer code per row."""
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self.codes = array("I")
+        self._index: Dict[Any, int] = {}
+
+    def code_for(self, value: Any) -> int:
+        try:
+            code = self._index.get(value)
+        except TypeError:
+            # Unhashable values (e.g. a list-valued industry) are stored without interning
+            self.values.append(value)
+            return len(self.values) - 1
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value: Any):
+        self.codes.append(self.code_for(value))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, i: int) -> Any:
+        return self.values[self.codes[i]]
+
+    def __iter__(self) -> Iterator[Any]:
+        values = self.values
+        return (values[c] for c in self.codes)
+
+    def extend(self, other: "Categorical"):
+        """Append another categorical's rows, re-coding its values into this one."""
+        remap = array("I", (self.code_for(v) for v in other.values))
+        self.codes.extend(remap[c] for c in other.codes)
+
+    def counts(self) -> Dict[Any, int]:
+        """Occurrences per value, in order of first appearance."""
+        by_code = Counter(self.codes)
+        return {value: by_code[code] for code, value in enumerate(self.values) if by_code[code]}
+
+
+class FloatColumn:
+    def __init__(self):
+        self.data = array("d")
+
+    def append(self, value: Optional[float]):
+        self.data.append(math.nan if value is None else value)
+
+    def extend(self, other: "FloatColumn"):
+        self.data.extend(other.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, i: int) -> Optional[float]:
+        v = self.data[i]
+        return None if v != v else v
+
+    def __iter__(self) -> Iterator[Optional[float]]:
+        return (None if v != v else v for v in self.data)
+
+
+class ListColumn:
+    """Variable-length lists stored as one flat column plus row offsets."""
+
+    def __init__(self, categorical: bool = False):
+        self.flat = Categorical() if categorical else []
+        self.offsets = array("I", [0])
+
+    def append(self, values: Optional[Iterable[Any]]):
+        for v in values or ():
+            self.flat.append(v)
+        self.offsets.append(len(self.flat))
+
+    def extend(self, other: "ListColumn"):
+        base = len(self.flat)
+        self.flat.extend(other.flat)
+        self.offsets.extend(base + o for o in other.offsets[1:])
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> List[Any]:
+        flat = self.flat
+        return [flat[j] for j in range(self.offsets[i], self.offsets[i + 1])]
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        return (self[i] for i in range(len(self)))
+
+    def distinct(self) -> set:
+        return set(self.flat.values) if isinstance(self.flat, Categorical) else set(self.flat)
+
+
+_COLUMN_TYPES = {
+    TEXT: list,
+    CATEGORY: Categorical,
+    FLOAT: FloatColumn,
+    TEXT_LIST: ListColumn,
+    CATEGORY_LIST: lambda: ListColumn(categorical=True),
+}
+
+
+class ColumnTable(SequenceABC):
+    """Columns for one record type; behaves as a read-only sequence of row dicts."""
+
+    def __init__(self, schema: Mapping[str, str], confidence_fields: Sequence[str] = (), overall_confidence: bool = False):
+        self.schema = dict(schema)
+        self.confidence_fields = tuple(confidence_fields)
+        self.overall_confidence = overall_confidence
+        self.columns = {name: _COLUMN_TYPES[kind]() for name, kind in self.schema.items()}
+        self._length = 0
+
+    def append(self, record: Mapping[str, Any]):
+        """Append one normalized record; keys outside the schema (and confidences) are dropped."""
+        for name, column in self.columns.items():
+            column.append(record.get(name))
+        self._length += 1
+
+    def extend(self, records: Iterable[Mapping[str, Any]]):
+        for record in records:
+            self.append(record)
+
+    def extend_table(self, other: "ColumnTable"):
+        """Append all rows of a table with the same schema, column by column."""
+        for name, column in self.columns.items():
+            column.extend(other.columns[name])
+        self._length += len(other)
+
+    def column(self, name: str):
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._row(j) for j in range(*i.indices(self._length))]
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("row index out of range")
+        return self._row(i)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        names = tuple(self.columns)
+        add_confidence = self._add_confidence
+        for values in zip(*(iter(c) for c in self.columns.values())):
+            row = dict(zip(names, values))
+            add_confidence(row)
+            yield row
+
+    def _row(self, i: int) -> Dict[str, Any]:
+        row = {name: column[i] for name, column in self.columns.items()}
+        self._add_confidence(row)
+        return row
+
+    def _add_confidence(self, row: Dict[str, Any]):
+        if not self.confidence_fields:
+            return
+        field_conf = {f: 1.0 if row.get(f) else 0.0 for f in self.confidence_fields}
+        row["field_confidence"] = field_conf
+        if self.overall_confidence:
+            row["confidence"] = sum(field_conf.values()) / len(field_conf)
+
+    def iter_rows(self, fields: Sequence[str]) -> Iterator[tuple]:
+        """Yield tuples of the requested fields without building row dicts.
+
+        `confidence` may be requested for tables that track it.
+        """
+        iters = []
+        for f in fields:
+            if f == "confidence" and self.overall_confidence:
+                iters.append(self._iter_confidence())
+            else:
+                iters.append(iter(self.columns[f]))
+        return zip(*iters) if iters else iter(())
+
+    def _iter_confidence(self) -> Iterator[float]:
+        n = len(self.confidence_fields)
+        cols = [iter(self.columns[f]) for f in self.confidence_fields]
+        return (sum(1.0 for v in values if v) / n for values in zip(*cols))
+
+
+class ColumnarResult(MappingABC):
+    """Columnar counterpart of the `{"fund", "companies", "investments"}` dict."""
+
+    def __init__(self, fund: Dict[str, Any] = None, extra: Dict[str, Any] = None):
+        self.fund = fund or {}
+        self.companies = ColumnTable(COMPANY_SCHEMA, COMPANY_CONFIDENCE_FIELDS)
+        self.investments = ColumnTable(INVESTMENT_SCHEMA, INVESTMENT_CONFIDENCE_FIELDS, overall_confidence=True)
+        # Additional top-level keys (e.g. incremental "changes") kept as-is
+        self.extra = dict(extra or {})
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ColumnarResult":
+        extra = {k: v for k, v in data.items() if k not in ("fund", "companies", "investments")}
+        result = cls(fund=dict(data.get("fund") or {}), extra=extra)
+        result.companies.extend(data.get("companies") or [])
+        result.investments.extend(data.get("investments") or [])
+        return result
+
+    def add(self, company: Mapping[str, Any], investment: Mapping[str, Any]):
+        self.companies.append(company)
+        self.investments.append(investment)
+
+    def _items(self) -> Dict[str, Any]:
+        return {"fund": self.fund, "companies": self.companies, "investments": self.investments, **self.extra}
+
+    def __getitem__(self, key: str) -> Any:
+        return self._items()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items())
+
+    def __len__(self) -> int:
+        return 3 + len(self.extra)
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = {"fund": dict(self.fund), "companies": list(self.companies), "investments": list(self.investments)}
+        out.update(self.extra)
+        return out
+
+
+def as_dict(data: Mapping[str, Any]) -> Dict[str, Any]:
+    """Plain-dict form of a normalized result, converting ColumnarResult if needed."""
+    return data.to_dict() if isinstance(data, ColumnarResult) else data
@@ -5,54 +5,120 @@ Behavior:
 - If an API key is provided (via constructor or CRUNCHBASE_API_KEY env var), attempt to use the Crunchbase API (simple client).
 - Otherwise, fall back to the existing stub sample data.
 
+Pagination:
+- Page-numbered responses (`paging.number_of_pages`) fetch the remaining pages concurrently,
+  at most `page_concurrency` at a time per connector (shared across funds).
+- Cursor responses (`paging.after_id`, an `after_id` in `paging.next_page_url`, or
+  `paging.has_more` with the last item's uuid) are followed one page after another.
+- At most `max_pages` pages are fetched per fund. Records are yielded page by page, in page
+  order, so downstream dedup starts before the last page arrives.
+- A listing cut short (a later page failed, or the page budget ran out) raises
+  leet_apps.resilience.IncompleteResult after the records already fetched, so the
+  orchestrator flags the fund partial instead of treating the missing companies as gone.
+
 Notes:
 - This implementation is defensive and designed for unit testing: the actual HTTP call is small and the parsing is tolerant.
 - Rate limiting and caching should be added at a higher level; here we include a simple sleep backoff for retries.
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+import contextvars
 import os
+import threading
 import time
 import logging
 
 import requests
 
+from leet_apps.cache import NOT_MODIFIED, conditional_headers, validators_from_response
+from leet_apps.instrumentation import span
+from leet_apps.resilience import IncompleteResult, source_available
+
 logger = logging.getLogger(__name__)
 
 
 class CrunchbaseConnector:
-    def __init__(self, api_key: str = None, max_retries: int = 2, backoff_seconds: float = 1.0):
+    cache_namespace = "crunchbase"
+    # Host whose rate_limits quota the API calls spend (read by leet_apps.scheduler)
+    api_host = "api.crunchbase.com"
+
+    def __init__(self, api_key: str = None, max_retries: int = 2, backoff_seconds: float = 1.0, cache=None, transport=None,
+                 page_size: int = None, max_pages: int = 20, page_concurrency: int = 4):
         self.api_key = api_key or os.environ.get("CRUNCHBASE_API_KEY")
         self.max_retries = max_retries
         self.backoff_seconds = backoff_seconds
+        # Items per page requested from the API (None: the API default)
+        self.page_size = page_size
+        # Per-fund page budget, and pages fetched concurrently by this connector
+        self.max_pages = max_pages
+        self.page_concurrency = page_concurrency
+        self._page_pool = None
+        self._page_pool_lock = threading.Lock()
+        # Optional leet_apps.cache.ResponseCache shared across connectors
+        self.cache = cache
+        # Optional leet_apps.transport.HttpTransport (pooled keep-alive sessions); injected by the Orchestrator
+        self.transport = transport
 
-    def _call_api(self, query: str) -> Dict[str, Any]:
+    def _call_api(self, query: str, page: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Return the Crunchbase API response for a query, served from the response cache when configured.
+
+        `page` selects a later page ({"page": n} or {"after_id": cursor}); None is the first page.
+        """
+        if self.cache is not None:
+            # The first page keeps the plain query as its cache key
+            key = {"query": query, **page} if page else query
+            # Expired entries are revalidated with ETag/Last-Modified rather than refetched
+            return self.cache.get_or_fetch(self.cache_namespace, key,
+                                           lambda validators: self._fetch_api(query, validators, page), conditional=True)
+        return self._fetch_api(query, page=page)[0]
+
+    def _fetch_api(self, query: str, validators: Dict[str, str] = None, page: Dict[str, Any] = None) -> Any:
         """Make a simple GET request to the Crunchbase API.
 
-        This function is intentionally generic so unit tests can mock requests.get.
+        Returns (data, validators), or NOT_MODIFIED when `validators` were sent and the API
+        answered 304. This function is intentionally generic so unit tests can mock requests.get.
         """
         # Hypothetical Crunchbase API endpoint -- the exact endpoint and params may vary.
         url = "https://api.crunchbase.com/v3.1/odm-organizations"
         params = {"query": query, "user_key": self.api_key}
+        if self.page_size:
+            params["items_per_page"] = self.page_size
+        if page:
+            params.update(page)
 
         attempt = 0
         while attempt <= self.max_retries:
             try:
-                resp = requests.get(url, params=params, timeout=10)
+                resp = (self.transport or requests).get(url, params=params, headers=conditional_headers(validators), timeout=10)
+                if resp.status_code == 304 and validators:
+                    return NOT_MODIFIED
                 if resp.status_code == 200:
-                    return resp.json()
+                    return resp.json(), validators_from_response(resp)
                 else:
                     logger.warning("Crunchbase API returned status %s: %s", resp.status_code, resp.text)
             except requests.RequestException as e:
                 logger.warning("Crunchbase API request failed: %s", e)
 
             attempt += 1
-            time.sleep(self.backoff_seconds * attempt)
+            if not source_available(self.transport, url):
+                # The source's circuit opened: further attempts would be refused, skip the backoff
+                break
+            with span("retry.sleep", source="crunchbase", attempt=attempt):
+                time.sleep(self.backoff_seconds * attempt)
 
         raise RuntimeError("Crunchbase API request failed after retries")
 
     def _parse_api_response(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Convert Crunchbase API response into the internal raw record format used by the normalizer.
 
+        See _iter_api_response for the supported shapes.
+        """
+        return list(self._iter_api_response(data))
+
+    def _iter_api_response(self, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield raw records from a Crunchbase API response one entry at a time.
+
         This is best-effort parsing; we support multiple common response shapes used by
         Crunchbase-like APIs:
         - {"data": {"items": [{"properties": {...}}, ...]}}
@@ -64,9 +130,8 @@ class CrunchbaseConnector:
         For each entry we try to extract a `properties` dict or use the entry itself
         as a properties-like mapping. Entries that don't contain usable properties are skipped.
         """
-        items = []
         if not data:
-            return items
+            return
 
         payload = data.get("data") if isinstance(data, dict) else data
         # If payload is None, fallback to original data
@@ -96,9 +161,7 @@ class CrunchbaseConnector:
             # Map and append
             mapped = self._map_props_to_raw(props)
             if mapped:
-                items.append(mapped)
-
-        return items
+                yield mapped
 
     def _map_props_to_raw(self, props: Dict[str, Any]) -> Dict[str, Any]:
         # Map common Crunchbase fields to our raw format. This mapping is tolerant.
@@ -121,24 +184,125 @@ class CrunchbaseConnector:
             "source_links": [props.get("homepage_url")] if props.get("homepage_url") else [],
         }
 
+    def _paging(self, data: Any) -> Dict[str, Any]:
+        """Pagination info of a response: {"pages": total pages or None, "next": next-page params or None}."""
+        payload = data.get("data") if isinstance(data, dict) else None
+        paging = (payload.get("paging") if isinstance(payload, dict) else None) or \
+            (data.get("paging") if isinstance(data, dict) else None) or {}
+        if not isinstance(paging, dict):
+            return {"pages": None, "next": None}
+        pages = paging.get("number_of_pages")
+        after_id = paging.get("after_id") or paging.get("next_cursor")
+        if not after_id and paging.get("next_page_url"):
+            params = parse_qs(urlsplit(paging["next_page_url"]).query)
+            after_id = (params.get("after_id") or [None])[0]
+            page = (params.get("page") or [""])[0]
+            if not after_id and not pages and page.isdigit():
+                return {"pages": None, "next": {"page": int(page)}}
+        if not after_id and paging.get("has_more"):
+            items = payload.get("items") if isinstance(payload, dict) else None
+            last = items[-1] if items else None
+            after_id = (last.get("uuid") or (last.get("properties") or {}).get("uuid")) if isinstance(last, dict) else None
+        return {"pages": int(pages) if pages else None, "next": {"after_id": after_id} if after_id else None}
+
+    def _get_page_pool(self) -> ThreadPoolExecutor:
+        with self._page_pool_lock:
+            if self._page_pool is None:
+                self._page_pool = ThreadPoolExecutor(max_workers=max(self.page_concurrency, 1), thread_name_prefix="crunchbase-pages")
+            return self._page_pool
+
+    def _iter_numbered_pages(self, query: str, last_page: int) -> Iterator[Dict[str, Any]]:
+        """Fetch pages 2..last_page concurrently (bounded window) and yield their records in page order."""
+        pool = self._get_page_pool()
+        pages = iter(range(2, last_page + 1))
+        futures = {}
+
+        def submit_next():
+            page = next(pages, None)
+            if page is not None:
+                # Copy the caller's context so page requests are traced under the connector's span
+                futures[page] = pool.submit(contextvars.copy_context().run, self._call_api, query, {"page": page})
+
+        for _ in range(max(self.page_concurrency, 1)):
+            submit_next()
+        try:
+            for page in range(2, last_page + 1):
+                data = futures.pop(page).result()
+                submit_next()
+                yield from self._iter_api_response(data)
+        finally:
+            for future in futures.values():
+                future.cancel()
+
+    def _iter_pages(self, query: str, first: Any) -> Iterator[Dict[str, Any]]:
+        """Yield records from every page after `first`, within the `max_pages` budget."""
+        paging = self._paging(first)
+        budget = max(self.max_pages or 1, 1)
+        if paging["pages"] and paging["pages"] > 1:
+            yield from self._iter_numbered_pages(query, min(paging["pages"], budget))
+            if paging["pages"] > budget:
+                raise IncompleteResult(f"Crunchbase portfolio for {query} has {paging['pages']} pages; "
+                                       f"fetched the first {budget} (max_pages)")
+            return
+        fetched, cursor, seen = 1, paging["next"], set()
+        while cursor is not None and fetched < budget:
+            key = tuple(sorted(cursor.items()))
+            if key in seen:
+                break  # the API repeated a cursor; stop instead of looping
+            seen.add(key)
+            data = self._call_api(query, cursor)
+            fetched += 1
+            yield from self._iter_api_response(data)
+            cursor = self._paging(data)["next"]
+        if cursor is not None and fetched >= budget:
+            raise IncompleteResult(f"Crunchbase page budget ({budget}) reached for {query} with more pages left")
+
     def find_portfolio(self, fund_input: str) -> List[Dict[str, Any]]:
         """Return a list of raw company/investment records for the given fund.
 
         If an API key is configured, attempt to query Crunchbase. Otherwise return a small stub dataset
-        used for development and tests.
+        used for development and tests. A truncated listing raises IncompleteResult carrying the
+        records that were fetched.
         """
+        records = []
+        try:
+            for record in self.iter_portfolio(fund_input):
+                records.append(record)
+        except IncompleteResult as e:
+            e.records = records
+            raise
+        return records
+
+    def iter_portfolio(self, fund_input: str) -> Iterator[Dict[str, Any]]:
+        """Yield raw records one at a time (streaming counterpart of find_portfolio)."""
         # Use API path if possible
         if self.api_key:
+            yielded = False
             try:
                 resp = self._call_api(fund_input)
-                parsed = self._parse_api_response(resp)
-                if parsed:
-                    return parsed
-                # If parsing yields nothing, fall back to stub
-                logger.info("Crunchbase API returned no parsed items; falling back to stub data")
+                for record in self._iter_api_response(resp):
+                    yielded = True
+                    yield record
+                # Later pages (if any) stream in as they arrive
+                for record in self._iter_pages(fund_input, resp):
+                    yielded = True
+                    yield record
+                if not yielded:
+                    # If parsing yields nothing, fall back to stub
+                    logger.info("Crunchbase API returned no parsed items; falling back to stub data")
+            except IncompleteResult:
+                raise
             except Exception as e:
+                if yielded:
+                    # Keep the records already produced (rather than mixing in stub data) and flag the gap
+                    raise IncompleteResult(f"Crunchbase listing for {fund_input} stopped early: {e}") from e
                 logger.warning("Crunchbase API error: %s -- falling back to stub", e)
+            if yielded:
+                return
+
+        yield from self._stub_records()
 
+    def _stub_records(self) -> List[Dict[str, Any]]:
         # Fallback stub data (same as original MVP stub)
         return [
             {
@@ -16,6 +16,10 @@ class LinkedInConnector:
         self.max_retries = max_retries
         self.backoff_seconds = backoff_seconds
 
+    async def afind_portfolio(self, fund_input: str) -> List[Dict[str, Any]]:
+        """Async protocol used by AsyncOrchestrator; the stub does no I/O so it runs inline."""
+        return self.find_portfolio(fund_input)
+
     def find_portfolio(self, fund_input: str) -> List[Dict[str, Any]]:
         """Return a list of raw company records similar to other connectors.
 
@@ -6,81 +6,238 @@ Behavior:
 - Otherwise, fall back to a small stub dataset for development and tests.
 
 The connector returns the same raw record format used by other connectors so the normalizer can process it.
+
+Harvesting (API path):
+- The last `lookback_days` are split into `window_days` date windows (newest first); the
+  first page of every window is fetched concurrently (`page_concurrency` at a time), and each
+  window's further pages (from `totalResults`) are queued as soon as its first page lands.
+  `max_pages` caps the pages fetched per fund.
+- Articles are deduplicated by normalized URL and by a hash of their title + description
+  (syndicated copies of one story count once).
+- Company mentions come from leet_apps.mentions.MentionExtractor: an Aho-Corasick matcher
+  over `known_companies` / `known_companies_path` when given, else capitalized phrases.
+- Mentions are aggregated per company (the fund itself excluded), so each company yields one
+  record with its most recent headline, up to `max_links` article links and `mention_count`.
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from urllib.parse import urlsplit, urlunsplit
+import contextvars
+import hashlib
 import os
+import threading
 import time
 import logging
 
 import requests
 
+from leet_apps.cache import NOT_MODIFIED, conditional_headers, validators_from_response
+from leet_apps.entity_resolution import canonicalize_name
+from leet_apps.instrumentation import span
+from leet_apps.mentions import MentionExtractor, normalize_text
+from leet_apps.resilience import source_available
+
 logger = logging.getLogger(__name__)
 
 
 class NewsConnector:
-    def __init__(self, api_key: str = None, max_retries: int = 1, backoff_seconds: float = 1.0):
+    cache_namespace = "news"
+    # Host whose rate_limits quota the API calls spend (read by leet_apps.scheduler)
+    api_host = "newsapi.org"
+
+    def __init__(self, api_key: str = None, max_retries: int = 1, backoff_seconds: float = 1.0, cache=None, transport=None,
+                 page_size: int = 100, lookback_days: int = 28, window_days: int = 7, max_pages: int = 8,
+                 page_concurrency: int = 4, known_companies: Iterable[str] = None, known_companies_path: str = None,
+                 max_links: int = 20):
         self.api_key = api_key or os.environ.get("NEWSAPI_KEY")
         self.max_retries = max_retries
         self.backoff_seconds = backoff_seconds
+        # Optional leet_apps.cache.ResponseCache shared across connectors
+        self.cache = cache
+        # Optional leet_apps.transport.HttpTransport (pooled keep-alive sessions); injected by the Orchestrator
+        self.transport = transport
+        self.page_size = page_size
+        self.lookback_days = lookback_days
+        self.window_days = window_days
+        # Per-fund page budget, and pages fetched concurrently by this connector (shared across funds)
+        self.max_pages = max_pages
+        self.page_concurrency = page_concurrency
+        self.max_links = max_links
+        if known_companies_path:
+            self.extractor = MentionExtractor.from_file(os.path.expanduser(known_companies_path))
+            if known_companies:
+                self.extractor = MentionExtractor(list(self.extractor.names.values()) + list(known_companies))
+        else:
+            self.extractor = MentionExtractor(known_companies)
+        self._page_pool = None
+        self._page_pool_lock = threading.Lock()
 
-    def _call_api(self, query: str) -> Dict[str, Any]:
+    def _call_api(self, query: str, page: Dict[str, Any] = None) -> Dict[str, Any]:
+        """NewsAPI response for `query`; `page` adds window/page params ({"from", "to", "page"})."""
+        if self.cache is not None:
+            key = {"query": query, **page} if page else query
+            # Expired entries are revalidated with ETag/Last-Modified rather than refetched
+            return self.cache.get_or_fetch(self.cache_namespace, key,
+                                           lambda validators: self._fetch_api(query, validators, page), conditional=True)
+        return self._fetch_api(query, page=page)[0]
+
+    def _fetch_api(self, query: str, validators: Dict[str, str] = None, page: Dict[str, Any] = None) -> Any:
+        """GET NewsAPI results; returns (data, validators) or NOT_MODIFIED on a 304 revalidation."""
         url = "https://newsapi.org/v2/everything"
-        params = {"q": query, "pageSize": 20}
+        params = {"q": query, "pageSize": self.page_size, "sortBy": "publishedAt", **(page or {})}
         headers = {"Authorization": self.api_key} if self.api_key else {}
+        headers.update(conditional_headers(validators))
 
         attempt = 0
         while attempt <= self.max_retries:
             try:
-                resp = requests.get(url, params=params, headers=headers, timeout=10)
+                resp = (self.transport or requests).get(url, params=params, headers=headers, timeout=10)
+                if resp.status_code == 304 and validators:
+                    return NOT_MODIFIED
                 if resp.status_code == 200:
-                    return resp.json()
+                    return resp.json(), validators_from_response(resp)
                 else:
                     logger.warning("News API returned status %s: %s", resp.status_code, resp.text)
             except requests.RequestException as e:
                 logger.warning("News API request failed: %s", e)
 
             attempt += 1
-            time.sleep(self.backoff_seconds * attempt)
+            if not source_available(self.transport, url):
+                # The source's circuit opened: further attempts would be refused, skip the backoff
+                break
+            with span("retry.sleep", source="news", attempt=attempt):
+                time.sleep(self.backoff_seconds * attempt)
 
         raise RuntimeError("News API request failed after retries")
 
-    def _parse_api_response(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        items = []
-        if not data:
-            return items
-        articles = data.get("articles") or []
+    def _windows(self, today: Optional[date] = None) -> List[Dict[str, str]]:
+        """`from`/`to` params for consecutive date windows covering the lookback, newest first."""
+        end = today or date.today()
+        oldest = end - timedelta(days=max(self.lookback_days, 1) - 1)
+        step = max(self.window_days, 1)
+        windows = []
+        while end >= oldest:
+            start = max(end - timedelta(days=step - 1), oldest)
+            windows.append({"from": start.isoformat(), "to": end.isoformat()})
+            end = start - timedelta(days=1)
+        return windows
+
+    def _get_page_pool(self) -> ThreadPoolExecutor:
+        with self._page_pool_lock:
+            if self._page_pool is None:
+                self._page_pool = ThreadPoolExecutor(max_workers=max(self.page_concurrency, 1), thread_name_prefix="news-pages")
+            return self._page_pool
+
+    def _iter_articles(self, query: str, today: Optional[date] = None) -> Iterator[Dict[str, Any]]:
+        """Harvest articles over all date windows, in window then page order, within `max_pages`.
+
+        Failed pages are skipped; if every page fails the last error is raised.
+        """
+        pool = self._get_page_pool()
+        budget = max(self.max_pages or 1, 1)
+
+        def submit(params):
+            # Copy the caller's context so page requests are traced under the connector's span
+            return pool.submit(contextvars.copy_context().run, self._call_api, query, params)
+
+        windows = self._windows(today)[:budget]
+        firsts = [(w, submit({**w, "page": 1})) for w in windows]
+        fetched, succeeded, error = len(firsts), 0, None
+        later: List[Tuple[Dict[str, Any], Any]] = []
+        try:
+            for window, future in firsts:
+                try:
+                    data = future.result() or {}
+                except Exception as e:
+                    logger.warning("News API page %s failed: %s", window, e)
+                    error = e
+                    continue
+                succeeded += 1
+                total = data.get("totalResults") or 0
+                pages = -(-int(total) // self.page_size) if total else 1
+                for page in range(2, pages + 1):
+                    if fetched >= budget:
+                        break
+                    fetched += 1
+                    later.append(({**window, "page": page}, submit({**window, "page": page})))
+                yield from data.get("articles") or []
+            for params, future in later:
+                try:
+                    data = future.result() or {}
+                except Exception as e:
+                    logger.warning("News API page %s failed: %s", params, e)
+                    error = e
+                    continue
+                succeeded += 1
+                yield from data.get("articles") or []
+        finally:
+            for _, future in firsts + later:
+                future.cancel()
+        if not succeeded and error is not None:
+            raise error
+
+    @staticmethod
+    def _article_keys(article: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+        """(normalized URL, content hash) identifying an article for dedup."""
+        url = article.get("url")
+        url_key = None
+        if url:
+            parts = urlsplit(url.strip())
+            # Tracking parameters and fragments do not change the article
+            url_key = urlunsplit((parts.scheme.lower(), parts.netloc.lower().removeprefix("www."),
+                                  parts.path.rstrip("/"), "", ""))
+        text = normalize_text(f"{article.get('title') or ''} {article.get('description') or ''}")
+        content_key = hashlib.sha1(text.encode("utf-8")).hexdigest() if text else None
+        return url_key, content_key
+
+    def _unique_articles(self, articles: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        seen = set()
+        for article in articles:
+            if not isinstance(article, dict):
+                continue
+            keys = [k for k in self._article_keys(article) if k]
+            if any(k in seen for k in keys):
+                continue
+            seen.update(keys)
+            yield article
+
+    def _aggregate(self, articles: Iterable[Dict[str, Any]], fund_input: str = None) -> List[Dict[str, Any]]:
+        """One record per mentioned company (first spelling seen), excluding the fund itself."""
+        exclude = canonicalize_name(fund_input)
+        companies: Dict[str, Dict[str, Any]] = {}
         for art in articles:
-            # Heuristic: try to extract company mentions from title or description
-            title = art.get("title") or ""
-            desc = art.get("description") or ""
-            # Very simple: look for Capitalized Phrases of length >=2 words
-            import re
-
-            text = f"{title} {desc}"
-            matches = re.findall(r"([A-Z][A-Za-z0-9&\-\.]+(?:\s+[A-Z][A-Za-z0-9&\-\.]+)+)", text)
-            for m in set(matches):
-                if 3 <= len(m) <= 100:
-                    items.append(
-                        {
-                            "company_name": m,
-                            "website": None,
-                            "industry": None,
-                            "hq": None,
-                            "founding_date": None,
-                            "description": title.strip() or desc.strip(),
-                            "status": None,
-                            "investment": {},
-                            "source_links": [art.get("url")] if art.get("url") else [],
-                        }
-                    )
-        return items
+            title = (art.get("title") or "").strip()
+            desc = (art.get("description") or "").strip()
+            url = art.get("url")
+            for name in self.extractor.extract(f"{title} {desc}"):
+                key = canonicalize_name(name)
+                if not key or key == exclude:
+                    continue
+                record = companies.get(key)
+                if record is None:
+                    record = companies[key] = {
+                        "company_name": name,
+                        "website": None,
+                        "industry": None,
+                        "hq": None,
+                        "founding_date": None,
+                        "description": title or desc,
+                        "status": None,
+                        "investment": {},
+                        "source_links": [],
+                        "mention_count": 0,
+                    }
+                record["mention_count"] += 1
+                if url and url not in record["source_links"] and len(record["source_links"]) < self.max_links:
+                    record["source_links"].append(url)
+        return list(companies.values())
 
     def find_portfolio(self, fund_input: str) -> List[Dict[str, Any]]:
-        # If API key available, call NewsAPI; otherwise return a stub
+        # If API key available, harvest NewsAPI; otherwise return a stub
         if self.api_key:
             try:
-                resp = self._call_api(fund_input)
-                parsed = self._parse_api_response(resp)
+                parsed = self._aggregate(self._unique_articles(self._iter_articles(fund_input)), fund_input)
                 if parsed:
                     return parsed
                 logger.info("News API parsed no items; falling back to stub")
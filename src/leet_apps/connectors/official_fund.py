@@ -6,16 +6,28 @@ This is intentionally minimal and robust for tests: if given a non-URL fund_inpu
 or can be passed a test HTML string in the `test_html` param (used in unit tests).
 """
 from typing import List, Dict, Any
+import logging
 import re
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+
+from leet_apps.cache import NOT_MODIFIED, conditional_headers, validators_from_response
+
+logger = logging.getLogger(__name__)
 
 
 class OfficialFundConnector:
-    def __init__(self, test_html: str = None):
+    cache_namespace = "official_fund"
+
+    def __init__(self, test_html: str = None, cache=None, transport=None, robots=None):
         self.test_html = test_html
+        # Optional leet_apps.cache.ResponseCache shared across connectors
+        self.cache = cache
+        # Optional leet_apps.transport.HttpTransport (pooled keep-alive sessions); injected by the Orchestrator
+        self.transport = transport
+        # Optional leet_apps.robots.RobotsCache; pages disallowed by robots.txt are skipped
+        self.robots = robots
 
     def _is_url(self, s: str) -> bool:
         try:
@@ -24,6 +36,26 @@ class OfficialFundConnector:
         except Exception:
             return False
 
+    def _fetch_page(self, url: str, validators: Dict[str, str] = None) -> Any:
+        """GET the page; returns (html, validators) or NOT_MODIFIED on a 304 revalidation."""
+        resp = (self.transport or requests).get(url, headers=conditional_headers(validators), timeout=10)
+        if resp.status_code == 304 and validators:
+            return NOT_MODIFIED
+        resp.raise_for_status()
+        return resp.text, validators_from_response(resp)
+
+    def _get_page(self, url: str) -> str:
+        if self.cache is not None:
+            # Page URLs are case-sensitive, so key on the exact URL rather than a lower-cased query
+            return self.cache.get_or_fetch(self.cache_namespace, {"url": url},
+                                           lambda validators: self._fetch_page(url, validators), conditional=True)
+        return self._fetch_page(url)[0]
+
+    def prefetch(self, fund_input: str):
+        """Warm the robots.txt entry for a fund page while the fund waits for a worker."""
+        if self.robots is not None and not self.test_html and self._is_url(fund_input):
+            self.robots.prefetch([fund_input])
+
     def find_portfolio(self, fund_input: str) -> List[Dict[str, Any]]:
         # If fund_input is not a URL, we don't attempt to guess the official page.
         if not self._is_url(fund_input) and not self.test_html:
@@ -31,9 +63,13 @@ class OfficialFundConnector:
 
         html = self.test_html
         if not html:
-            resp = requests.get(fund_input, timeout=10)
-            resp.raise_for_status()
-            html = resp.text
+            if self.robots is not None and not self.robots.allowed(fund_input):
+                logger.info("robots.txt disallows fetching %s; skipping", fund_input)
+                return []
+            html = self._get_page(fund_input)
+
+        # bs4 is only needed once there is a page to parse
+        from bs4 import BeautifulSoup
 
         soup = BeautifulSoup(html, "html.parser")
         text = soup.get_text(separator=" \n ")
@@ -0,0 +1,87 @@
+"""
+Connector registry: connectors are named and imported only when a run enables them.
+
+Built-in connectors are listed here as "module:Class" paths; third-party packages can add
+more through the `fund_tracker.connectors` entry point group, e.g. in their pyproject.toml:
+
+    [project.entry-points."fund_tracker.connectors"]
+    mysource = "mysource.connector:MySourceConnector"
+
+The connectors for a run come from `--connectors` or `connectors.enabled` in config.yaml.
+Run-wide objects (`cache`, `robots`) are passed to the connectors whose constructors accept
+them, along with per-connector settings from `connectors.options.<name>`. Nothing here imports a connector module (or requests / bs4) until `load` is called.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+import importlib
+import inspect
+
+ENTRY_POINT_GROUP = "fund_tracker.connectors"
+
+BUILTIN_CONNECTORS = {
+    "crunchbase": "leet_apps.connectors.crunchbase:CrunchbaseConnector",
+    "news": "leet_apps.connectors.news:NewsConnector",
+    "official_fund": "leet_apps.connectors.official_fund:OfficialFundConnector",
+    "linkedin": "leet_apps.connectors.linkedin:LinkedInConnector",
+    "pitchbook": "leet_apps.connectors.pitchbook:PitchBookConnector",
+}
+
+DEFAULT_CONNECTORS = ("crunchbase", "news", "official_fund")
+
+
+class UnknownConnector(ValueError):
+    pass
+
+
+def _entry_points() -> Dict[str, str]:
+    from importlib.metadata import entry_points
+
+    return {ep.name: ep.value for ep in entry_points(group=ENTRY_POINT_GROUP)}
+
+
+def available() -> Dict[str, str]:
+    """All connector names mapped to their "module:Class" path (plugins may not shadow built-ins)."""
+    return {**_entry_points(), **BUILTIN_CONNECTORS}
+
+
+def _target(name: str) -> str:
+    target = BUILTIN_CONNECTORS.get(name) or _entry_points().get(name)
+    if target is None:
+        raise UnknownConnector(f"unknown connector {name!r} (available: {', '.join(sorted(available()))})")
+    return target
+
+
+def load(name: str) -> type:
+    """Import and return the connector class registered under `name`."""
+    module_name, _, attr = _target(name).partition(":")
+    obj = importlib.import_module(module_name)
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def parse_names(value: str) -> List[str]:
+    """Split a comma-separated connector list ("crunchbase, news") and check every name exists."""
+    names = [n.strip() for n in value.split(",") if n.strip()]
+    for name in names:
+        _target(name)
+    return names
+
+
+def enabled_names(config: Dict[str, Any], names: Optional[Sequence[str]] = None) -> List[str]:
+    if names:
+        return list(names)
+    return list(((config or {}).get("connectors", {}) or {}).get("enabled") or DEFAULT_CONNECTORS)
+
+
+def build_connectors(config: Dict[str, Any], names: Optional[Sequence[str]] = None, **shared: Any) -> List[Any]:
+    """Instantiate the enabled connectors, passing each its `connectors.options.<name>` settings
+    and the `shared` objects (cache, robots), limited to what its constructor accepts."""
+    shared = {k: v for k, v in shared.items() if v is not None}
+    per_connector = (((config or {}).get("connectors", {}) or {}).get("options") or {})
+    connectors = []
+    for name in enabled_names(config, names):
+        cls = load(name)
+        params = inspect.signature(cls).parameters
+        options = {**(per_connector.get(name) or {}), **shared}
+        connectors.append(cls(**{k: v for k, v in options.items() if k in params}))
+    return connectors
@@ -0,0 +1,337 @@
+"""
+Entity resolution for raw connector records (Phase 3: entity resolution, fuzzy matching).
+
+Records describing the same company are clustered in three near-linear passes:
+1. Exact blocking on the canonical name (lower-cased, punctuation and legal suffixes such
+   as "Inc.", "LLC", "GmbH" removed), so "Acme Robotics, Inc." == "Acme Robotics".
+2. Exact blocking on the website's registered domain (www. stripped), skipping shared
+   platform domains like linkedin.com.
+3. Fuzzy matching between the remaining clusters using a MinHash/LSH index over
+   character 3-grams of the canonical name; only candidates sharing an LSH band are
+   compared, and they merge when their 3-gram Jaccard similarity reaches the threshold
+   and their numeric tokens agree ("Fund II" never merges with "Fund III").
+
+Clusters are merged with `merge_records`, which unions source links, overlays investment
+fields and fills missing company fields from later records.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import random
+import re
+import unicodedata
+import zlib
+from functools import lru_cache
+from urllib.parse import urlparse
+
+LEGAL_SUFFIXES = {
+    "inc", "incorporated", "llc", "llp", "lp", "ltd", "limited", "corp", "corporation", "co", "company",
+    "plc", "gmbh", "ag", "sa", "sas", "sarl", "srl", "spa", "bv", "nv", "oy", "ab", "as", "pte", "pty",
+    "kk", "kg", "lda", "sl",
+}
+
+# Domains shared by many unrelated companies; never used as a blocking key
+SHARED_DOMAINS = {
+    "crunchbase.com", "linkedin.com", "facebook.com", "twitter.com", "x.com", "medium.com", "github.com",
+    "angel.co", "wellfound.com", "google.com", "sites.google.com", "wixsite.com", "notion.site",
+}
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+_ROMAN_RE = re.compile(r"[ivxlc]+")
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def canonicalize_name(name: Optional[str]) -> str:
+    """Canonical form of a company name used for matching."""
+    if not name:
+        return ""
+    return _canonicalize(str(name))
+
+
+@lru_cache(maxsize=65536)
+def _canonicalize(name: str) -> str:
+    s = unicodedata.normalize("NFKD", name)
+    s = "".join(ch for ch in s if not unicodedata.combining(ch)).lower()
+    s = s.replace("&", " and ")
+    s = _PUNCT_RE.sub(" ", s)
+    tokens = _SPACE_RE.sub(" ", s).strip().split(" ")
+    # Strip trailing legal suffixes ("acme robotics co ltd" -> "acme robotics"), keeping at least one token
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    return " ".join(t for t in tokens if t)
+
+
+def domain_key(website: Optional[str]) -> Optional[str]:
+    """Normalized host of a website URL (no scheme, port or leading www.), or None."""
+    if not website or not isinstance(website, str):
+        return None
+    w = website.strip().lower()
+    host = urlparse(w if "://" in w else "http://" + w).hostname or ""
+    if host.startswith("www."):
+        host = host[4:]
+    if not host or "." not in host or host in SHARED_DOMAINS:
+        return None
+    return host
+
+
+def _number_tokens(canon: str) -> tuple:
+    """Numeric and roman-numeral tokens of a canonical name ("fund iii 2" -> ("iii", "2"))."""
+    return tuple(t for t in canon.split(" ") if t.isdigit() or _ROMAN_RE.fullmatch(t))
+
+
+def shingles(text: str, k: int = 3) -> Set[str]:
+    """Character k-grams of a padded string."""
+    padded = f" {text} "
+    if len(padded) <= k:
+        return {padded}
+    return {padded[i:i + k] for i in range(len(padded) - k + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+class MinHashIndex:
+    """Locality-sensitive index over MinHash signatures of shingle sets."""
+
+    def __init__(self, num_perm: int = 40, bands: int = 10, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)]
+        self._buckets: List[Dict[tuple, List[Any]]] = [{} for _ in range(bands)]
+        # Shingle vocabularies are small and highly repetitive, so permuted hashes are memoized per shingle
+        self._shingle_hashes: Dict[str, tuple] = {}
+
+    def _hashes(self, shingle: str) -> tuple:
+        hv = self._shingle_hashes.get(shingle)
+        if hv is None:
+            h = zlib.crc32(shingle.encode("utf-8"))
+            hv = self._shingle_hashes[shingle] = tuple((a * h + b) % _MERSENNE_PRIME for a, b in self._perms)
+        return hv
+
+    def signature(self, items: Iterable[str]) -> List[int]:
+        rows = [self._hashes(s) for s in items]
+        if not rows:
+            return [0] * self.num_perm
+        return list(map(min, zip(*rows)))
+
+    def _band_keys(self, sig: List[int]):
+        r = self.rows
+        for band in range(self.bands):
+            yield band, tuple(sig[band * r:(band + 1) * r])
+
+    def query(self, sig: List[int]) -> Set[Any]:
+        found = set()
+        for band, key in self._band_keys(sig):
+            found.update(self._buckets[band].get(key, ()))
+        return found
+
+    def add(self, key: Any, sig: List[int]):
+        for band, bkey in self._band_keys(sig):
+            self._buckets[band].setdefault(bkey, []).append(key)
+
+
+class _UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def add(self) -> int:
+        self.parent.append(len(self.parent))
+        return len(self.parent) - 1
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            # Keep the lowest index as root so clusters are ordered by first appearance
+            if rb < ra:
+                ra, rb = rb, ra
+            self.parent[rb] = ra
+
+
+def _common_tokens(names: Iterable[str], ratio: float, min_names: int = 1000) -> Set[str]:
+    """Tokens appearing in more than `ratio` of names (only for corpora of at least `min_names`)."""
+    names = list(names)
+    if len(names) < min_names:
+        return set()
+    df: Dict[str, int] = {}
+    for canon in names:
+        for t in set(canon.split(" ")):
+            df[t] = df.get(t, 0) + 1
+    limit = ratio * len(names)
+    return {t for t, c in df.items() if c > limit}
+
+
+def _plausible(size: int, digits: tuple, other_grams: Set[str], other_digits: tuple, threshold: float) -> bool:
+    # Cheap rejections before computing Jaccard: it can't exceed the smaller/larger set-size
+    # ratio, and names differing only in numbers ("Fund II" vs "Fund III") never merge
+    other_size = len(other_grams)
+    return min(size, other_size) >= threshold * max(size, other_size) and digits == other_digits
+
+
+def resolve_entities(records: List[Dict[str, Any]], fuzzy_threshold: Optional[float] = 0.75, num_perm: int = 40,
+                     bands: int = 10, common_token_ratio: float = 0.005) -> List[List[int]]:
+    """Cluster records that describe the same company.
+
+    Returns clusters of record indices, ordered by each cluster's first record. Pass
+    `fuzzy_threshold=None` to disable fuzzy matching and use only exact blocking keys.
+    In large corpora, tokens found in more than `common_token_ratio` of names are left
+    out of the LSH key (but not out of the similarity check).
+    """
+    n = len(records)
+    uf = _UnionFind(n)
+    by_name: Dict[str, int] = {}
+    by_domain: Dict[str, int] = {}
+
+    for i, rec in enumerate(records):
+        canon = canonicalize_name(rec.get("company_name"))
+        if canon:
+            if canon in by_name:
+                uf.union(by_name[canon], i)
+            else:
+                by_name[canon] = i
+        dom = domain_key(rec.get("website"))
+        if dom:
+            if dom in by_domain:
+                uf.union(by_domain[dom], i)
+            else:
+                by_domain[dom] = i
+
+    if fuzzy_threshold is not None and len(by_name) > 1:
+        common = _common_tokens(by_name, common_token_ratio)
+        # One signature per distinct canonical name, not per record
+        index = MinHashIndex(num_perm=num_perm, bands=bands)
+        grams: Dict[str, Set[str]] = {}
+        digits: Dict[str, tuple] = {}
+        for canon, i in by_name.items():
+            g = grams[canon] = shingles(canon)
+            d = digits[canon] = _number_tokens(canon)
+            size = len(g)
+            # Index on the distinctive part of the name so that ubiquitous words ("labs",
+            # "capital") don't put every company in the same LSH buckets; verify on the full name
+            distinctive = " ".join(t for t in canon.split(" ") if t not in common) or canon
+            sig = index.signature(shingles(distinctive) if distinctive != canon else g)
+            for other in index.query(sig):
+                og = grams[other]
+                if not _plausible(size, d, og, digits[other], fuzzy_threshold):
+                    continue
+                j = by_name[other]
+                if uf.find(j) != uf.find(i) and jaccard(g, og) >= fuzzy_threshold:
+                    uf.union(j, i)
+            index.add(canon, sig)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(n):
+        clusters.setdefault(uf.find(i), []).append(i)
+    return [clusters[root] for root in sorted(clusters)]
+
+
+class EntityIndex:
+    """Online counterpart of `resolve_entities` for records that arrive one at a time.
+
+    `add` returns the entity the record joined, with its merged record, plus any entities
+    the record bridged and that were absorbed into it (e.g. its name matched one entity
+    and its domain another). Entity ids are the index of each entity's first record.
+    Ubiquitous-token pruning needs the whole corpus, so it is not applied here.
+    """
+
+    def __init__(self, fuzzy_threshold: Optional[float] = 0.75, num_perm: int = 40, bands: int = 10):
+        self.fuzzy_threshold = fuzzy_threshold
+        self._uf = _UnionFind(0)
+        self._merged: Dict[int, Dict[str, Any]] = {}
+        self._by_name: Dict[str, int] = {}
+        self._by_domain: Dict[str, int] = {}
+        self._index = MinHashIndex(num_perm=num_perm, bands=bands)
+        self._grams: Dict[str, Set[str]] = {}
+        self._digits: Dict[str, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._merged)
+
+    def _match_name(self, canon: str, i: int) -> Set[int]:
+        if canon in self._by_name:
+            return {self._by_name[canon]}
+        self._by_name[canon] = i
+        found = set()
+        if self.fuzzy_threshold is None:
+            return found
+        g = self._grams[canon] = shingles(canon)
+        d = self._digits[canon] = _number_tokens(canon)
+        sig = self._index.signature(g)
+        for other in self._index.query(sig):
+            og = self._grams[other]
+            if _plausible(len(g), d, og, self._digits[other], self.fuzzy_threshold) and jaccard(g, og) >= self.fuzzy_threshold:
+                found.add(self._by_name[other])
+        self._index.add(canon, sig)
+        return found
+
+    def add(self, record: Dict[str, Any]) -> Tuple[int, Dict[str, Any], List[Tuple[int, Dict[str, Any]]]]:
+        """Add a record; returns (entity_id, merged_record, [(absorbed_id, absorbed_record), ...])."""
+        i = self._uf.add()
+        linked = set()
+        canon = canonicalize_name(record.get("company_name"))
+        if canon:
+            linked |= self._match_name(canon, i)
+        dom = domain_key(record.get("website"))
+        if dom:
+            if dom in self._by_domain:
+                linked.add(self._by_domain[dom])
+            else:
+                self._by_domain[dom] = i
+
+        roots = sorted({self._uf.find(j) for j in linked})
+        if not roots:
+            self._merged[i] = record
+            return i, record, []
+        root = roots[0]
+        absorbed = [(r, self._merged.pop(r)) for r in roots[1:]]
+        merged = merge_records([self._merged[root]] + [rec for _, rec in absorbed] + [record])
+        for r in roots[1:] + [i]:
+            self._uf.union(root, r)
+        self._merged[root] = merged
+        return root, merged, absorbed
+
+    def entities(self) -> List[Dict[str, Any]]:
+        """Merged records in order of each entity's first record."""
+        return [self._merged[k] for k in sorted(self._merged)]
+
+
+def _union_links(*link_lists) -> List[str]:
+    out, seen = [], set()
+    for links in link_lists:
+        for l in links or []:
+            if l and l not in seen:
+                seen.add(l)
+                out.append(l)
+    return out
+
+
+def merge_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge raw records of one entity; the first record's values win for company fields."""
+    merged = records[0].copy()
+    for rec in records[1:]:
+        for k, v in rec.items():
+            if k in ("source_links", "investment"):
+                continue
+            if merged.get(k) in (None, "", []) and v not in (None, "", []):
+                merged[k] = v
+        merged["source_links"] = _union_links(merged.get("source_links"), rec.get("source_links"))
+        existing_inv = merged.get("investment") or {}
+        rec_inv = rec.get("investment") or {}
+        if rec_inv:
+            merged_inv = {**existing_inv, **rec_inv}
+            merged_inv["source_links"] = _union_links(existing_inv.get("source_links"), rec_inv.get("source_links"))
+            merged["investment"] = merged_inv
+    return merged
@@ -1,9 +1,104 @@
 """
 Exporter module: supports JSON (existing) and CSV export for MVP.
+
+All exporters accept either the dict form of a normalized result or a
+leet_apps.columnar.ColumnarResult, which is read column by column without building
+per-row dicts. JSON output is written incrementally (JsonDocumentWriter) with the summary
+accumulated in the same pass, and uses orjson when it is installed. The *_stream exporters
+write Orchestrator.stream events (JSON Lines or CSV change logs) as they arrive.
+export_parquet / export_arrow write typed, dictionary-encoded tables and need the optional
+pyarrow dependency, which is imported only when they are called.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+from datetime import date
 import csv
+import itertools
 import json
+import shutil
+import tempfile
+import urllib.parse
+
+from leet_apps.columnar import ColumnarResult
+from leet_apps.instrumentation import traced
+
+COMPANY_CSV_FIELDS = ["id", "name", "website", "industry", "hq", "founding_date", "description", "status"]
+INVESTMENT_CSV_FIELDS = ["fund_id", "company_id", "round_type", "date", "amount", "co_investors", "confidence"]
+_CO_INVESTORS_IDX = INVESTMENT_CSV_FIELDS.index("co_investors")
+
+
+try:  # Optional faster JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def json_dumps(obj: Any, indent: bool = False, backend: str = "auto") -> str:
+    """Encode obj as JSON text with the stdlib encoder or orjson.
+
+    backend: "stdlib", "orjson", or "auto" (orjson when installed). With indent=True the
+    layout matches json.dumps(indent=2); orjson writes non-ASCII characters as UTF-8
+    instead of \\u escapes.
+    """
+    if backend == "orjson" or (backend == "auto" and orjson is not None):
+        if orjson is None:
+            raise ImportError("orjson is not installed; install it or use backend='stdlib'")
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2) if indent else json.dumps(obj)
+
+
+class SummaryAccumulator:
+    """Builds the generate_summary report incrementally, one company/investment at a time."""
+
+    def __init__(self, fund_id: Any = None):
+        self.fund_id = fund_id
+        self.total_companies = 0
+        self.total_investments = 0
+        self.industry_counts: Dict[Any, int] = {}
+        self.status_counts: Dict[Any, int] = {}
+        self.source_links = set()
+
+    def add_company(self, company: Dict[str, Any]):
+        self.total_companies += 1
+        ind = company.get("industry") or "unknown"
+        self.industry_counts[ind] = self.industry_counts.get(ind, 0) + 1
+        st = company.get("status") or "unknown"
+        self.status_counts[st] = self.status_counts.get(st, 0) + 1
+        self.source_links.update(company.get("source_links", []) or [])
+
+    def add_investment(self, investment: Dict[str, Any]):
+        self.total_investments += 1
+        self.source_links.update(investment.get("source_links", []) or [])
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "fund_id": self.fund_id,
+            "total_companies": self.total_companies,
+            "total_investments": self.total_investments,
+            "unique_source_links": len(self.source_links),
+            "industry_counts": self.industry_counts,
+            "status_counts": self.status_counts,
+        }
+
+
+def _category_counts(column) -> Dict[str, int]:
+    counts = {}
+    for value, n in column.counts().items():
+        key = value or "unknown"
+        counts[key] = counts.get(key, 0) + n
+    return counts
+
+
+def _columnar_summary(data: ColumnarResult) -> Dict[str, Any]:
+    source_links = data.companies.column("source_links").distinct() | data.investments.column("source_links").distinct()
+    return {
+        "fund_id": data.fund.get("id"),
+        "total_companies": len(data.companies),
+        "total_investments": len(data.investments),
+        "unique_source_links": len(source_links),
+        "industry_counts": _category_counts(data.companies.column("industry")),
+        "status_counts": _category_counts(data.companies.column("status")),
+    }
 
 
 def generate_summary(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -11,58 +106,147 @@ def generate_summary(data: Dict[str, Any]) -> Dict[str, Any]:
 
     Summary includes counts and basic aggregates useful for analysts.
     """
-    fund = data.get("fund", {})
-    companies = data.get("companies", []) or []
-    investments = data.get("investments", []) or []
-
-    total_companies = len(companies)
-    total_investments = len(investments)
-
-    # Compute industry distribution
-    industry_counts = {}
-    for c in companies:
-        ind = c.get("industry") or "unknown"
-        industry_counts[ind] = industry_counts.get(ind, 0) + 1
-
-    # Status distribution
-    status_counts = {}
-    for c in companies:
-        st = c.get("status") or "unknown"
-        status_counts[st] = status_counts.get(st, 0) + 1
-
-    # Source links count (unique)
-    source_links = set()
-    for c in companies:
-        for s in c.get("source_links", []) or []:
-            source_links.add(s)
-    for inv in investments:
-        for s in inv.get("source_links", []) or []:
-            source_links.add(s)
-
-    summary = {
-        "fund_id": fund.get("id"),
-        "total_companies": total_companies,
-        "total_investments": total_investments,
-        "unique_source_links": len(source_links),
-        "industry_counts": industry_counts,
-        "status_counts": status_counts,
-    }
-    return summary
+    if isinstance(data, ColumnarResult):
+        return _columnar_summary(data)
 
+    acc = SummaryAccumulator((data.get("fund", {}) or {}).get("id"))
+    for c in data.get("companies", []) or []:
+        acc.add_company(c)
+    for inv in data.get("investments", []) or []:
+        acc.add_investment(inv)
+    return acc.summary()
+
+
+class JsonDocumentWriter:
+    """Write a normalized result document incrementally, without holding it in memory.
+
+    The output has the same layout as json.dump(data, indent=2) of
+    {"fund", "companies", "investments", <extra keys>, "summary"}. Companies go straight to
+    the file; investments are spooled to a temporary file (in memory up to `spool_bytes`)
+    because they come after the companies array. The summary is accumulated in the same
+    pass and omitted, as before, if it cannot be computed (e.g. unhashable industry values).
+
+        with JsonDocumentWriter(f, {"id": fund}) as writer:
+            for company, investment in rows:
+                writer.add(company, investment)
+    """
+
+    def __init__(self, f: TextIO, fund: Dict[str, Any], extra: Dict[str, Any] = None, summary: bool = True,
+                 backend: str = "auto", spool_bytes: int = 8 * 1024 * 1024):
+        self._f = f
+        self._extra = dict(extra or {})
+        self._backend = backend
+        self._summary = SummaryAccumulator((fund or {}).get("id")) if summary else None
+        self._spool = tempfile.SpooledTemporaryFile(max_size=spool_bytes, mode="w+", encoding="utf-8")
+        self._companies = 0
+        self._investments = 0
+        self._closed = False
+        f.write("{\n  \"fund\": " + self._dumps(fund or {}, 1) + ",\n  \"companies\": [")
+
+    def _dumps(self, obj: Any, level: int) -> str:
+        return json_dumps(obj, indent=True, backend=self._backend).replace("\n", "\n" + "  " * level)
+
+    def _accumulate(self, method: str, record: Dict[str, Any]):
+        if self._summary is not None:
+            try:
+                getattr(self._summary, method)(record)
+            except Exception:
+                # Same fallback as export_json: drop the summary rather than fail the export
+                self._summary = None
+
+    def add_company(self, company: Dict[str, Any]):
+        self._f.write(("," if self._companies else "") + "\n    " + self._dumps(company, 2))
+        self._companies += 1
+        self._accumulate("add_company", company)
+
+    def add_investment(self, investment: Dict[str, Any]):
+        self._spool.write(("," if self._investments else "") + "\n    " + self._dumps(investment, 2))
+        self._investments += 1
+        self._accumulate("add_investment", investment)
+
+    def add(self, company: Dict[str, Any], investment: Dict[str, Any]):
+        self.add_company(company)
+        self.add_investment(investment)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        f = self._f
+        f.write("\n  ]," if self._companies else "],")
+        f.write("\n  \"investments\": [")
+        self._spool.seek(0)
+        shutil.copyfileobj(self._spool, f)
+        self._spool.close()
+        f.write("\n  ]" if self._investments else "]")
+        tail = dict(self._extra)
+        if self._summary is not None:
+            tail["summary"] = self._summary.summary()
+        for key, value in tail.items():
+            f.write(",\n  " + json.dumps(key) + ": " + self._dumps(value, 1))
+        f.write("\n}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._spool.close()
+
+
+def _iter_pairs(data: Dict[str, Any]) -> Iterator[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+    return itertools.zip_longest(data.get("companies", []) or [], data.get("investments", []) or [])
+
+
+@traced("export.json")
+def export_json(data: Dict[str, Any], path: str, backend: str = "auto"):
+    # Streams companies and investments to the file and appends a generated summary;
+    # ColumnarResult rows are materialized one at a time
+    extra = {k: v for k, v in data.items() if k not in ("fund", "companies", "investments")}
+    with open(path, "w", encoding="utf-8") as f, JsonDocumentWriter(f, data.get("fund", {}), extra=extra, backend=backend) as writer:
+        for company, investment in _iter_pairs(data):
+            if company is not None:
+                writer.add_company(company)
+            if investment is not None:
+                writer.add_investment(investment)
 
-def export_json(data: Dict[str, Any], path: str):
-    # Include a generated summary when exporting JSON
-    data_with_summary = dict(data)
-    try:
-        data_with_summary["summary"] = generate_summary(data)
-    except Exception:
-        # If summary generation fails, fall back to original data
-        data_with_summary = data
 
+@traced("export.jsonl")
+def export_jsonl(data: Dict[str, Any], path: str, backend: str = "auto"):
+    """Write a normalized result as JSON Lines.
+
+    Line 1 is {"fund": ...}; then one {"company": ..., "investment": ...} line per portfolio
+    entry; the last line is {"summary": ...}, accumulated while writing.
+    """
+    acc = SummaryAccumulator((data.get("fund", {}) or {}).get("id"))
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(data_with_summary, f, indent=2)
+        f.write(json_dumps({"fund": data.get("fund", {})}, backend=backend) + "\n")
+        for company, investment in _iter_pairs(data):
+            if company is not None:
+                acc.add_company(company)
+            if investment is not None:
+                acc.add_investment(investment)
+            f.write(json_dumps({"company": company, "investment": investment}, backend=backend) + "\n")
+        f.write(json_dumps({"summary": acc.summary()}, backend=backend) + "\n")
+
+
+def _csv_rows(records, fieldnames: List[str]) -> Iterator[List[Any]]:
+    if hasattr(records, "iter_rows"):
+        return records.iter_rows(fieldnames)
+    return ([r.get(k, "") for k in fieldnames] for r in records)
+
+
+def _join_co_investors(row):
+    # co_investors may be a list; join into string
+    if isinstance(row[_CO_INVESTORS_IDX], list):
+        row = list(row)
+        row[_CO_INVESTORS_IDX] = ";".join(row[_CO_INVESTORS_IDX])
+    return row
 
 
+@traced("export.csv")
 def export_csv(data: Dict[str, Any], path: str):
     # Exports companies and investments into two CSV files: <path>_companies.csv and <path>_investments.csv
     companies = data.get("companies", [])
@@ -73,18 +257,191 @@ def export_csv(data: Dict[str, Any], path: str):
 
     if companies:
         with open(companies_path, "w", newline="", encoding="utf-8") as cf:
-            writer = csv.DictWriter(cf, fieldnames=["id", "name", "website", "industry", "hq", "founding_date", "description", "status"])
-            writer.writeheader()
-            for c in companies:
-                writer.writerow({k: c.get(k, "") for k in writer.fieldnames})
+            writer = csv.writer(cf)
+            writer.writerow(COMPANY_CSV_FIELDS)
+            writer.writerows(_csv_rows(companies, COMPANY_CSV_FIELDS))
 
     if investments:
         with open(investments_path, "w", newline="", encoding="utf-8") as inf:
-            writer = csv.DictWriter(inf, fieldnames=["fund_id", "company_id", "round_type", "date", "amount", "co_investors", "confidence"])
-            writer.writeheader()
-            for inv in investments:
-                row = {k: inv.get(k, "") for k in writer.fieldnames}
-                # co_investors may be a list; join into string
-                if isinstance(row.get("co_investors"), list):
-                    row["co_investors"] = ";".join(row["co_investors"])
-                writer.writerow(row)
+            writer = csv.writer(inf)
+            writer.writerow(INVESTMENT_CSV_FIELDS)
+            for row in _csv_rows(investments, INVESTMENT_CSV_FIELDS):
+                writer.writerow(_join_co_investors(row))
+
+
+def export_changes(changes: Dict[str, Any], path: str):
+    # Incremental refresh diff: added/updated entries carry full records, removed entries are company ids
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(changes, f, indent=2)
+
+
+def write_jsonl(events: Iterable[Dict[str, Any]], f: TextIO) -> int:
+    """Write streaming events (see Orchestrator.stream) as JSON Lines, flushing each line.
+
+    Returns the number of events written.
+    """
+    n = 0
+    for event in events:
+        f.write(json_dumps(event) + "\n")
+        f.flush()
+        n += 1
+    return n
+
+
+@traced("export.jsonl_stream")
+def export_jsonl_stream(events: Iterable[Dict[str, Any]], path: str) -> int:
+    with open(path, "w", encoding="utf-8") as f:
+        return write_jsonl(events, f)
+
+
+@traced("export.csv_stream")
+def export_csv_stream(events: Iterable[Dict[str, Any]], path: str) -> int:
+    # Change-log variant of export_csv: each upsert appends a row to <path>_companies.csv and
+    # <path>_investments.csv with a leading "op" column; the last row per company id wins
+    n = 0
+    with open(f"{path}_companies.csv", "w", newline="", encoding="utf-8") as cf, \
+            open(f"{path}_investments.csv", "w", newline="", encoding="utf-8") as inf:
+        companies, investments = csv.writer(cf), csv.writer(inf)
+        companies.writerow(["op"] + COMPANY_CSV_FIELDS)
+        investments.writerow(["op"] + INVESTMENT_CSV_FIELDS)
+        company_id_idx = INVESTMENT_CSV_FIELDS.index("company_id")
+        for event in events:
+            op = event.get("op")
+            if op == "upsert":
+                companies.writerow([op] + next(_csv_rows([event["company"]], COMPANY_CSV_FIELDS)))
+                row = next(_csv_rows([event["investment"]], INVESTMENT_CSV_FIELDS))
+                investments.writerow([op] + _join_co_investors(row))
+            elif op == "remove":
+                companies.writerow([op, event["company_id"]] + [""] * (len(COMPANY_CSV_FIELDS) - 1))
+                row = [""] * len(INVESTMENT_CSV_FIELDS)
+                row[0], row[company_id_idx] = event.get("fund_id", ""), event["company_id"]
+                investments.writerow([op] + row)
+            else:
+                continue
+            cf.flush()
+            inf.flush()
+            n += 1
+    return n
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet/Arrow export requires pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+def _column_values(records, field: str) -> List[Any]:
+    if hasattr(records, "iter_rows"):
+        return [row[0] for row in records.iter_rows([field])]
+    return [r.get(field) for r in records]
+
+
+def _as_text(value: Any) -> Optional[str]:
+    # Connectors occasionally return lists or numbers for text fields (e.g. Crunchbase category_list)
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return str(value)
+
+
+def _as_date(value: Any):
+    # Normalized dates are YYYY-MM-DD when parseable; anything else becomes null
+    if isinstance(value, str) and len(value) == 10:
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _as_text_list(value: Any) -> List[str]:
+    return [_as_text(v) for v in value or [] if v is not None]
+
+
+# (field, kind) in column order; kinds map to Arrow types in _arrow_table
+_COMPANY_ARROW_FIELDS = [
+    ("id", "text"), ("name", "text"), ("website", "text"), ("industry", "category"), ("hq", "category"),
+    ("founding_date", "date"), ("description", "text"), ("status", "category"), ("source_links", "text_list"),
+]
+_INVESTMENT_ARROW_FIELDS = [
+    ("fund_id", "category"), ("company_id", "text"), ("round_type", "category"), ("date", "date"), ("amount", "text"),
+    ("amount_value", "float"), ("amount_currency", "category"), ("co_investors", "text_list"),
+    ("investor_role", "category"), ("source_links", "text_list"), ("confidence", "float"),
+]
+
+
+def _arrow_table(records, fields, fund_id: Any = None):
+    pa = _require_pyarrow()
+    arrays, names = [], []
+    if fund_id is not None and fields[0][0] != "fund_id":
+        # Partition key for company tables, which do not carry the fund themselves
+        arrays.append(pa.array([_as_text(fund_id)] * len(records), type=pa.string()))
+        names.append("fund_id")
+    for name, kind in fields:
+        values = _column_values(records, name)
+        if kind == "float":
+            arrays.append(pa.array([None if v is None else float(v) for v in values], type=pa.float64()))
+        elif kind == "date":
+            arrays.append(pa.array([_as_date(v) for v in values], type=pa.date32()))
+        elif kind == "text_list":
+            arrays.append(pa.array([_as_text_list(v) for v in values], type=pa.list_(pa.string())))
+        else:
+            arr = pa.array([_as_text(v) for v in values], type=pa.string())
+            arrays.append(arr.dictionary_encode() if kind == "category" else arr)
+        names.append(name)
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def _export_arrow_tables(data: Dict[str, Any], path: str, fmt: str, partition_by_fund: bool):
+    pa = _require_pyarrow()
+    fund_id = (data.get("fund", {}) or {}).get("id")
+    tables = {
+        "companies": _arrow_table(data.get("companies", []) or [], _COMPANY_ARROW_FIELDS, fund_id if partition_by_fund else None),
+        "investments": _arrow_table(data.get("investments", []) or [], _INVESTMENT_ARROW_FIELDS),
+    }
+    ext = "parquet" if fmt == "parquet" else "arrow"
+    for name, table in tables.items():
+        if partition_by_fund:
+            # Hive-style <path>/<table>/fund_id=<fund>/ directories; re-exporting a fund replaces its partition.
+            if table.num_rows == 0:
+                # delete_matching only replaces partitions that receive rows, so a fund whose table is
+                # now empty would keep its old files; drop the partition (key URI-encoded as pyarrow writes it)
+                shutil.rmtree(f"{path}/{name}/fund_id={urllib.parse.quote(_as_text(fund_id), safe='')}", ignore_errors=True)
+                continue
+            # The partition key is written as plain strings (dictionary keys need explicit dictionaries).
+            idx = table.schema.get_field_index("fund_id")
+            table = table.set_column(idx, "fund_id", table.column(idx).cast(pa.string()))
+            pa.dataset.write_dataset(
+                table, f"{path}/{name}", format="parquet" if fmt == "parquet" else "ipc",
+                partitioning=["fund_id"], partitioning_flavor="hive",
+                basename_template=f"part-{{i}}.{ext}", existing_data_behavior="delete_matching",
+            )
+        elif fmt == "parquet":
+            pa.parquet.write_table(table, f"{path}_{name}.{ext}")
+        else:
+            with pa.OSFile(f"{path}_{name}.{ext}", "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+
+@traced("export.parquet")
+def export_parquet(data: Dict[str, Any], path: str, partition_by_fund: bool = False):
+    """Write companies and investments as typed Parquet tables (requires pyarrow).
+
+    Produces <path>_companies.parquet and <path>_investments.parquet with float
+    `amount_value`, date32 dates, list<string> `co_investors` / `source_links` and
+    dictionary-encoded categorical columns. With `partition_by_fund=True`, `path` is a
+    dataset root and each fund goes to <path>/<table>/fund_id=<fund>/.
+    """
+    _export_arrow_tables(data, path, "parquet", partition_by_fund)
+
+
+@traced("export.arrow")
+def export_arrow(data: Dict[str, Any], path: str, partition_by_fund: bool = False):
+    """Same tables as export_parquet, written as Arrow IPC files (<path>_companies.arrow, ...)."""
+    _export_arrow_tables(data, path, "arrow", partition_by_fund)
@@ -0,0 +1,153 @@
+"""
+Incremental fund refresh using change detection.
+
+IncrementalOrchestrator stores the last normalized snapshot per fund (SnapshotStore) and,
+on the next run:
+- hashes each connector's raw payload; if every source is unchanged, the previous
+  snapshot is returned without re-normalizing anything
+- otherwise re-normalizes only the deduplicated records whose content hash changed,
+  reusing the stored normalized company/investment for the rest
+- attaches a `changes` section (added / removed / updated portfolio entries) to the
+  result so callers can re-export only what changed
+
+Runs where a connector missed its deadline or returned an incomplete listing are returned
+(flagged partial) but not saved as the new snapshot.
+
+Combined with the response cache's conditional revalidation (ETag / If-Modified-Since),
+unchanged upstream sources cost a 304 round-trip instead of a full download.
+"""
+from typing import Any, Dict, List, Optional, Sequence
+import hashlib
+import json
+import os
+import time
+
+from leet_apps.normalizer import normalize_company, normalize_investment
+from leet_apps.orchestrator import Orchestrator, dedupe_records, mark_partial
+from leet_apps.utils import fund_slug
+
+
+def content_hash(obj: Any) -> str:
+    """Stable SHA-256 of a JSON-serializable object."""
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class SnapshotStore:
+    """One JSON snapshot file per fund under `root`."""
+
+    def __init__(self, root: str):
+        self.root = os.path.expanduser(root)
+
+    def _path(self, fund_input: str) -> str:
+        return os.path.join(self.root, fund_slug(fund_input) + ".json")
+
+    def load(self, fund_input: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(fund_input), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def save(self, fund_input: str, snapshot: Dict[str, Any]):
+        os.makedirs(self.root, exist_ok=True)
+        path = self._path(fund_input)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        # Atomic replace so an interrupted run never leaves a truncated snapshot
+        os.replace(tmp, path)
+
+
+def diff_portfolios(old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Compare two normalized results by company id.
+
+    Returns {"added": [...], "removed": [...], "updated": [...]} where added/updated entries
+    carry the new company and investment records and removed entries are company ids.
+    """
+
+    def _index(data):
+        out = {}
+        if not data:
+            return out
+        investments = data.get("investments", []) or []
+        for i, company in enumerate(data.get("companies", []) or []):
+            out[company.get("id")] = (company, investments[i] if i < len(investments) else None)
+        return out
+
+    old_idx, new_idx = _index(old), _index(new)
+    added, updated = [], []
+    for cid, (company, investment) in new_idx.items():
+        if cid not in old_idx:
+            added.append({"company": company, "investment": investment})
+            continue
+        old_company, old_investment = old_idx[cid]
+        changed = sorted(k for k in set(company) | set(old_company) if company.get(k) != old_company.get(k))
+        changed += sorted(f"investment.{k}" for k in set(investment or {}) | set(old_investment or {})
+                          if (investment or {}).get(k) != (old_investment or {}).get(k))
+        if changed:
+            updated.append({"company": company, "investment": investment, "changed_fields": changed})
+    removed = [cid for cid in old_idx if cid not in new_idx]
+    return {"added": added, "removed": removed, "updated": updated}
+
+
+class IncrementalOrchestrator(Orchestrator):
+    def __init__(self, connectors: List[Any] = None, store: SnapshotStore = None, max_workers: int = None,
+                 transport: Any = None):
+        super().__init__(connectors=connectors, max_workers=max_workers, transport=transport)
+        if store is None:
+            state_dir = self.config.get("incremental", {}).get("state_dir", "~/.cache/fund-tracker/snapshots")
+            store = SnapshotStore(state_dir)
+        self.store = store
+
+    def _source_keys(self) -> List[str]:
+        return [f"{idx}:{type(c).__name__}" for idx, c in enumerate(self.connectors)]
+
+    def _finalize_batch(self, fund_input: str, per_connector: List[List[Dict[str, Any]]],
+                        timed_out: Sequence[str] = (), incomplete: Sequence[str] = ()) -> Dict[str, Any]:
+        previous = self.store.load(fund_input)
+        prev_hashes = (previous or {}).get("source_hashes", {})
+        source_hashes = {key: content_hash(r or []) for key, r in zip(self._source_keys(), per_connector)}
+        unchanged_sources = [k for k, h in source_hashes.items() if prev_hashes.get(k) == h]
+
+        prev_records = (previous or {}).get("records", [])
+        if previous is not None and source_hashes == prev_hashes:
+            result = self._assemble(fund_input, prev_records)
+            result["changes"] = {"changed": False, "added": [], "removed": [], "updated": [],
+                                 "unchanged_sources": unchanged_sources}
+            return result
+
+        results = []
+        for r in per_connector:
+            if r:
+                results.extend(r)
+        reusable = {rec["key"]: rec for rec in prev_records if rec.get("key")}
+        records = []
+        for raw in dedupe_records(results, fuzzy_threshold=self.fuzzy_threshold):
+            key = raw.get("company_name")
+            digest = content_hash(raw)
+            prev = reusable.get(key) if key else None
+            if prev is not None and prev["hash"] == digest:
+                records.append(prev)
+                continue
+            records.append({"key": key, "hash": digest, "company": normalize_company(raw),
+                            "investment": normalize_investment(raw, fund_input)})
+
+        result = mark_partial(self._assemble(fund_input, records), timed_out, incomplete)
+        diff = diff_portfolios(self._assemble(fund_input, prev_records) if previous else None, result)
+        if timed_out or incomplete:
+            # Companies missing from a partial run are not known to be gone
+            diff["removed"] = []
+        else:
+            # A partial run would make the missing sources look removed next time; keep the last full snapshot
+            self.store.save(fund_input, {"fund": fund_input, "updated_at": time.time(),
+                                         "source_hashes": source_hashes, "records": records})
+        result["changes"] = {"changed": any(diff.values()), **diff, "unchanged_sources": unchanged_sources}
+        return result
+
+    @staticmethod
+    def _assemble(fund_input: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "fund": {"id": fund_input},
+            "companies": [rec["company"] for rec in records],
+            "investments": [rec["investment"] for rec in records],
+        }
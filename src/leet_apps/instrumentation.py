@@ -0,0 +1,289 @@
+"""
+Lightweight tracing and per-stage metrics.
+
+Spans wrap the pipeline stages: each connector call (`connector.<Class>`), every HTTP request
+(`http.request`), retry backoff sleeps (`retry.sleep`), `dedupe`, `normalize` /
+`normalize.columnar` and each exporter (`export.<format>`). Tracing is off by default; when
+disabled `span()` returns a shared no-op object, so instrumented code costs one attribute
+check. Enable it with `--profile` / `--profile-output` on the CLI, `instrumentation.enabled`
+in config.yaml, or `enable()`.
+
+Spans nest through a context variable (so HTTP requests made by a connector are children of
+its span, also under asyncio). Work handed to another thread starts a new root span; pass
+`trace_key` (the fund input) so all spans for one fund share a trace id.
+
+Every finished span updates per-stage aggregates (count, total, max, errors and a latency
+histogram); the most recent `max_spans` spans are kept for trace export. Exports:
+- `to_prometheus()`: text exposition format (`fund_tracker_stage_seconds` histogram,
+  `fund_tracker_stage_errors_total` counter)
+- `to_json()`: per-stage aggregates plus the kept spans
+- `to_otlp()`: OpenTelemetry OTLP/JSON (`resourceSpans`), accepted by OTLP/HTTP collectors
+- `breakdown()`: the per-stage table printed by `--profile`
+
+Stage totals include nested spans (a connector's time includes its HTTP requests).
+"""
+from typing import Any, Callable, Deque, Dict, List, Optional
+from collections import deque
+import contextvars
+import functools
+import hashlib
+import json
+import random
+import threading
+import time
+
+SERVICE_NAME = "fund-investment-tracker"
+
+# Histogram bucket upper bounds in seconds (Prometheus `le` labels)
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+_current: contextvars.ContextVar = contextvars.ContextVar("leet_apps_span", default=None)
+
+
+class Span:
+    __slots__ = ("tracer", "name", "trace_id", "span_id", "parent_id", "attrs", "start_ns", "end_ns", "_t0",
+                 "error", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, trace_key: Optional[str], attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        parent = _current.get()
+        if parent is not None:
+            self.trace_id, self.parent_id = parent.trace_id, parent.span_id
+        else:
+            self.trace_id = (hashlib.sha256(trace_key.encode("utf-8")).hexdigest()[:32] if trace_key
+                             else "%032x" % random.getrandbits(128))
+            self.parent_id = None
+        self.span_id = "%016x" % random.getrandbits(64)
+        self.error = None
+
+    def set(self, key: str, value: Any):
+        self.attrs[key] = value
+
+    @property
+    def duration(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def __enter__(self) -> "Span":
+        self.start_ns = time.time_ns()
+        self._t0 = time.perf_counter_ns()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = self.start_ns + (time.perf_counter_ns() - self._t0)
+        _current.reset(self._token)
+        if exc_type is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        self.tracer._finish(self)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "trace_id": self.trace_id, "span_id": self.span_id, "parent_id": self.parent_id,
+                "start_ns": self.start_ns, "duration_seconds": round(self.duration, 6), "attributes": self.attrs,
+                "error": self.error}
+
+
+class _NoopSpan:
+    def set(self, key: str, value: Any):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+class _Stage:
+    __slots__ = ("count", "total", "max", "errors", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+        self.buckets = [0] * len(BUCKETS)
+
+
+class Tracer:
+    def __init__(self, enabled: bool = False, max_spans: int = 10000):
+        self.enabled = enabled
+        self.max_spans = max_spans
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._stages: Dict[str, _Stage] = {}
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+
+    def span(self, name: str, trace_key: Optional[str] = None, **attrs: Any):
+        """Context manager timing `name`; attributes describe this call (host, fund, ...)."""
+        if not self.enabled:
+            return _NOOP
+        return Span(self, name, trace_key, attrs)
+
+    def _finish(self, span: Span):
+        seconds = span.duration
+        with self._lock:
+            stage = self._stages.get(span.name)
+            if stage is None:
+                stage = self._stages[span.name] = _Stage()
+            stage.count += 1
+            stage.total += seconds
+            stage.max = max(stage.max, seconds)
+            if span.error is not None:
+                stage.errors += 1
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    stage.buckets[i] += 1
+                    break
+            self._spans.append(span)
+
+    def reset(self):
+        with self._lock:
+            self._spans = deque(maxlen=self.max_spans)
+            self._stages = {}
+            self._started = time.perf_counter()
+
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def stage_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage aggregates: count, total/mean/max seconds and errors."""
+        with self._lock:
+            stages = dict(self._stages)
+        return {name: {"count": s.count, "total_seconds": round(s.total, 6), "mean_seconds": round(s.total / s.count, 6),
+                       "max_seconds": round(s.max, 6), "errors": s.errors}
+                for name, s in sorted(stages.items(), key=lambda kv: -kv[1].total)}
+
+    def to_prometheus(self) -> str:
+        with self._lock:
+            stages = sorted(self._stages.items())
+        lines = ["# HELP fund_tracker_stage_seconds Time spent in each pipeline stage.",
+                 "# TYPE fund_tracker_stage_seconds histogram"]
+        for name, s in stages:
+            label = name.replace("\\", "\\\\").replace('"', '\\"')
+            cumulative = 0
+            for bound, n in zip(BUCKETS, s.buckets):
+                cumulative += n
+                lines.append(f'fund_tracker_stage_seconds_bucket{{stage="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'fund_tracker_stage_seconds_bucket{{stage="{label}",le="+Inf"}} {s.count}')
+            lines.append(f'fund_tracker_stage_seconds_sum{{stage="{label}"}} {s.total:.6f}')
+            lines.append(f'fund_tracker_stage_seconds_count{{stage="{label}"}} {s.count}')
+        lines += ["# HELP fund_tracker_stage_errors_total Stage calls that raised.",
+                  "# TYPE fund_tracker_stage_errors_total counter"]
+        for name, s in stages:
+            label = name.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'fund_tracker_stage_errors_total{{stage="{label}"}} {s.errors}')
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"stages": self.stage_stats(), "spans": [s.to_dict() for s in self.spans()]}
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Kept spans as an OTLP/JSON ExportTraceServiceRequest."""
+        spans = []
+        for s in self.spans():
+            item = {
+                "traceId": s.trace_id,
+                "spanId": s.span_id,
+                "name": s.name,
+                # SPAN_KIND_CLIENT for outgoing HTTP, SPAN_KIND_INTERNAL otherwise
+                "kind": 3 if s.name.startswith("http.") else 1,
+                "startTimeUnixNano": str(s.start_ns),
+                "endTimeUnixNano": str(s.end_ns),
+                "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in s.attrs.items()],
+                "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+            }
+            if s.parent_id:
+                item["parentSpanId"] = s.parent_id
+            spans.append(item)
+        return {"resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+            "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+        }]}
+
+    def breakdown(self) -> str:
+        """Per-stage timing table, slowest stage first."""
+        wall = time.perf_counter() - self._started
+        rows = [("stage", "calls", "total s", "mean ms", "max ms", "errors", "% wall")]
+        for name, s in self.stage_stats().items():
+            rows.append((name, str(s["count"]), f"{s['total_seconds']:.3f}", f"{s['mean_seconds'] * 1000:.1f}",
+                         f"{s['max_seconds'] * 1000:.1f}", str(s["errors"]),
+                         f"{100 * s['total_seconds'] / wall:.1f}" if wall else "-"))
+        widths = [max(len(r[i]) for r in rows) for i in range(len(rows[0]))]
+        lines = ["  ".join(c.ljust(w) if i == 0 else c.rjust(w) for i, (c, w) in enumerate(zip(r, widths))) for r in rows]
+        lines.append(f"wall time {wall:.3f}s (stage totals include nested stages)")
+        return "\n".join(lines)
+
+    def export(self, fmt: str) -> str:
+        """Serialize as "prometheus", "json" or "otlp"."""
+        if fmt == "prometheus":
+            return self.to_prometheus()
+        if fmt == "otlp":
+            return json.dumps(self.to_otlp())
+        if fmt == "json":
+            return json.dumps(self.to_json(), indent=2)
+        raise ValueError(f"unknown export format {fmt!r} (expected prometheus, json or otlp)")
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+_TRACER = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _TRACER
+
+
+def span(name: str, trace_key: Optional[str] = None, **attrs: Any):
+    """Span on the process-wide tracer (no-op while tracing is disabled)."""
+    if not _TRACER.enabled:
+        return _NOOP
+    return Span(_TRACER, name, trace_key, attrs)
+
+
+def traced(name: str) -> Callable:
+    """Decorator wrapping every call of a function in a span called `name`."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _TRACER.enabled:
+                return fn(*args, **kwargs)
+            with Span(_TRACER, name, None, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def enable(max_spans: Optional[int] = None) -> Tracer:
+    """Start recording spans on the process-wide tracer (clears earlier data)."""
+    if max_spans is not None:
+        _TRACER.max_spans = max_spans
+    _TRACER.reset()
+    _TRACER.enabled = True
+    return _TRACER
+
+
+def disable():
+    _TRACER.enabled = False
+
+
+def configure(config: Dict[str, Any]) -> Tracer:
+    """Enable tracing when `instrumentation.enabled` is set in config.yaml."""
+    cfg = (config or {}).get("instrumentation", {}) or {}
+    if cfg.get("enabled"):
+        enable(cfg.get("max_spans"))
+    return _TRACER
@@ -0,0 +1,133 @@
+"""
+Company-mention extraction from free text (news titles and descriptions).
+
+With a dictionary of known company names, MentionExtractor builds an Aho-Corasick automaton
+over their canonical forms (leet_apps.entity_resolution.canonicalize_name: lower-cased,
+punctuation and legal suffixes removed) and finds every name in one pass over the text,
+whatever the dictionary size. Matches must start and end on word boundaries; overlapping
+matches resolve to the leftmost-longest ("Acme Robotics" wins over "Acme").
+
+Without a dictionary it falls back to a precompiled capitalized-phrase pattern, which is
+noisier (it also catches people, places and headline words).
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+import re
+import unicodedata
+
+from leet_apps.entity_resolution import canonicalize_name
+
+# Two or more capitalized words ("Acme Robotics", "Beta-Labs Inc.")
+CAPITALIZED_PHRASE_RE = re.compile(r"([A-Z][A-Za-z0-9&\-\.]+(?:\s+[A-Z][A-Za-z0-9&\-\.]+)+)")
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Text in the same form as canonical names, without suffix stripping, for matching."""
+    s = unicodedata.normalize("NFKD", text)
+    s = "".join(ch for ch in s if not unicodedata.combining(ch)).lower().replace("&", " and ")
+    return _SPACE_RE.sub(" ", _PUNCT_RE.sub(" ", s)).strip()
+
+
+class AhoCorasick:
+    """Multi-pattern string matcher: one automaton, one pass per text."""
+
+    def __init__(self, patterns: Iterable[str]):
+        # Trie as parallel lists: goto[node] maps char -> node, out[node] holds pattern lengths
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for pattern in patterns:
+            if pattern:
+                self._insert(pattern)
+        self._build()
+
+    def _insert(self, pattern: str):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        if len(pattern) not in self._out[node]:
+            self._out[node].append(len(pattern))
+
+    def _build(self):
+        # Breadth-first failure links; each node's outputs include those of its failure chain
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> List[Tuple[int, int]]:
+        """All (start, end) spans of pattern occurrences in `text`, overlapping included."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        spans = []
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length in out[node]:
+                spans.append((i + 1 - length, i + 1))
+        return spans
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+
+class MentionExtractor:
+    def __init__(self, known_companies: Optional[Iterable[str]] = None, min_length: int = 3):
+        # canonical name -> display name (the first spelling given)
+        self.names: Dict[str, str] = {}
+        for name in known_companies or ():
+            key = canonicalize_name(name)
+            if len(key) >= min_length:
+                self.names.setdefault(key, name)
+        self._automaton = AhoCorasick(self.names) if self.names else None
+
+    @classmethod
+    def from_file(cls, path: str) -> "MentionExtractor":
+        """Dictionary from a text file with one company name per line ('#' comments allowed)."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(line.strip() for line in f if line.strip() and not line.startswith("#"))
+
+    def extract(self, text: str) -> List[str]:
+        """Company names mentioned in `text`, in order of first appearance, without repeats."""
+        if not text:
+            return []
+        if self._automaton is None:
+            found = []
+            for m in CAPITALIZED_PHRASE_RE.findall(text):
+                if 3 <= len(m) <= 100 and m not in found:
+                    found.append(m)
+            return found
+        norm = normalize_text(text)
+        n = len(norm)
+        spans = [(s, e) for s, e in self._automaton.find(norm)
+                 if (s == 0 or norm[s - 1] == " ") and (e == n or norm[e] == " ")]
+        # Leftmost-longest, non-overlapping
+        spans.sort(key=lambda span: (span[0], -span[1]))
+        found, last_end = [], -1
+        for s, e in spans:
+            if s < last_end:
+                continue
+            name = self.names[norm[s:e]]
+            if name not in found:
+                found.append(name)
+            last_end = e
+        return found
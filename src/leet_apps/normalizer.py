@@ -1,10 +1,37 @@
 """
 Normalize raw connector output into the project's data model.
+
+Large record sets (full Crunchbase exports) can be normalized on a process pool by
+`normalize_results_columnar`: records are split into contiguous chunks, each worker returns
+its chunk as column tables (leet_apps.columnar, mostly raw `array` buffers, so cheap to
+pickle), and chunks are appended in input order so the output matches the serial loop.
+The dict form stays serial: building the row dicts in the parent costs as much as
+normalizing them.
+
+Long-lived callers (the orchestrator, and so the server and scheduler) pass a
+NormalizerPool: one lazily started pool shared by every fund, so concurrent large funds
+queue for the same `processes` workers instead of each starting `cpu_count` more. Forking
+a process that has other threads running can copy locks they hold (rate limiter, logging,
+SQLite) into the child, so workers start with "forkserver" (or "spawn") whenever other
+threads are alive. Only a one-off call from a single-threaded process forks, and then
+workers read the records from memory inherited from the parent instead of receiving
+pickled copies.
 """
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import threading
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
-import re
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from leet_apps.instrumentation import traced
+from leet_apps.parsing import parse_amount, parse_date
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
 
 
 def _parse_amount(amount: Optional[str]) -> Tuple[Optional[float], Optional[str]]:
@@ -13,101 +40,13 @@ def _parse_amount(amount: Optional[str]) -> Tuple[Optional[float], Optional[str]
     Returns (value, currency) where value is a float (or None) and currency is a string like 'USD' or None.
     Handles common formats like "$5,000,000", "USD 5M", "5 million", "€2.5M", "£300k".
     """
-    if not amount:
-        return None, None
-    s = str(amount).strip()
-
-    # Detect currency symbol or code
-    currency = None
-    # Common symbols
-    if s.startswith("$"):
-        currency = "USD"
-        s = s[1:].strip()
-    elif s.startswith("€"):
-        currency = "EUR"
-        s = s[1:].strip()
-    elif s.startswith("£"):
-        currency = "GBP"
-        s = s[1:].strip()
-    else:
-        # Check for 3-letter currency code prefix
-        m = re.match(r"^([A-Z]{3})\s+", s)
-        if m:
-            currency = m.group(1)
-            s = s[m.end():]
-
-    # Normalize textual multipliers
-    s_low = s.lower()
-    multiplier = 1.0
-    if 'billion' in s_low:
-        multiplier = 1e9
-        s_low = s_low.replace('billion', '')
-    elif 'million' in s_low:
-        multiplier = 1e6
-        s_low = s_low.replace('million', '')
-    elif 'thousand' in s_low:
-        multiplier = 1e3
-        s_low = s_low.replace('thousand', '')
-
-    # Check suffix multipliers like 5M, 5k, 2.5B
-    suf = re.search(r"([kmb])\b", s_low)
-    if suf:
-        suf_ch = suf.group(1).lower()
-        if suf_ch == 'k':
-            multiplier = 1e3
-        elif suf_ch == 'm':
-            multiplier = 1e6
-        elif suf_ch == 'b':
-            multiplier = 1e9
-        # remove suffix
-        s_low = re.sub(r"([0-9\.,]+)\s*[kmb]\b", r"\1", s_low, flags=re.I)
-
-    # Extract numeric portion
-    num_match = re.search(r"([0-9\.,]+)")
-    if not num_match:
-        return None, currency
-    num_str = num_match.group(1)
-    # Remove commas
-    num_str = num_str.replace(',', '')
-    try:
-        val = float(num_str) * multiplier
-        return val, currency
-    except Exception:
-        return None, currency
+    return parse_amount(amount)
 
 
 def _parse_date(date_str: Optional[str]) -> Optional[str]:
     """Normalize date strings to YYYY-MM-DD when possible. If parsing fails, return the original string.
     """
-    if not date_str:
-        return None
-    s = str(date_str).strip()
-    # Common ISO-like pattern
-    try:
-        if re.match(r"^\d{4}-\d{2}-\d{2}$", s):
-            return s
-        # Try parsing YYYY-MM
-        if re.match(r"^\d{4}-\d{2}$", s):
-            return s + "-01"
-        # Try year only
-        if re.match(r"^\d{4}$", s):
-            return s + "-01-01"
-        # Fallback: try datetime.fromisoformat for extended cases
-        try:
-            dt = datetime.fromisoformat(s)
-            return dt.date().isoformat()
-        except Exception:
-            # Try common delimited formats
-            for fmt in ("%m/%d/%Y", "%d/%m/%Y", "%b %d, %Y", "%B %d, %Y"):
-                try:
-                    dt = datetime.strptime(s, fmt)
-                    return dt.date().isoformat()
-                except Exception:
-                    continue
-    except Exception:
-        pass
-    # If all parsing fails, return original
-    return s
+    return parse_date(date_str)
 
 
 def normalize_company(raw: Dict[str, Any]) -> Dict[str, Any]:
@@ -190,6 +129,131 @@ def normalize_investment(raw: Dict[str, Any], fund_id: str) -> Dict[str, Any]:
     }
 
 
+# Raw record lists registered for the duration of a parallel run. Workers started with the
+# "fork" method inherit this table, so tasks only carry (token, start, end) instead of
+# pickling the records.
+_SHARED_RECORDS: Dict[int, List[Dict[str, Any]]] = {}
+_shared_lock = threading.Lock()
+_next_token = itertools.count()
+
+
+def _normalize_columns(chunk: Iterable[Dict[str, Any]], fund_id: str):
+    """Normalize records into column tables (cheap to pickle back to the parent)."""
+    from leet_apps.columnar import ColumnarResult
+
+    result = ColumnarResult()
+    for raw in chunk:
+        result.add(normalize_company(raw), normalize_investment(raw, fund_id))
+    return result.companies, result.investments
+
+
+def _normalize_shared_range(token: int, start: int, end: int, fund_id: str):
+    return _normalize_columns(itertools.islice(_SHARED_RECORDS[token], start, end), fund_id)
+
+
+def use_processes(n_records: int, processes: Optional[int], parallel_threshold: Optional[int]) -> int:
+    """Number of worker processes to use, or 0 for the serial loop."""
+    if parallel_threshold is None or n_records < parallel_threshold:
+        return 0
+    processes = processes or os.cpu_count() or 1
+    return processes if processes > 1 else 0
+
+
+def _mp_context():
+    """Start method for worker processes: fork only when no other thread could be holding a lock."""
+    methods = mp.get_all_start_methods()
+    if threading.active_count() > 1:
+        for method in ("forkserver", "spawn"):
+            if method in methods:
+                return mp.get_context(method)
+    return mp.get_context("fork" if "fork" in methods else None)
+
+
+class NormalizerPool:
+    """A process pool started on first use and shared by every normalization that is given it."""
+
+    def __init__(self, processes: Optional[int] = None):
+        self.processes = processes or os.cpu_count() or 1
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.processes, mp_context=_mp_context())
+            return self._executor
+
+    def discard(self):
+        """Drop a pool that failed (e.g. a worker died); the next use starts a fresh one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def _normalize_chunks(executor, raw_list: List[Dict[str, Any]], fund_id: str, bounds, result):
+    # map() returns chunk results in submission order, so output order is deterministic
+    chunks = (raw_list[start:end] for start, end in bounds)
+    for companies, investments in executor.map(_normalize_columns, chunks, itertools.repeat(fund_id)):
+        result.companies.extend_table(companies)
+        result.investments.extend_table(investments)
+
+
+def _normalize_parallel(raw_list: List[Dict[str, Any]], fund_id: str, workers: int, chunk_size: int, result,
+                        pool: Optional[NormalizerPool] = None):
+    """Normalize `raw_list` on a process pool, appending chunk columns to `result` in input order."""
+    chunk_size = max(1, chunk_size)
+    bounds = [(i, min(i + chunk_size, len(raw_list))) for i in range(0, len(raw_list), chunk_size)]
+    if pool is not None:
+        _normalize_chunks(pool.executor(), raw_list, fund_id, bounds, result)
+        return
+    workers = min(workers, len(bounds))
+    context = _mp_context()
+    if context.get_start_method() == "fork":
+        with _shared_lock:
+            token = next(_next_token)
+            _SHARED_RECORDS[token] = raw_list
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                # Workers fork on first submit, after the records are registered
+                futures = [executor.submit(_normalize_shared_range, token, start, end, fund_id) for start, end in bounds]
+                for future in futures:
+                    companies, investments = future.result()
+                    result.companies.extend_table(companies)
+                    result.investments.extend_table(investments)
+        finally:
+            with _shared_lock:
+                del _SHARED_RECORDS[token]
+        return
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        _normalize_chunks(executor, raw_list, fund_id, bounds, result)
+
+
+def _normalize_into(result, raw_list: List[Dict[str, Any]], fund_id: str, processes: Optional[int],
+                    parallel_threshold: Optional[int], chunk_size: int, pool: Optional[NormalizerPool] = None) -> bool:
+    """Normalize in parallel into the ColumnarResult `result` when configured; False means
+    the caller should run the serial loop."""
+    workers = use_processes(len(raw_list), pool.processes if pool is not None else processes, parallel_threshold)
+    if not workers:
+        return False
+    try:
+        _normalize_parallel(raw_list, fund_id, workers, chunk_size, result, pool)
+        return True
+    except (OSError, RuntimeError) as e:
+        # e.g. no process support in the sandbox, or a worker died (BrokenProcessPool)
+        logger.warning("Parallel normalization failed (%s); normalizing serially", e)
+        if pool is not None:
+            pool.discard()
+        return False
+
+
+@traced("normalize")
 def normalize_results(raw_list: List[Dict[str, Any]], fund_name: str = "unknown-fund") -> Dict[str, Any]:
     fund_id = fund_name
     companies = []
@@ -198,3 +262,25 @@ def normalize_results(raw_list: List[Dict[str, Any]], fund_name: str = "unknown-
         companies.append(normalize_company(raw))
         investments.append(normalize_investment(raw, fund_id))
     return {"fund": {"id": fund_id}, "companies": companies, "investments": investments}
+
+
+@traced("normalize.columnar")
+def normalize_results_columnar(raw_list: List[Dict[str, Any]], fund_name: str = "unknown-fund", processes: Optional[int] = None,
+                               parallel_threshold: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                               pool: Optional[NormalizerPool] = None):
+    """Like normalize_results but returns a compact leet_apps.columnar.ColumnarResult.
+
+    With `parallel_threshold` set, lists of at least that many records are normalized in
+    chunks of `chunk_size` on `processes` worker processes (default: CPU count), or on the
+    shared `pool` when one is given.
+    """
+    from leet_apps.columnar import ColumnarResult
+
+    result = ColumnarResult(fund={"id": fund_name})
+    if _normalize_into(result, raw_list, fund_name, processes, parallel_threshold, chunk_size, pool):
+        return result
+    # Serial loop (also after a failed parallel run, which may have left partial chunks)
+    result = ColumnarResult(fund={"id": fund_name})
+    for raw in raw_list:
+        result.add(normalize_company(raw), normalize_investment(raw, fund_name))
+    return result
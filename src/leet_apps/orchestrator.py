@@ -4,16 +4,46 @@ Orchestrator: coordinate connector execution, aggregation, and simple deduplicat
 This is an MVP implementation intended to:
 - Register connectors (each exposing find_portfolio(fund_input) -> List[Dict])
 - Execute connectors (optionally in parallel) and gather results
-- Merge/deduplicate company records by company_name (case-insensitive)
+- Merge/deduplicate company records via entity resolution (canonical name, domain, fuzzy match)
 - Return a flattened list of raw records suitable for normalization
 
+Batch mode (`run_many`) keeps a single long-lived worker pool across funds and schedules
+(fund x connector) tasks globally, yielding each fund's normalized result as soon as all
+of its connectors have finished. Connectors with a `prefetch(fund_input)` method are told
+about each fund when it is queued (e.g. OfficialFundConnector warms robots.txt for fund URLs).
+
+Deadlines (`deadlines` in config.yaml) bound how long one slow source can hold up a fund:
+`fund_seconds` caps the whole fund from when its first connector starts running, and
+`connector_seconds` gives each connector (by class name) a budget from when it starts
+running; time spent queued behind other funds in batch mode does not count. Connectors
+still running at their deadline, or still queued when their fund's deadline passes, are
+dropped (queued calls are cancelled), and the fund's result is returned with
+`fund["partial"] = True` and the dropped sources in `fund["timed_out_sources"]`.
+Worker threads cannot be interrupted, so an abandoned call keeps its pool thread until the
+connector's own HTTP timeout fires; its late result is discarded. A connector that raises
+leet_apps.resilience.IncompleteResult (e.g. a truncated paginated listing) keeps the records
+it fetched, and the fund is flagged partial with the source in `fund["incomplete_sources"]`.
+
+Streaming mode (`stream`) runs the same connectors but yields change events as records
+arrive: connectors that implement `iter_portfolio(fund_input)` hand over records one at a
+time, entity resolution runs online (leet_apps.entity_resolution.EntityIndex) and each
+new or updated entity is normalized and emitted immediately, so the first output does not
+wait for the slowest connector and no full result lists are built.
+
 Concurrency and retry behavior are configurable via src/leet_apps/config.yaml.
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple
+import functools
 import logging
+import queue
+import threading
+import time
 import yaml
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from leet_apps.instrumentation import span, traced
+from leet_apps.resilience import IncompleteResult
 
 logger = logging.getLogger(__name__)
 
@@ -27,90 +57,403 @@ def _load_config():
         return {}
 
 
+@traced("dedupe")
+def dedupe_records(results: List[Dict[str, Any]], fuzzy_threshold: float = 0.75) -> List[Dict[str, Any]]:
+    """Deduplicate raw connector records via entity resolution.
+
+    Records are clustered by canonical name (legal suffixes and punctuation removed), website
+    domain and, unless `fuzzy_threshold` is None, MinHash-indexed fuzzy name similarity.
+    Each cluster is merged conservatively: source links are unioned and investment fields
+    from later records override earlier ones. See leet_apps.entity_resolution.
+    """
+    from leet_apps.entity_resolution import merge_records, resolve_entities
+
+    clusters = resolve_entities(results, fuzzy_threshold=fuzzy_threshold)
+    return [merge_records([results[i] for i in cluster]) for cluster in clusters]
+
+
+def mark_partial(normalized: Dict[str, Any], timed_out: Sequence[str], incomplete: Sequence[str] = ()) -> Dict[str, Any]:
+    """Flag a result whose connectors `timed_out` did not contribute, or returned only part (`incomplete`)."""
+    if timed_out or incomplete:
+        fund = normalized["fund"]
+        fund["partial"] = True
+        if timed_out:
+            fund["timed_out_sources"] = sorted(timed_out)
+        if incomplete:
+            fund["incomplete_sources"] = sorted(incomplete)
+    return normalized
+
+
 class Orchestrator:
-    def __init__(self, connectors: List[Any] = None):
+    def __init__(self, connectors: List[Any] = None, max_workers: int = None, transport: Any = None):
         self.connectors = connectors or []
         self.config = _load_config()
-        self.max_workers = self.config.get("concurrency", {}).get("max_workers", 4)
+        # Shared pooled HTTP transport injected into every connector that accepts one
+        self._owns_transport = transport is None
+        if transport is None:
+            from leet_apps.transport import HttpTransport
+
+            transport = HttpTransport.from_config(self.config)
+        self.transport = transport
+        for connector in self.connectors:
+            self._inject(connector)
+        self.max_workers = max_workers or self.config.get("concurrency", {}).get("max_workers", 4)
+        # Upper bound on funds with tasks in flight during run_many; keeps memory bounded for
+        # very large batches while still giving the pool enough work to stay busy.
+        self.max_pending_funds = self.config.get("batch", {}).get("max_pending_funds", self.max_workers * 4)
+        deadlines = self.config.get("deadlines", {}) or {}
+        self.fund_deadline = deadlines.get("fund_seconds")
+        self.connector_deadlines = deadlines.get("connector_seconds", {}) or {}
+        self.fuzzy_threshold = self.config.get("entity_resolution", {}).get("fuzzy_threshold", 0.75)
+        normalizer_cfg = self.config.get("normalizer", {})
+        # Return leet_apps.columnar.ColumnarResult instead of lists of dicts (smaller for large funds)
+        self.columnar = normalizer_cfg.get("columnar", False)
+        # Process-pool normalization for very large record sets (see leet_apps.normalizer)
+        self.normalize_options = {
+            "parallel_threshold": normalizer_cfg.get("parallel_threshold"),
+            "processes": normalizer_cfg.get("processes"),
+            "chunk_size": normalizer_cfg.get("chunk_size", 5000),
+        }
+        # Records buffered between connector threads and a streaming consumer (backpressure bound)
+        self.stream_queue_size = self.config.get("streaming", {}).get("queue_size", 1000)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._normalizer_pool = None
 
     def add_connector(self, connector: Any):
+        self._inject(connector)
         self.connectors.append(connector)
 
+    def _inject(self, connector: Any):
+        # Only fill in a transport for connectors that support one and were not given their own
+        if hasattr(connector, "transport") and getattr(connector, "transport") is None:
+            connector.transport = self.transport
+        # A connector's robots.txt cache fetches through the same pooled, rate-limited transport
+        robots = getattr(connector, "robots", None)
+        if robots is not None and hasattr(robots, "transport") and robots.transport is None:
+            robots.transport = self.transport
+
+    def _prefetch(self, fund_input: str):
+        """Let connectors that implement `prefetch(fund_input)` warm caches as soon as a fund is queued."""
+        for connector in self.connectors:
+            prefetch = getattr(connector, "prefetch", None)
+            if prefetch is None:
+                continue
+            try:
+                prefetch(fund_input)
+            except Exception as e:
+                logger.warning("Prefetch by %s failed: %s", type(connector).__name__, e)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the shared worker pool, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="orchestrator")
+            return self._executor
+
+    def _get_normalizer_pool(self):
+        """Return the process pool shared by every large fund's normalization, creating it on first use."""
+        from leet_apps.normalizer import NormalizerPool
+
+        with self._executor_lock:
+            if self._normalizer_pool is None:
+                self._normalizer_pool = NormalizerPool(self.normalize_options["processes"])
+            return self._normalizer_pool
+
+    def close(self):
+        """Shut down the shared worker pools and pooled connections. The orchestrator can still be reused afterwards."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            normalizer_pool, self._normalizer_pool = self._normalizer_pool, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if normalizer_pool is not None:
+            normalizer_pool.close()
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def connector_budget(self, connector) -> Optional[float]:
+        """Time budget in seconds for one connector call (None: no limit)."""
+        budgets = self.connector_deadlines
+        return budgets.get(type(connector).__name__, budgets.get("default"))
+
+    def _run_connector_timed(self, connector, fund_input: str, on_start: Callable[[], None]) -> List[Dict[str, Any]]:
+        on_start()
+        return self._run_connector(connector, fund_input)
+
     def _run_connector(self, connector, fund_input: str) -> List[Dict[str, Any]]:
         try:
-            return connector.find_portfolio(fund_input) or []
+            # Runs on a worker thread: the fund input keys the trace so a fund's spans stay together
+            with span(f"connector.{type(connector).__name__}", trace_key=fund_input, fund=fund_input) as s:
+                records = connector.find_portfolio(fund_input) or []
+                s.set("records", len(records))
+                return records
+        except IncompleteResult as e:
+            # The caller keeps e.records and flags the fund partial
+            logger.warning("Connector %s returned an incomplete result: %s", type(connector).__name__, e)
+            raise
         except Exception as e:
             logger.warning("Connector %s failed: %s", getattr(connector, "__class__", type(connector)), e)
             return []
 
+    def _finalize(self, fund_input: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Deduplicate gathered raw records and normalize them into the unified data model."""
+        with span("finalize", trace_key=fund_input, fund=fund_input, records=len(results)):
+            return self._dedupe_and_normalize(fund_input, results)
+
+    def _dedupe_and_normalize(self, fund_input: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        deduped = dedupe_records(results, fuzzy_threshold=self.fuzzy_threshold)
+
+        # Normalize deduped raw records into the unified schema
+        try:
+            from leet_apps.normalizer import normalize_results, normalize_results_columnar, use_processes
+
+            # Very large record sets are normalized on the shared process pool, which produces the columnar form
+            parallel = use_processes(len(deduped), self.normalize_options["processes"], self.normalize_options["parallel_threshold"])
+            if self.columnar or parallel:
+                pool = self._get_normalizer_pool() if parallel else None
+                return normalize_results_columnar(deduped, fund_input, pool=pool, **self.normalize_options)
+            normalized = normalize_results(deduped, fund_input)
+            return normalized
+        except Exception:
+            # As a fallback, return a minimal structure
+            return {"fund": {"id": fund_input}, "companies": deduped, "investments": []}
+
+    def _finalize_batch(self, fund_input: str, per_connector: List[List[Dict[str, Any]]],
+                        timed_out: Sequence[str] = (), incomplete: Sequence[str] = ()) -> Dict[str, Any]:
+        """Combine per-connector results (in connector order) and finalize them. Subclasses may override.
+
+        `timed_out` names the connectors dropped at their deadline (their results are None);
+        `incomplete` names those that raised IncompleteResult (their results are what they got).
+        """
+        results = []
+        for r in per_connector:
+            if r:
+                results.extend(r)
+        return mark_partial(self._finalize(fund_input, results), timed_out, incomplete)
+
     def run(self, fund_input: str) -> Dict[str, Any]:
         """Execute all connectors, deduplicate results, normalize and return the unified data model.
 
         Returns a dict: {"fund": {...}, "companies": [...], "investments": [...]}.
         """
-        results = []
+        for _, normalized in self.run_many([fund_input]):
+            return normalized
+        return {"fund": {"id": fund_input}, "companies": [], "investments": []}
+
+    def run_many(self, fund_inputs: Iterable[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Run all connectors for many funds on the shared worker pool.
+
+        Yields (fund_input, normalized) tuples in completion order, as soon as every connector
+        for a fund has returned. At most `max_pending_funds` funds have tasks queued at once,
+        so `fund_inputs` may be a lazy iterator over a very large batch.
+        """
+        if not self.connectors:
+            for fund_input in fund_inputs:
+                yield fund_input, {"fund": {"id": fund_input}, "companies": [], "investments": []}
+            return
+
+        executor = self._get_executor()
+        inputs = iter(fund_inputs)
+        pending = {}  # future -> (batch slot, connector index)
+        batches = {}  # batch slot -> {"fund", "remaining", "results", "deadline", "timed_out", "incomplete"}
+        started = {}  # (batch slot, connector index) -> monotonic start time, set by the worker; kept until the fund finishes
+        # Resolved by a worker when it starts a connector, so the wait below picks up the new deadline
+        start_signal = [Future()]
+        budgets = [self.connector_budget(c) for c in self.connectors]
+        next_slot = 0
+
+        def fund_deadline_of(slot: int) -> Optional[float]:
+            # The fund's clock starts when its first connector starts, not when it is queued
+            batch = batches[slot]
+            if batch["deadline"] is None and self.fund_deadline is not None:
+                first = min((started[(slot, i)] for i in range(len(self.connectors)) if (slot, i) in started), default=None)
+                if first is not None:
+                    batch["deadline"] = first + self.fund_deadline
+            return batch["deadline"]
+
+        def deadline_of(slot: int, idx: int) -> Optional[float]:
+            # A connector's own budget runs from its start; one still queued is only bound by
+            # its fund's deadline, once a sibling has started the fund's clock
+            deadline = fund_deadline_of(slot)
+            start = started.get((slot, idx))
+            if start is not None and budgets[idx] is not None:
+                end = start + budgets[idx]
+                deadline = end if deadline is None else min(deadline, end)
+            return deadline
+
+        def is_expired(key: Tuple[int, int], now: float) -> bool:
+            deadline = deadline_of(*key)
+            return deadline is not None and deadline <= now
+
+        def on_start(key: Tuple[int, int]):
+            # Runs on the worker thread
+            started[key] = time.monotonic()
+            try:
+                start_signal[0].set_result(key)
+            except InvalidStateError:
+                pass  # already signalled since the last wait
+
+        def submit_next() -> bool:
+            nonlocal next_slot
+            fund_input = next(inputs, None)
+            if fund_input is None:
+                return False
+            slot = next_slot
+            next_slot += 1
+            # Keep per-connector slots so merged output follows connector order, not completion order
+            batches[slot] = {"fund": fund_input, "remaining": len(self.connectors), "results": [None] * len(self.connectors),
+                             "deadline": None, "timed_out": [], "incomplete": []}
+            self._prefetch(fund_input)
+            for idx, connector in enumerate(self.connectors):
+                on_start_key = functools.partial(on_start, (slot, idx))
+                pending[executor.submit(self._run_connector_timed, connector, fund_input, on_start_key)] = (slot, idx)
+            return True
+
+        try:
+            while len(batches) < self.max_pending_funds and submit_next():
+                pass
+
+            while pending:
+                if start_signal[0].done():
+                    start_signal[0] = Future()
+                signal = start_signal[0]
+                deadlines = [d for d in (deadline_of(*key) for key in pending.values()) if d is not None]
+                timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                done, _ = wait([*pending, signal], timeout=timeout, return_when=FIRST_COMPLETED)
+                done.discard(signal)
+                now = time.monotonic()
+                # Past the fund deadline, connectors still queued are dropped along with the running ones
+                expired = [fut for fut, key in pending.items() if fut not in done and is_expired(key, now)]
+                for fut in list(done) + expired:
+                    slot, idx = pending.pop(fut)
+                    batch = batches[slot]
+                    if fut in done:
+                        try:
+                            batch["results"][idx] = fut.result()
+                        except IncompleteResult as e:
+                            batch["results"][idx] = e.records or []
+                            batch["incomplete"].append(type(self.connectors[idx]).__name__)
+                        except Exception as e:
+                            logger.warning("Error collecting connector result: %s", e)
+                    else:
+                        # Running past its deadline (or never started): a late result is ignored
+                        fut.cancel()
+                        name = type(self.connectors[idx]).__name__
+                        batch["timed_out"].append(name)
+                        logger.warning("Connector %s missed its deadline for %s; returning partial results", name, batch["fund"])
+                    batch["remaining"] -= 1
+                    if batch["remaining"]:
+                        continue
+
+                    del batches[slot]
+                    for i in range(len(self.connectors)):
+                        started.pop((slot, i), None)
+                    yield batch["fund"], self._finalize_batch(batch["fund"], batch["results"], timed_out=batch["timed_out"],
+                                                              incomplete=batch["incomplete"])
+                    submit_next()
+        finally:
+            # Consumer stopped early: drop queued work for funds that will never be collected
+            for fut in pending:
+                fut.cancel()
+
+    def _iter_connector(self, connector, fund_input: str) -> Iterator[Dict[str, Any]]:
+        """Yield a connector's records, one at a time when it implements `iter_portfolio`."""
+        try:
+            iter_portfolio = getattr(connector, "iter_portfolio", None)
+            records = iter_portfolio(fund_input) if iter_portfolio is not None else connector.find_portfolio(fund_input)
+            for record in records or []:
+                yield record
+        except Exception as e:
+            # Records already yielded are kept; the connector just stops contributing
+            logger.warning("Connector %s failed: %s", getattr(connector, "__class__", type(connector)), e)
+
+    def iter_records(self, fund_input: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (connector index, raw record) in arrival order while connectors run on the pool.
+
+        Connector threads block once `stream_queue_size` records are waiting, so a slow
+        consumer bounds memory instead of letting results pile up.
+        """
         if not self.connectors:
-            return {"fund": {"id": fund_input}, "companies": [], "investments": []}
+            return
+        records = queue.Queue(maxsize=self.stream_queue_size)
+        stop = threading.Event()
+        finished = object()
 
-        # Run connectors in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
-            futures = {ex.submit(self._run_connector, c, fund_input): c for c in self.connectors}
-            for fut in as_completed(futures):
+        def put(item) -> bool:
+            while not stop.is_set():
                 try:
-                    r = fut.result()
-                    if r:
-                        results.extend(r)
-                except Exception as e:
-                    logger.warning("Error collecting connector result: %s", e)
-
-        # Deduplicate by company_name
-        seen = {}
-        deduped = []
-        for rec in results:
-            name = rec.get("company_name")
-            if name:
-                key = name.strip().lower()
-            else:
-                # fallback: include record (no dedup key)
-                key = None
-
-            if key:
-                if key in seen:
-                    # merge source_links and investment info conservatively
-                    existing = seen[key]
-                    # merge source_links
-                    existing_links = set(existing.get("source_links", []))
-                    for l in rec.get("source_links", []):
-                        if l:
-                            existing_links.add(l)
-                    existing["source_links"] = list(existing_links)
-                    # merge investment.source_links
-                    existing_inv = existing.get("investment") or {}
-                    rec_inv = rec.get("investment") or {}
-                    inv_links = set(existing_inv.get("source_links", []))
-                    for l in rec_inv.get("source_links", []):
-                        if l:
-                            inv_links.add(l)
-                    if rec_inv:
-                        merged_inv = {**existing_inv, **rec_inv}
-                        merged_inv["source_links"] = list(inv_links)
-                        existing["investment"] = merged_inv
-                else:
-                    seen[key] = rec.copy()
-                    deduped.append(seen[key])
-            else:
-                # no name, include raw
-                deduped.append(rec)
+                    records.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
 
-        # Normalize deduped raw records into the unified schema
+        def pump(idx: int, connector):
+            try:
+                for record in self._iter_connector(connector, fund_input):
+                    if not put((idx, record)):
+                        return
+            finally:
+                put((idx, finished))
+
+        executor = self._get_executor()
+        futures = [executor.submit(pump, idx, connector) for idx, connector in enumerate(self.connectors)]
+        remaining = len(futures)
         try:
-            from leet_apps.normalizer import normalize_results
+            while remaining:
+                idx, record = records.get()
+                if record is finished:
+                    remaining -= 1
+                    continue
+                yield idx, record
+        finally:
+            # Consumer stopped early: unblock connector threads and drop pumps that never started
+            stop.set()
+            for fut in futures:
+                fut.cancel()
 
-            normalized = normalize_results(deduped, fund_input)
-            return normalized
-        except Exception:
-            # As a fallback, return a minimal structure
-            return {"fund": {"id": fund_input}, "companies": deduped, "investments": []}
+    def stream(self, fund_input: str) -> Iterator[Dict[str, Any]]:
+        """Yield change events for one fund as connector records arrive.
+
+        Events:
+        - {"op": "upsert", "fund_id", "company", "investment"}: a new entity, or an existing
+          one whose merged record changed; the latest upsert for a company id wins
+        - {"op": "remove", "fund_id", "company_id"}: an entity was merged into another
+        - {"op": "end", "fund_id", "total_companies"}: all connectors finished
+
+        Merged records keep the values of the first record to arrive, so field precedence
+        follows arrival order rather than connector order. An entity keeps the company id of
+        its first upsert, even if a later record supplies the name it was missing.
+        """
+        from leet_apps.entity_resolution import EntityIndex
+        from leet_apps.normalizer import normalize_company, normalize_investment
+
+        index = EntityIndex(fuzzy_threshold=self.fuzzy_threshold)
+        ids: Dict[int, str] = {}
+
+        def entity_id(eid: int, merged: Dict[str, Any]) -> str:
+            # Entities without a name get a stable id instead of normalize_company's random uuid
+            if eid not in ids:
+                ids[eid] = merged.get("company_name") or f"entity-{eid}"
+            return ids[eid]
+
+        for _, record in self.iter_records(fund_input):
+            eid, merged, absorbed = index.add(record)
+            for absorbed_id, absorbed_record in absorbed:
+                yield {"op": "remove", "fund_id": fund_input, "company_id": entity_id(absorbed_id, absorbed_record)}
+                del ids[absorbed_id]
+            company = normalize_company(merged)
+            investment = normalize_investment(merged, fund_input)
+            company["id"] = investment["company_id"] = entity_id(eid, merged)
+            yield {"op": "upsert", "fund_id": fund_input, "company": company, "investment": investment}
+        yield {"op": "end", "fund_id": fund_input, "total_companies": len(index)}
 
 
 def run_for_fund(fund_input: str) -> Dict[str, Any]:
@@ -126,4 +469,5 @@ def run_for_fund(fund_input: str) -> Dict[str, Any]:
         orch = Orchestrator(connectors=[CrunchbaseConnector(), NewsConnector(), OfficialFundConnector()])
     except Exception:
         orch = Orchestrator()
-    return orch.run(fund_input)
+    with orch:
+        return orch.run(fund_input)
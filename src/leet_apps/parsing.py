@@ -0,0 +1,164 @@
+"""
+Fast amount and date parsing for the normalizer.
+
+Connector records repeat the same few strings over and over ("$5,000,000", "2018-09-12"),
+so both parsers are memoized on the raw string. Misses take the fast path:
+- amounts: one anchored pattern splits currency symbol or code, number and multiplier
+  ("USD 5M", "€2.5 million") in a single match; anything else falls back to the general
+  scan, which gives the same results as the original per-step parser
+- dates: the input's shape (ISO, m/d/Y, "Mon D, YYYY") is picked with precompiled patterns
+  and the date is built directly instead of trying `strptime` formats one after another
+
+Strings longer than `MAX_CACHED_LENGTH` are parsed without caching so free text cannot
+flush the cache.
+"""
+from typing import Optional, Tuple
+from datetime import date, datetime
+from functools import lru_cache
+import calendar
+import re
+
+CACHE_SIZE = 65536
+MAX_CACHED_LENGTH = 64
+
+_SYMBOLS = {"$": "USD", "€": "EUR", "£": "GBP"}
+_MULTIPLIERS = {"k": 1e3, "m": 1e6, "b": 1e9, "thousand": 1e3, "million": 1e6, "billion": 1e9}
+
+_AMOUNT_RE = re.compile(
+    r"(?:(?P<sym>[$€£])\s*|(?P<code>[A-Z]{3})\s+)?"
+    r"(?P<num>[0-9][0-9,]*(?:\.[0-9]+)?)\s*"
+    r"(?P<mult>(?i:thousand|million|billion|[kmb]))?"
+)
+_CODE_RE = re.compile(r"([A-Z]{3})\s+")
+_WORD_MULT_RE = re.compile(r"billion|million|thousand")
+_SUFFIX_RE = re.compile(r"([kmb])\b")
+_SUFFIX_SUB_RE = re.compile(r"([0-9\.,]+)\s*[kmb]\b", re.I)
+_NUMBER_RE = re.compile(r"([0-9\.,]+)")
+
+_ISO_RE = re.compile(r"(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?")
+_SLASH_RE = re.compile(r"(\d\d?)/(\d\d?)/(\d{4})")
+_NAMED_RE = re.compile(r"([A-Za-z]+)\s+(\d\d?),\s+(\d{4})")
+# Same month names strptime's %b / %B accept in the C locale, case-insensitive
+_MONTHS = {name.lower(): i for names in (calendar.month_abbr, calendar.month_name)
+           for i, name in enumerate(names) if name}
+
+
+def parse_amount(amount: Optional[str]) -> Tuple[Optional[float], Optional[str]]:
+    """Parse an amount string into (value, currency).
+
+    Handles "$5,000,000", "USD 5M", "5 million", "€2.5M", "£300k"; value and currency are
+    None when they cannot be determined.
+    """
+    if not amount:
+        return None, None
+    s = str(amount)
+    if len(s) > MAX_CACHED_LENGTH:
+        return _parse_amount(s)
+    return _parse_amount_cached(s)
+
+
+def _parse_amount(text: str) -> Tuple[Optional[float], Optional[str]]:
+    s = text.strip()
+    m = _AMOUNT_RE.fullmatch(s)
+    if m is not None:
+        currency = _SYMBOLS.get(m.group("sym")) if m.group("sym") else m.group("code")
+        mult = m.group("mult")
+        value = float(m.group("num").replace(",", ""))
+        return value * _MULTIPLIERS[mult.lower()] if mult else value, currency
+    return _parse_amount_general(s)
+
+
+def _parse_amount_general(s: str) -> Tuple[Optional[float], Optional[str]]:
+    """Step-by-step parse for free-form amounts ("5M USD", "5 million (est.)")."""
+    currency = _SYMBOLS.get(s[:1])
+    if currency:
+        s = s[1:].strip()
+    else:
+        m = _CODE_RE.match(s)
+        if m:
+            currency = m.group(1)
+            s = s[m.end():]
+
+    s_low = s.lower()
+    multiplier = 1.0
+    words = set(_WORD_MULT_RE.findall(s_low))
+    for word in ("billion", "million", "thousand"):
+        if word in words:
+            multiplier = _MULTIPLIERS[word]
+            s_low = s_low.replace(word, "")
+            break
+
+    suf = _SUFFIX_RE.search(s_low)
+    if suf:
+        multiplier = _MULTIPLIERS[suf.group(1)]
+        s_low = _SUFFIX_SUB_RE.sub(r"\1", s_low)
+
+    num_match = _NUMBER_RE.search(s_low)
+    if not num_match:
+        return None, currency
+    try:
+        return float(num_match.group(1).replace(",", "")) * multiplier, currency
+    except ValueError:
+        return None, currency
+
+
+def parse_date(date_str: Optional[str]) -> Optional[str]:
+    """Normalize a date string to YYYY-MM-DD when possible, otherwise return it stripped."""
+    if not date_str:
+        return None
+    s = str(date_str)
+    if len(s) > MAX_CACHED_LENGTH:
+        return _parse_date(s)
+    return _parse_date_cached(s)
+
+
+def _parse_date(text: str) -> str:
+    s = text.strip()
+    m = _ISO_RE.fullmatch(s)
+    if m is not None:
+        # Full dates pass through unvalidated; partial ones are padded to the first day
+        year, month, day = m.groups()
+        if month is None:
+            return s + "-01-01"
+        return s if day is not None else s + "-01"
+
+    m = _SLASH_RE.fullmatch(s)
+    if m is not None:
+        a, b, year = int(m.group(1)), int(m.group(2)), int(m.group(3))
+        # US month-first order wins when both readings are valid
+        return _make_date(year, a, b) or _make_date(year, b, a) or s
+
+    m = _NAMED_RE.fullmatch(s)
+    if m is not None:
+        month = _MONTHS.get(m.group(1).lower())
+        if month is not None:
+            return _make_date(int(m.group(3)), month, int(m.group(2))) or s
+        return s
+
+    # Extended ISO forms ("20180912", "2018-09-12T10:00:00"); these always start with the year
+    if s[:4].isdigit():
+        try:
+            return datetime.fromisoformat(s).date().isoformat()
+        except ValueError:
+            pass
+    return s
+
+
+def _make_date(year: int, month: int, day: int) -> Optional[str]:
+    if year < 1 or not 1 <= month <= 12 or not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return date(year, month, day).isoformat()
+
+
+_parse_amount_cached = lru_cache(maxsize=CACHE_SIZE)(_parse_amount)
+_parse_date_cached = lru_cache(maxsize=CACHE_SIZE)(_parse_date)
+
+
+def cache_info():
+    """lru_cache statistics for the amount and date parsers."""
+    return {"amount": _parse_amount_cached.cache_info()._asdict(), "date": _parse_date_cached.cache_info()._asdict()}
+
+
+def clear_caches():
+    _parse_amount_cached.cache_clear()
+    _parse_date_cached.cache_clear()
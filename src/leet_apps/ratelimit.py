@@ -0,0 +1,307 @@
+"""
+Token-bucket rate limiting keyed by request host (N1: respect rate limits).
+
+Callers *reserve* a token under a short lock and then sleep outside of it, so many threads
+hitting the same host are spaced out by the bucket's rate instead of queueing single-file
+behind a lock. Buckets are created on demand for whatever host a URL points to.
+
+Also supported:
+- Burst capacity per host
+- Per-host call quotas over a rolling period (e.g. a Crunchbase daily call budget);
+  exceeding one raises QuotaExceeded instead of waiting. Quota usage is kept in memory
+  (per process) unless `rate_limits.quota_path` names a QuotaStore: a small SQLite file
+  shared by every process using it, so restarts, the scheduler daemon and one-off CLI runs
+  spend a single budget
+- `Retry-After` / 429 handling: `record_response` pauses the host until the server allows
+  requests again
+- `aacquire` for asyncio callers
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+from email.utils import parsedate_to_datetime
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import urllib.parse
+
+
+class QuotaExceeded(RuntimeError):
+    """Raised when a host's call budget for the current period is used up."""
+
+
+def host_of(url_or_host: str) -> str:
+    """Return the host for a URL, or the input unchanged if it is already a bare host."""
+    if "://" in url_or_host:
+        return urllib.parse.urlparse(url_or_host).netloc
+    return url_or_host
+
+
+def parse_retry_after(value: Optional[str], now: float = None) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds to wait."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(when - (time.time() if now is None else now), 0.0)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take `tokens` from the bucket and return how long the caller must wait before proceeding.
+
+        The balance may go negative; later callers then get proportionally longer waits. While
+        the bucket is blocked, callers are scheduled from the end of the block: at most
+        `capacity` go at once when it lifts and the rest follow at `rate`.
+        """
+        with self._lock:
+            now = self._clock()
+            # Tokens refill up to the block's end at most, so a block does not bank a burst
+            start = max(now, self._blocked_until)
+            if start > self._updated:
+                self._tokens = min(self.capacity, self._tokens + (start - self._updated) * self.rate)
+                self._updated = start
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return (start - now) + wait
+
+    def block_for(self, seconds: float):
+        """Pause the bucket (e.g. after a 429 with Retry-After)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+
+_QUOTA_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quota_usage (
+    host TEXT PRIMARY KEY,
+    window_start REAL NOT NULL,
+    used INTEGER NOT NULL
+);
+"""
+
+
+class QuotaStore:
+    """Quota usage per host in SQLite, shared by every process that opens the same file.
+
+    Windows are tracked in wall-clock time so they carry over across restarts. The database
+    file is only created on the first quota-limited call.
+    """
+
+    def __init__(self, path: str = ":memory:", clock: Callable[[], float] = time.time, timeout: float = 30.0):
+        self.path = path
+        self.timeout = timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db = None
+
+    def _conn(self) -> sqlite3.Connection:
+        # Callers must hold self._lock
+        if self._db is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            # Autocommit mode: consume() manages its own transaction
+            self._db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            self._db.executescript(_QUOTA_SCHEMA)
+        return self._db
+
+    def _window(self, db: sqlite3.Connection, host: str, period: float, now: float) -> Tuple[float, int]:
+        row = db.execute("SELECT window_start, used FROM quota_usage WHERE host = ?", (host,)).fetchone()
+        if row is None or now - row[0] >= period:
+            return now, 0
+        return row[0], row[1]
+
+    def consume(self, host: str, limit: int, period: float):
+        with self._lock:
+            db = self._conn()
+            # Take the write lock before reading, so two processes cannot both spend the last call
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                window_start, used = self._window(db, host, period, self._clock())
+                if used >= limit:
+                    raise QuotaExceeded(f"Call quota of {limit} per {period:.0f}s exhausted for {host}")
+                db.execute("INSERT OR REPLACE INTO quota_usage (host, window_start, used) VALUES (?, ?, ?)",
+                           (host, window_start, used + 1))
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
+    def usage(self, host: str, period: float) -> Tuple[int, float]:
+        """Return (calls used, seconds until the window resets) for the host's current window."""
+        with self._lock:
+            now = self._clock()
+            if self._db is None and self.path != ":memory:" and not os.path.exists(self.path):
+                # Nothing spent yet; checking the budget should not create the file
+                return 0, period
+            window_start, used = self._window(self._conn(), host, period, now)
+        return used, max(window_start + period - now, 0.0)
+
+    def close(self):
+        with self._lock:
+            db, self._db = self._db, None
+        if db is not None:
+            db.close()
+
+
+class Quota:
+    """Call budget for one host per period: in memory, or in a shared QuotaStore when given."""
+
+    def __init__(self, limit: int, period: float = 86400.0, clock: Callable[[], float] = time.monotonic,
+                 host: str = "", store: Optional[QuotaStore] = None):
+        self.limit = limit
+        self.period = period
+        self.host = host
+        self.store = store
+        self._clock = clock
+        self._window_start = clock()
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def _roll(self, now: float):
+        if now - self._window_start >= self.period:
+            self._window_start = now
+            self._used = 0
+
+    def consume(self, host: str = ""):
+        if self.store is not None:
+            self.store.consume(host or self.host, self.limit, self.period)
+            return
+        with self._lock:
+            self._roll(self._clock())
+            if self._used >= self.limit:
+                raise QuotaExceeded(f"Call quota of {self.limit} per {self.period:.0f}s exhausted for {host}")
+            self._used += 1
+
+    @property
+    def remaining(self) -> int:
+        if self.store is not None:
+            return max(self.limit - self.store.usage(self.host, self.period)[0], 0)
+        with self._lock:
+            self._roll(self._clock())
+            return max(self.limit - self._used, 0)
+
+    @property
+    def resets_in(self) -> float:
+        """Seconds until the current quota window ends and the full budget is available again."""
+        if self.store is not None:
+            return self.store.usage(self.host, self.period)[1]
+        with self._lock:
+            return max(self._window_start + self.period - self._clock(), 0.0)
+
+
+class RateLimiter:
+    def __init__(self, default_rate: float = 1.0, default_burst: float = 1.0, host_limits: Dict[str, Dict[str, Any]] = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep,
+                 quota_store: Optional[QuotaStore] = None):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = dict(host_limits or {})
+        # Optional QuotaStore persisting quota usage across processes; None keeps it in memory
+        self.quota_store = quota_store
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets = {}
+        self._quotas = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["RateLimiter"]:
+        cfg = (config or {}).get("rate_limits")
+        if not cfg:
+            return None
+        default = cfg.get("default", {}) or {}
+        quota_path = os.environ.get("FUND_TRACKER_QUOTA_PATH") or cfg.get("quota_path")
+        return cls(
+            default_rate=default.get("rate_per_second", 1.0),
+            default_burst=default.get("burst", 1),
+            host_limits=cfg.get("hosts") or {},
+            quota_store=QuotaStore(os.path.expanduser(quota_path)) if quota_path else None,
+        )
+
+    def configure_host(self, host: str, rate: float = None, burst: float = None, quota: int = None,
+                       quota_period: float = 86400.0, replace: bool = True):
+        """Set limits for a host, replacing any existing bucket unless `replace` is False."""
+        with self._lock:
+            if not replace and host in self.host_limits:
+                return
+            self.host_limits[host] = {"rate_per_second": rate, "burst": burst, "quota": quota, "quota_period": quota_period}
+            self._buckets.pop(host, None)
+            self._quotas.pop(host, None)
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                limits = self.host_limits.get(host) or {}
+                rate = limits.get("rate_per_second") or self.default_rate
+                burst = limits.get("burst") or self.default_burst
+                bucket = self._buckets[host] = TokenBucket(rate, burst, clock=self._clock)
+                if limits.get("quota"):
+                    self._quotas[host] = Quota(limits["quota"], limits.get("quota_period") or 86400.0, clock=self._clock,
+                                               host=host, store=self.quota_store)
+            return bucket
+
+    def reserve(self, url: str) -> float:
+        """Reserve a request slot for the URL's host; returns the delay the caller must wait."""
+        host = host_of(url)
+        bucket = self._bucket(host)
+        quota = self._quotas.get(host)
+        if quota is not None:
+            quota.consume(host)
+        return bucket.reserve()
+
+    def acquire(self, url: str):
+        """Block until a request to the URL's host is allowed."""
+        delay = self.reserve(url)
+        if delay > 0:
+            self._sleep(delay)
+
+    async def aacquire(self, url: str):
+        """Async variant of acquire; waits without blocking the event loop."""
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record_response(self, url: str, response: Any):
+        """Honor 429/503 responses by pausing the host for its Retry-After interval."""
+        status = getattr(response, "status_code", None)
+        if status not in (429, 503):
+            return
+        headers = getattr(response, "headers", None) or {}
+        delay = parse_retry_after(headers.get("Retry-After"))
+        if delay is None:
+            if status != 429:
+                return
+            # No hint from the server: back off for one full refill of the bucket
+            bucket = self._bucket(host_of(url))
+            delay = bucket.capacity / bucket.rate
+        self._bucket(host_of(url)).block_for(delay)
+
+    def remaining_quota(self, url: str) -> Optional[int]:
+        host = host_of(url)
+        self._bucket(host)
+        quota = self._quotas.get(host)
+        return quota.remaining if quota is not None else None
+
+    def quota_resets_in(self, url: str) -> Optional[float]:
+        """Seconds until the URL's host gets a fresh quota window (None: the host has no quota)."""
+        host = host_of(url)
+        self._bucket(host)
+        quota = self._quotas.get(host)
+        return quota.resets_in if quota is not None else None
@@ -0,0 +1,238 @@
+"""
+Per-source circuit breakers and adaptive concurrency limits.
+
+Both are kept per request host (one per data source: api.crunchbase.com, newsapi.org, ...)
+and live on the shared HttpTransport, so every fund in a run sees the same state:
+- CircuitBreaker: opens after `failure_threshold` consecutive failures (exceptions, 5xx
+  or 429) and refuses calls with CircuitOpen until `reset_timeout` has passed; then one
+  half-open probe is let through, and its outcome closes or re-opens the circuit
+- AdaptiveLimiter: AIMD limit on in-flight requests; each success within the latency target
+  grows the limit by 1/limit (about +1 per round of requests), and each failure or slow
+  response multiplies it by `decrease_factor`
+
+CircuitOpen is not a requests.RequestException, so connector retry loops stop at once and
+fall back instead of sleeping through their remaining attempts.
+
+A connector that can only deliver part of a fund's portfolio (a later page failed, or a page
+budget cut the listing short) raises IncompleteResult after the records it did get; the
+orchestrator keeps those records and flags the fund partial.
+"""
+from typing import Any, Callable, Dict, Optional
+import threading
+import time
+
+from leet_apps.ratelimit import host_of
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(RuntimeError):
+    """Raised instead of calling a source whose circuit is open."""
+
+
+class IncompleteResult(RuntimeError):
+    """Raised by a connector whose listing was cut short; `records` holds what it did fetch.
+
+    Streaming connectors (`iter_portfolio`) raise it after yielding those records and leave
+    `records` as None.
+    """
+
+    def __init__(self, message: str, records: Optional[list] = None):
+        super().__init__(message)
+        self.records = records
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probing = False
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now; in half-open state only one probe is allowed at a time."""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def available(self) -> bool:
+        """Like allow() but without claiming the half-open probe."""
+        with self._lock:
+            state = self._current_state()
+            return state == CLOSED or (state == HALF_OPEN and not self._probing)
+
+    def release_probe(self):
+        """Give back a half-open probe claimed by allow() for a call that was never sent."""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probing = False
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+
+
+class AdaptiveLimiter:
+    def __init__(self, initial: float = 4, min_limit: float = 1, max_limit: float = 16,
+                 latency_target: Optional[float] = None, decrease_factor: float = 0.5):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> float:
+        with self._cond:
+            return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        with self._cond:
+            return self._in_flight
+
+    def acquire(self):
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float, ok: bool):
+        with self._cond:
+            self._in_flight -= 1
+            if ok and (self.latency_target is None or latency <= self.latency_target):
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            else:
+                self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+            self._cond.notify_all()
+
+
+class SourceGuards:
+    """Circuit breaker and adaptive limiter per host, created on first use."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, concurrency: Dict[str, Any] = None,
+                 host_overrides: Dict[str, Dict[str, Any]] = None, clock: Callable[[], float] = time.monotonic):
+        self.defaults = {"failure_threshold": failure_threshold, "reset_timeout_seconds": reset_timeout,
+                         "concurrency": dict(concurrency or {})}
+        self.host_overrides = dict(host_overrides or {})
+        self._clock = clock
+        self._guards: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["SourceGuards"]:
+        cfg = (config or {}).get("resilience")
+        if not cfg or not cfg.get("enabled", True):
+            return None
+        return cls(
+            failure_threshold=cfg.get("failure_threshold", 5),
+            reset_timeout=cfg.get("reset_timeout_seconds", 30.0),
+            concurrency=cfg.get("concurrency"),
+            host_overrides=cfg.get("hosts"),
+        )
+
+    def _guard(self, host: str):
+        with self._lock:
+            guard = self._guards.get(host)
+            if guard is None:
+                override = self.host_overrides.get(host) or {}
+                concurrency = {**self.defaults["concurrency"], **(override.get("concurrency") or {})}
+                breaker = CircuitBreaker(
+                    failure_threshold=override.get("failure_threshold", self.defaults["failure_threshold"]),
+                    reset_timeout=override.get("reset_timeout_seconds", self.defaults["reset_timeout_seconds"]),
+                    clock=self._clock,
+                )
+                limiter = AdaptiveLimiter(
+                    initial=concurrency.get("initial", 4), min_limit=concurrency.get("min", 1),
+                    max_limit=concurrency.get("max", 16), latency_target=concurrency.get("latency_target_seconds"),
+                    decrease_factor=concurrency.get("decrease_factor", 0.5),
+                )
+                guard = self._guards[host] = (breaker, limiter)
+            return guard
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        return self._guard(host_of(url))[0]
+
+    def limiter(self, url: str) -> AdaptiveLimiter:
+        return self._guard(host_of(url))[1]
+
+    def call(self, url: str, send: Callable[[], Any], admit: Callable[[], None] = None) -> Any:
+        """Run `send()` under the host's breaker and concurrency limit.
+
+        Raises CircuitOpen without calling `send` (or `admit`) while the host's circuit is open.
+        `admit` runs once the breaker lets the call through and before it takes a concurrency
+        slot (the transport acquires its rate-limit token there, so refused calls spend no quota).
+        """
+        host = host_of(url)
+        breaker, limiter = self._guard(host)
+        if not breaker.allow():
+            raise CircuitOpen(f"circuit open for {host}")
+        if admit is not None:
+            try:
+                admit()
+            except BaseException:
+                breaker.release_probe()
+                raise
+        limiter.acquire()
+        start = time.monotonic()
+        ok = False
+        try:
+            resp = send()
+            status = getattr(resp, "status_code", 200)
+            ok = status < 500 and status != 429
+            return resp
+        finally:
+            limiter.release(time.monotonic() - start, ok)
+            if ok:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+
+    def available(self, url: str) -> bool:
+        return self.breaker(url).available()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            guards = dict(self._guards)
+        return {host: {"state": breaker.state, "concurrency_limit": round(limiter.limit, 2), "in_flight": limiter.in_flight}
+                for host, (breaker, limiter) in guards.items()}
+
+
+def source_available(transport: Any, url: str) -> bool:
+    """False when `transport` has an open circuit for the URL's host (connector retry loops stop early)."""
+    available = getattr(transport, "source_available", None)
+    return available(url) if available is not None else True
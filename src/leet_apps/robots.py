@@ -0,0 +1,177 @@
+"""
+Cached robots.txt checks (N1: respect robots.txt).
+
+RobotsCache keeps one parsed robots.txt per host with an expiry:
+- Successful fetches are cached for `ttl` seconds.
+- Failed fetches (network errors, 5xx) are cached as denials for only `negative_ttl`
+  seconds, so a transient outage does not block a host for the life of the process.
+- Concurrent checks for the same host share a single fetch (single-flight).
+- robots.txt bodies can optionally be persisted in the ResponseCache so new processes
+  skip the fetch entirely.
+- `prefetch` warms hosts in background threads so the first real check does not stall.
+
+Per RFC 9309, a 401/403 response disallows everything and other 4xx responses allow
+everything.
+"""
+from typing import Any, Dict, Iterable, Optional, Tuple
+import logging
+import threading
+import time
+import urllib.parse
+import urllib.robotparser
+
+from leet_apps.utils import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+_DENY = "deny"
+_ALLOW = "allow"
+
+
+class RobotsCache:
+    cache_namespace = "robots"
+
+    def __init__(self, ttl: float = 86400.0, negative_ttl: float = 300.0, transport: Any = None, cache: Any = None,
+                 timeout: float = 5.0, clock=time.time):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # Optional leet_apps.transport.HttpTransport and leet_apps.cache.ResponseCache
+        self.transport = transport
+        self.cache = cache
+        self.timeout = timeout
+        self._clock = clock
+        self._entries = {}  # host -> (RobotFileParser or None, expires_at)
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self._prefetching = set()
+        self._stats = {"hits": 0, "fetches": 0, "errors": 0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], transport: Any = None, cache: Any = None) -> "RobotsCache":
+        cfg = (config or {}).get("robots", {}) or {}
+        return cls(
+            ttl=cfg.get("ttl_seconds", 86400.0),
+            negative_ttl=cfg.get("negative_ttl_seconds", 300.0),
+            timeout=cfg.get("timeout_seconds", 5.0),
+            transport=transport,
+            cache=cache if cfg.get("persist", True) else None,
+        )
+
+    def allowed(self, url: str, user_agent: str = "*") -> bool:
+        """Return whether robots.txt for the URL's host permits fetching it."""
+        parsed = urllib.parse.urlparse(url)
+        if not parsed.netloc:
+            return False
+        parser = self._parser_for(parsed.scheme or "https", parsed.netloc)
+        if parser is None:
+            return False
+        return parser.can_fetch(user_agent, url)
+
+    def prefetch(self, urls: Iterable[str]):
+        """Start background fetches for the hosts of `urls` that are not cached or being prefetched yet."""
+        for url in urls:
+            parsed = urllib.parse.urlparse(url)
+            host = parsed.netloc
+            if not host or self._cached(host) is not None:
+                continue
+            with self._lock:
+                if host in self._prefetching:
+                    continue
+                self._prefetching.add(host)
+            threading.Thread(target=self._prefetch_host, args=(parsed.scheme or "https", host),
+                             name=f"robots-{host}", daemon=True).start()
+
+    def _prefetch_host(self, scheme: str, host: str):
+        try:
+            self._parser_for(scheme, host)
+        except Exception as e:
+            logger.warning("robots.txt prefetch for %s failed: %s", host, e)
+        finally:
+            with self._lock:
+                self._prefetching.discard(host)
+
+    def _cached(self, host: str) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            entry = self._entries.get(host)
+        if entry is not None and entry[1] > self._clock():
+            return entry
+        return None
+
+    def _parser_for(self, scheme: str, host: str) -> Optional[urllib.robotparser.RobotFileParser]:
+        entry = self._cached(host)
+        if entry is not None:
+            with self._lock:
+                self._stats["hits"] += 1
+            return entry[0]
+        return self._flight.do(host, self._load, scheme, host)
+
+    def _load(self, scheme: str, host: str) -> Optional[urllib.robotparser.RobotFileParser]:
+        # Another caller may have finished loading while we waited to become the leader
+        entry = self._cached(host)
+        if entry is not None:
+            return entry[0]
+
+        body, age = None, None
+        if self.cache is not None:
+            stored = self.cache.get(self.cache_namespace, host)
+            if stored is not None and stored[1] < self.ttl:
+                body, age = stored
+
+        if body is None:
+            body = self._fetch(scheme, host)
+            age = 0.0
+            if body is not None and self.cache is not None:
+                self.cache.set(self.cache_namespace, host, body)
+
+        if body is None:
+            parser, expires = None, self._clock() + self.negative_ttl
+        else:
+            parser, expires = self._build_parser(scheme, host, body), self._clock() + self.ttl - age
+        with self._lock:
+            self._entries[host] = (parser, expires)
+        return parser
+
+    def _fetch(self, scheme: str, host: str) -> Optional[str]:
+        """Fetch robots.txt; returns the body, an allow/deny marker, or None on failure."""
+        robots_url = f"{scheme}://{host}/robots.txt"
+        with self._lock:
+            self._stats["fetches"] += 1
+        try:
+            import requests
+
+            resp = (self.transport or requests).get(robots_url, timeout=self.timeout)
+        except Exception as e:
+            logger.warning("robots.txt fetch for %s failed: %s", host, e)
+            with self._lock:
+                self._stats["errors"] += 1
+            return None
+        if resp.status_code in (401, 403):
+            return _DENY
+        if 400 <= resp.status_code < 500:
+            return _ALLOW
+        if resp.status_code >= 500:
+            with self._lock:
+                self._stats["errors"] += 1
+            return None
+        return resp.text
+
+    @staticmethod
+    def _build_parser(scheme: str, host: str, body: str) -> urllib.robotparser.RobotFileParser:
+        parser = urllib.robotparser.RobotFileParser(f"{scheme}://{host}/robots.txt")
+        if body == _DENY:
+            parser.disallow_all = True
+        elif body == _ALLOW:
+            parser.allow_all = True
+        else:
+            parser.parse(body.splitlines())
+        return parser
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            out = dict(self._stats)
+            out["hosts"] = len(self._entries)
+        return out
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
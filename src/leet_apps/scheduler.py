@@ -0,0 +1,349 @@
+"""
+Scheduled refresh daemon.
+
+RefreshScheduler keeps every tracked fund in a heap ordered by when it is next due. A fund's
+due time is `last_refreshed + interval / importance`, so a fund with importance 2 is
+refreshed twice as often, and among overdue funds the stalest (relative to its importance)
+goes first. Due funds are handed to the orchestrator in batches (`run_many`, sharing its
+worker pool and transport); each result is passed to `on_result` and the fund is rescheduled.
+Failed or partial refreshes are retried with exponential backoff (`retry_base_seconds`,
+capped at the fund's interval).
+
+Per-source budgets: before each batch the scheduler checks the remaining call quota of every
+host in `reserve_calls` on the orchestrator's rate limiter and only dispatches as many funds
+as fit while keeping that many calls in reserve (for interactive runs). A fund is assumed
+to cost, per host, the page budget (`max_pages`) of the orchestrator's connectors whose
+`api_host` is that host, unless `calls_per_fund` overrides it. When a budget is spent the
+scheduler waits for the quota window to roll over instead of burning through it.
+
+State (funds, importance, last refresh, next due time, failures) is written atomically to
+`state_path` after every finished fund, so a restarted daemon resumes where it stopped;
+funds in flight at a crash are simply still due. `metrics()` reports queue depth, due
+count and refresh lag; `to_prometheus()` renders them for a textfile collector
+(`metrics_path`).
+
+    python -m leet_apps.cli schedule --add "Sequoia Capital" --importance 2
+    python -m leet_apps.cli schedule --run --output out_dir
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import heapq
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = "~/.cache/fund-tracker/scheduler.json"
+
+
+class RefreshScheduler:
+    def __init__(self, orchestrator: Any, state_path: Optional[str] = None, interval: float = 86400.0,
+                 batch_size: int = 8, poll_seconds: float = 30.0, reserve_calls: Dict[str, int] = None,
+                 calls_per_fund: Any = None, retry_base: float = 300.0, metrics_path: Optional[str] = None,
+                 on_result: Callable[[str, Dict[str, Any]], None] = None,
+                 clock: Callable[[], float] = time.time, sleep: Callable[[float], None] = time.sleep):
+        self.orchestrator = orchestrator
+        self.state_path = os.path.expanduser(state_path) if state_path else None
+        self.interval = interval
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        # host -> calls to leave unused in that host's quota
+        self.reserve_calls = dict(reserve_calls or {})
+        # Calls one refresh costs: an int for every host, host -> calls, or None to derive it
+        # from the connectors (see calls_for)
+        self.calls_per_fund = calls_per_fund
+        self.retry_base = retry_base
+        self.metrics_path = os.path.expanduser(metrics_path) if metrics_path else None
+        self.on_result = on_result
+        self._clock = clock
+        self._sleep = sleep
+        self._funds: Dict[str, Dict[str, Any]] = {}
+        self._heap: List[tuple] = []
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.refreshed = 0
+        self.failed = 0
+        self.budget_waits = 0
+        # Set by run_once when a spent source budget, not an empty queue, held back due funds
+        self._budget_blocked = False
+        if self.state_path:
+            self.load()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], orchestrator: Any, **overrides: Any) -> "RefreshScheduler":
+        cfg = (config or {}).get("scheduler", {}) or {}
+        options = {
+            "state_path": os.environ.get("FUND_TRACKER_SCHEDULER_STATE") or cfg.get("state_path", DEFAULT_STATE_PATH),
+            "interval": cfg.get("interval_seconds", 86400.0),
+            "batch_size": cfg.get("batch_size", 8),
+            "poll_seconds": cfg.get("poll_seconds", 30.0),
+            "reserve_calls": cfg.get("reserve_calls"),
+            "calls_per_fund": cfg.get("calls_per_fund"),
+            "retry_base": cfg.get("retry_base_seconds", 300.0),
+            "metrics_path": cfg.get("metrics_path"),
+        }
+        options.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(orchestrator, **options)
+
+    # -- queue ---------------------------------------------------------------------------
+
+    def _push(self, fund: str):
+        entry = self._funds[fund]
+        heapq.heappush(self._heap, (entry["next_due"], -entry["importance"], fund))
+
+    def add(self, fund: str, importance: float = 1.0, interval: Optional[float] = None, due: Optional[float] = None):
+        """Track a fund (or update its importance/interval). New funds are due immediately."""
+        if importance <= 0:
+            raise ValueError("importance must be positive")
+        with self._lock:
+            entry = self._funds.get(fund)
+            if entry is None:
+                entry = self._funds[fund] = {"importance": importance, "interval": interval, "last_refreshed": None,
+                                             "next_due": self._clock() if due is None else due, "failures": 0}
+            else:
+                entry["importance"], entry["interval"] = importance, interval
+                if due is not None:
+                    entry["next_due"] = due
+                elif entry["last_refreshed"] is not None and not entry["failures"]:
+                    entry["next_due"] = entry["last_refreshed"] + self._period(entry)
+            self._push(fund)
+        self.save()
+
+    def add_many(self, funds: Iterable[str], importance: float = 1.0):
+        for fund in funds:
+            self.add(fund, importance)
+
+    def remove(self, fund: str) -> bool:
+        # Heap entries of removed funds are skipped lazily when popped
+        with self._lock:
+            removed = self._funds.pop(fund, None) is not None
+        if removed:
+            self.save()
+        return removed
+
+    def funds(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {fund: dict(entry) for fund, entry in self._funds.items()}
+
+    def _period(self, entry: Dict[str, Any]) -> float:
+        return (entry["interval"] or self.interval) / entry["importance"]
+
+    def _pop_due(self, now: float, limit: int) -> List[str]:
+        batch = []
+        with self._lock:
+            while self._heap and len(batch) < limit:
+                due, neg_importance, fund = self._heap[0]
+                entry = self._funds.get(fund)
+                if entry is None or fund in self._in_flight or entry["next_due"] != due or -neg_importance != entry["importance"]:
+                    heapq.heappop(self._heap)  # stale entry (removed, rescheduled or re-prioritized)
+                    continue
+                if due > now:
+                    break
+                heapq.heappop(self._heap)
+                self._in_flight.add(fund)
+                batch.append(fund)
+        return batch
+
+    def next_due(self) -> Optional[float]:
+        with self._lock:
+            pending = [e["next_due"] for f, e in self._funds.items() if f not in self._in_flight]
+        return min(pending) if pending else None
+
+    # -- budgets -------------------------------------------------------------------------
+
+    def _rate_limiter(self):
+        transport = getattr(self.orchestrator, "transport", None)
+        return getattr(transport, "rate_limiter", None)
+
+    def calls_for(self, host: str) -> int:
+        """Most calls one fund refresh can spend on `host`."""
+        if isinstance(self.calls_per_fund, dict) and host in self.calls_per_fund:
+            return self.calls_per_fund[host]
+        if isinstance(self.calls_per_fund, int):
+            return self.calls_per_fund
+        # Derived: every page a connector calling this host may fetch for one fund
+        pages = [getattr(c, "max_pages", None) or 1 for c in getattr(self.orchestrator, "connectors", None) or []
+                 if getattr(c, "api_host", None) == host]
+        return sum(pages) or 1
+
+    def budget(self) -> Optional[int]:
+        """How many funds the per-source quotas allow right now (None: unlimited)."""
+        limiter = self._rate_limiter()
+        if limiter is None or not self.reserve_calls:
+            return None
+        allowed = None
+        for host, reserve in self.reserve_calls.items():
+            remaining = limiter.remaining_quota(f"https://{host}/")
+            if remaining is None:
+                continue
+            funds = max(remaining - reserve, 0) // max(self.calls_for(host), 1)
+            allowed = funds if allowed is None else min(allowed, funds)
+        return allowed
+
+    def budget_resets_in(self) -> Optional[float]:
+        """Seconds until the earliest quota window among spent budgets rolls over (None: unknown)."""
+        limiter = self._rate_limiter()
+        if limiter is None:
+            return None
+        resets = [limiter.quota_resets_in(f"https://{host}/") for host in self.reserve_calls]
+        resets = [r for r in resets if r]
+        return min(resets) if resets else None
+
+    # -- refresh -------------------------------------------------------------------------
+
+    def _reschedule(self, fund: str, ok: bool, now: float):
+        with self._lock:
+            self._in_flight.discard(fund)
+            entry = self._funds.get(fund)
+            if entry is None:
+                return
+            if ok:
+                entry["last_refreshed"] = now
+                entry["failures"] = 0
+                entry["next_due"] = now + self._period(entry)
+            else:
+                entry["failures"] += 1
+                entry["next_due"] = now + min(self.retry_base * 2 ** (entry["failures"] - 1), self._period(entry))
+            self._push(fund)
+
+    def run_once(self) -> int:
+        """Refresh one batch of due funds; returns how many were refreshed."""
+        now = self._clock()
+        limit = self.batch_size
+        budget = self.budget()
+        self._budget_blocked = False
+        if budget is not None:
+            if budget <= 0:
+                self.budget_waits += 1
+                self._budget_blocked = True
+                return 0
+            limit = min(limit, budget)
+        batch = self._pop_due(now, limit)
+        if not batch:
+            return 0
+        done = set()
+        try:
+            for fund, normalized in self.orchestrator.run_many(batch):
+                done.add(fund)
+                ok = not normalized.get("fund", {}).get("partial")
+                if ok and self.on_result is not None:
+                    try:
+                        self.on_result(fund, normalized)
+                    except Exception as e:
+                        logger.warning("Handling the refresh of %s failed: %s", fund, e)
+                        ok = False
+                self._record(fund, ok)
+        finally:
+            # Funds the orchestrator never returned (e.g. it raised) count as failures
+            for fund in batch:
+                if fund not in done:
+                    self._record(fund, False)
+            self.write_metrics()
+        return len(done)
+
+    def _record(self, fund: str, ok: bool):
+        if ok:
+            self.refreshed += 1
+        else:
+            self.failed += 1
+            logger.warning("Refresh of %s failed or was partial; retrying with backoff", fund)
+        self._reschedule(fund, ok, self._clock())
+        self.save()
+
+    def run_forever(self, max_cycles: Optional[int] = None):
+        """Refresh due funds until `stop()` is called (or after `max_cycles` batches)."""
+        cycles = 0
+        while not self._stop.is_set() and (max_cycles is None or cycles < max_cycles):
+            cycles += 1
+            if self.run_once():
+                continue
+            if self._budget_blocked:
+                # Funds may be overdue, but nothing can run until a quota window rolls over
+                resets_in = self.budget_resets_in()
+                wait = self.poll_seconds if resets_in is None else min(self.poll_seconds, resets_in)
+            else:
+                next_due = self.next_due()
+                wait = self.poll_seconds if next_due is None else min(self.poll_seconds, max(next_due - self._clock(), 0.0))
+            if wait > 0:
+                self._sleep(wait)
+
+    def stop(self):
+        self._stop.set()
+
+    # -- persistence ---------------------------------------------------------------------
+
+    def load(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        with open(self.state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        with self._lock:
+            self._funds = state.get("funds", {})
+            self._heap = []
+            for fund in self._funds:
+                self._push(fund)
+
+    def save(self):
+        if not self.state_path:
+            return
+        with self._lock:
+            state = {"version": 1, "funds": {fund: dict(entry) for fund, entry in self._funds.items()}}
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp = f"{self.state_path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        # Atomic replace so a crash mid-write never loses the schedule
+        os.replace(tmp, self.state_path)
+
+    # -- metrics -------------------------------------------------------------------------
+
+    def metrics(self) -> Dict[str, Any]:
+        now = self._clock()
+        with self._lock:
+            entries = list(self._funds.values())
+            in_flight = len(self._in_flight)
+        lags = [now - e["next_due"] for e in entries if e["next_due"] <= now]
+        staleness = [now - e["last_refreshed"] for e in entries if e["last_refreshed"] is not None]
+        return {
+            "queue_depth": len(entries),
+            "due": len(lags),
+            "in_flight": in_flight,
+            "max_lag_seconds": round(max(lags), 3) if lags else 0.0,
+            "mean_lag_seconds": round(sum(lags) / len(lags), 3) if lags else 0.0,
+            "max_staleness_seconds": round(max(staleness), 3) if staleness else None,
+            "never_refreshed": sum(1 for e in entries if e["last_refreshed"] is None),
+            "failing": sum(1 for e in entries if e["failures"]),
+            "refreshed_total": self.refreshed,
+            "failed_total": self.failed,
+            "budget_waits_total": self.budget_waits,
+            "budget_funds": self.budget(),
+        }
+
+    def to_prometheus(self) -> str:
+        m = self.metrics()
+        gauges = [("queue_depth", "Funds tracked by the scheduler"), ("due", "Funds past their due time"),
+                  ("in_flight", "Funds being refreshed"), ("max_lag_seconds", "Longest time a due fund has waited"),
+                  ("mean_lag_seconds", "Mean wait of due funds"), ("failing", "Funds whose last refresh failed")]
+        counters = [("refreshed_total", "Successful refreshes"), ("failed_total", "Failed or partial refreshes"),
+                    ("budget_waits_total", "Batches skipped because a source budget was spent")]
+        lines = []
+        for key, help_text in gauges:
+            lines += [f"# HELP fund_tracker_scheduler_{key} {help_text}.", f"# TYPE fund_tracker_scheduler_{key} gauge",
+                      f"fund_tracker_scheduler_{key} {m[key]}"]
+        for key, help_text in counters:
+            lines += [f"# HELP fund_tracker_scheduler_{key} {help_text}.", f"# TYPE fund_tracker_scheduler_{key} counter",
+                      f"fund_tracker_scheduler_{key} {m[key]}"]
+        return "\n".join(lines) + "\n"
+
+    def write_metrics(self):
+        """Write Prometheus metrics to `metrics_path` (node_exporter textfile collector style)."""
+        if not self.metrics_path:
+            return
+        os.makedirs(os.path.dirname(self.metrics_path) or ".", exist_ok=True)
+        tmp = self.metrics_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp, self.metrics_path)
@@ -0,0 +1,171 @@
+"""
+Local HTTP query API.
+
+A long-running ThreadingHTTPServer that keeps one orchestrator (connectors, response cache,
+robots cache, pooled transport and worker pool) warm between requests:
+
+    GET /funds/{name}/portfolio   normalized result (same JSON as the CLI); ?refresh=1 skips the result cache
+    GET /funds/{name}/summary     generate_summary of the result
+    GET /health                   {"status": "ok"}
+    GET /metrics                  Prometheus text: server counters, plus stage metrics when tracing is on
+
+Concurrent requests for the same fund are coalesced (SingleFlight): the first request runs
+`Orchestrator.run` and every request arriving while it is in flight waits for that result,
+so a dashboard with many viewers costs one set of upstream calls. Finished results are
+kept for `server.result_ttl_seconds` (0 disables this).
+
+    python -m leet_apps.cli serve --port 8080
+    curl localhost:8080/funds/Sequoia%20Capital/portfolio
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+import logging
+import threading
+import time
+
+from leet_apps.columnar import as_dict
+from leet_apps.utils import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class PortfolioAPI:
+    """Request handling independent of the HTTP layer (also used directly in tests)."""
+
+    def __init__(self, orchestrator: Any, result_ttl: float = 60.0, max_results: int = 256,
+                 clock: Callable[[], float] = time.monotonic):
+        self.orchestrator = orchestrator
+        self.result_ttl = result_ttl
+        self.max_results = max_results
+        self._clock = clock
+        self._flight = SingleFlight()
+        self._results: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.runs = 0
+        self.coalesced = 0
+        self.result_hits = 0
+        self.errors = 0
+
+    def _run(self, fund: str) -> Dict[str, Any]:
+        with self._lock:
+            self.runs += 1
+        result = as_dict(self.orchestrator.run(fund))
+        if self.result_ttl and not result.get("fund", {}).get("partial"):
+            with self._lock:
+                self._results.pop(fund, None)
+                self._results[fund] = (self._clock() + self.result_ttl, result)
+                while len(self._results) > self.max_results:
+                    # Oldest insertion first
+                    del self._results[next(iter(self._results))]
+        return result
+
+    def record_error(self):
+        with self._lock:
+            self.errors += 1
+
+    def portfolio(self, fund: str, refresh: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            self.requests += 1
+            cached = None if refresh else self._results.get(fund)
+            if cached is not None and cached[0] > self._clock():
+                self.result_hits += 1
+                return cached[1]
+        result, shared = self._flight.do(fund, self._run, fund, return_shared=True)
+        if shared:
+            with self._lock:
+                self.coalesced += 1
+        return result
+
+    def summary(self, fund: str, refresh: bool = False) -> Dict[str, Any]:
+        from leet_apps.exporter import generate_summary
+
+        return generate_summary(self.portfolio(fund, refresh))
+
+    def to_prometheus(self) -> str:
+        lines = []
+        for name, value, help_text in (
+                ("requests_total", self.requests, "Portfolio requests received"),
+                ("runs_total", self.runs, "Orchestrator runs started"),
+                ("coalesced_total", self.coalesced, "Requests served by another request's in-flight run"),
+                ("result_cache_hits_total", self.result_hits, "Requests served from the result cache"),
+                ("errors_total", self.errors, "Requests that failed")):
+            lines += [f"# HELP fund_tracker_server_{name} {help_text}.", f"# TYPE fund_tracker_server_{name} counter",
+                      f"fund_tracker_server_{name} {value}"]
+        lines += ["# HELP fund_tracker_server_in_flight Funds with an orchestrator run in progress.",
+                  "# TYPE fund_tracker_server_in_flight gauge", f"fund_tracker_server_in_flight {self._flight.in_flight()}"]
+        text = "\n".join(lines) + "\n"
+
+        from leet_apps.instrumentation import get_tracer
+
+        tracer = get_tracer()
+        return text + tracer.to_prometheus() if tracer.enabled else text
+
+
+def _handler(api: PortfolioAPI):
+    from leet_apps.exporter import json_dumps
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            segments = [unquote(s) for s in parts.path.strip("/").split("/")]
+            refresh = (parse_qs(parts.query).get("refresh") or ["0"])[0] not in ("0", "false", "")
+            try:
+                if segments == ["health"]:
+                    return self._json(200, {"status": "ok"})
+                if segments == ["metrics"]:
+                    return self._send(200, api.to_prometheus().encode("utf-8"), "text/plain; version=0.0.4")
+                if len(segments) == 3 and segments[0] == "funds" and segments[1]:
+                    if segments[2] == "portfolio":
+                        return self._json(200, api.portfolio(segments[1], refresh))
+                    if segments[2] == "summary":
+                        return self._json(200, api.summary(segments[1], refresh))
+                return self._json(404, {"error": f"no route for {parts.path}"})
+            except Exception as e:
+                api.record_error()
+                logger.exception("Request %s failed", self.path)
+                return self._json(500, {"error": str(e)})
+
+        def _json(self, status: int, obj: Any):
+            self._send(status, json_dumps(obj).encode("utf-8"), "application/json")
+
+        def _send(self, status: int, body: bytes, content_type: str):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            logger.info("%s - %s", self.address_string(), fmt % args)
+
+    return Handler
+
+
+def make_server(api: PortfolioAPI, host: str = "127.0.0.1", port: int = 8080) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), _handler(api))
+    server.daemon_threads = True
+    return server
+
+
+def serve(orchestrator: Any, host: str = "127.0.0.1", port: int = 8080, result_ttl: float = 60.0, max_results: int = 256):
+    """Serve the API until interrupted; the orchestrator is closed on exit."""
+    api = PortfolioAPI(orchestrator, result_ttl=result_ttl, max_results=max_results)
+    server = make_server(api, host, port)
+    logger.info("Serving on http://%s:%s", *server.server_address[:2])
+    try:
+        with orchestrator:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def serve_from_config(config: Dict[str, Any], orchestrator: Any, host: Optional[str] = None, port: Optional[int] = None):
+    cfg = (config or {}).get("server", {}) or {}
+    serve(orchestrator, host=host or cfg.get("host", "127.0.0.1"), port=port if port is not None else cfg.get("port", 8080),
+          result_ttl=cfg.get("result_ttl_seconds", 60.0), max_results=cfg.get("max_results", 256))
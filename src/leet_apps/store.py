@@ -0,0 +1,287 @@
+"""
+Local portfolio store (storage layer, optional DB).
+
+PortfolioStore keeps normalized results in an embedded SQLite database so questions like
+"which funds invested in Acme?" or "all Series B rounds in 2019" are answered from indexed
+tables instead of re-running the connectors.
+
+Tables:
+- funds: one row per saved fund result
+- companies: one row per company across all funds, keyed by canonical name (see
+  leet_apps.entity_resolution.canonicalize_name) and indexed by name key and domain
+- investments: one row per (fund, company), indexed by fund, company, date and round
+- co_investors: one row per co-investor of a (fund, company) investment, indexed by
+  canonical name
+
+Saving a fund replaces its previous investments, so re-saving a refreshed result is safe.
+"""
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from leet_apps.entity_resolution import canonicalize_name, domain_key
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS funds (
+    id TEXT PRIMARY KEY,
+    saved_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS companies (
+    key TEXT PRIMARY KEY,
+    id TEXT,
+    name TEXT,
+    domain TEXT,
+    website TEXT,
+    industry TEXT,
+    hq TEXT,
+    founding_date TEXT,
+    description TEXT,
+    status TEXT,
+    source_links TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_companies_domain ON companies (domain);
+CREATE TABLE IF NOT EXISTS investments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fund_id TEXT NOT NULL REFERENCES funds (id),
+    company_key TEXT NOT NULL REFERENCES companies (key),
+    round_type TEXT COLLATE NOCASE,
+    date TEXT,
+    amount TEXT,
+    amount_value REAL,
+    amount_currency TEXT,
+    investor_role TEXT,
+    confidence REAL,
+    source_links TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_investments_fund ON investments (fund_id, company_key);
+CREATE INDEX IF NOT EXISTS idx_investments_company ON investments (company_key);
+CREATE INDEX IF NOT EXISTS idx_investments_date ON investments (date);
+CREATE INDEX IF NOT EXISTS idx_investments_round_date ON investments (round_type, date);
+CREATE TABLE IF NOT EXISTS co_investors (
+    fund_id TEXT NOT NULL,
+    company_key TEXT NOT NULL,
+    investor TEXT NOT NULL,
+    investor_key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_co_investors_key ON co_investors (investor_key);
+CREATE INDEX IF NOT EXISTS idx_co_investors_investment ON co_investors (fund_id, company_key);
+"""
+
+_INVESTMENT_COLUMNS = """
+    i.fund_id, c.id AS company_id, c.name AS company_name, c.website, c.industry, i.round_type, i.date,
+    i.amount, i.amount_value, i.amount_currency, i.investor_role, i.confidence,
+    (SELECT json_group_array(ci.investor) FROM co_investors ci
+     WHERE ci.fund_id = i.fund_id AND ci.company_key = i.company_key) AS co_investors
+"""
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value) if isinstance(value, (list, dict)) else str(value)
+
+
+def company_key(company: Dict[str, Any]) -> Optional[str]:
+    """Store key of a normalized company: canonical name, else domain, else its id."""
+    return canonicalize_name(company.get("name")) or domain_key(company.get("website")) or _text(company.get("id"))
+
+
+class PortfolioStore:
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            # WAL keeps readers (query) unblocked while a run saves, and makes each commit a cheap append
+            self._db.execute("PRAGMA journal_mode = WAL")
+            self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], path: str = None) -> "PortfolioStore":
+        cfg = (config or {}).get("store", {}) or {}
+        path = path or os.environ.get("FUND_TRACKER_STORE_PATH") or cfg.get("path", "~/.cache/fund-tracker/portfolio.sqlite")
+        return cls(os.path.expanduser(path))
+
+    def save_result(self, normalized: Dict[str, Any]) -> int:
+        """Store one normalized result (dict or ColumnarResult), replacing the fund's previous
+        investments. Returns the number of investments saved."""
+        fund_id = _text((normalized.get("fund") or {}).get("id"))
+        keys_by_id = {}
+        company_rows = []
+        for company in normalized.get("companies") or []:
+            key = company_key(company)
+            if not key:
+                continue
+            keys_by_id[company.get("id")] = key
+            company_rows.append((
+                key, _text(company.get("id")), _text(company.get("name")), domain_key(company.get("website")),
+                _text(company.get("website")), _text(company.get("industry")), _text(company.get("hq")),
+                _text(company.get("founding_date")), _text(company.get("description")), _text(company.get("status")),
+                json.dumps(company.get("source_links") or []),
+            ))
+
+        orphan_rows, investment_rows, co_investor_rows = [], [], []
+        for inv in normalized.get("investments") or []:
+            company_id = inv.get("company_id")
+            key = keys_by_id.get(company_id) or canonicalize_name(_text(company_id))
+            if not key:
+                continue
+            if company_id not in keys_by_id:
+                # Investment without a matching company record: keep a minimal company row
+                orphan_rows.append((key, _text(company_id), _text(company_id)))
+            investment_rows.append((
+                fund_id, key, _text(inv.get("round_type")), _text(inv.get("date")), _text(inv.get("amount")),
+                inv.get("amount_value"), _text(inv.get("amount_currency")), _text(inv.get("investor_role")),
+                inv.get("confidence"), json.dumps(inv.get("source_links") or []),
+            ))
+            co_investor_rows.extend((fund_id, key, _text(name), canonicalize_name(_text(name)))
+                                    for name in inv.get("co_investors") or [] if name)
+
+        with self._lock, self._db:
+            db = self._db
+            db.execute("INSERT INTO funds (id, saved_at) VALUES (?, ?) ON CONFLICT (id) DO UPDATE SET saved_at = excluded.saved_at",
+                       (fund_id, time.time()))
+            db.execute("DELETE FROM investments WHERE fund_id = ?", (fund_id,))
+            db.execute("DELETE FROM co_investors WHERE fund_id = ?", (fund_id,))
+            # Upsert: the first saved id/name stays the display identity; other fields take the
+            # newest non-null value
+            db.executemany(
+                """INSERT INTO companies (key, id, name, domain, website, industry, hq, founding_date, description, status, source_links)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (key) DO UPDATE SET
+                       name = coalesce(name, excluded.name), domain = coalesce(excluded.domain, domain),
+                       website = coalesce(excluded.website, website), industry = coalesce(excluded.industry, industry),
+                       hq = coalesce(excluded.hq, hq), founding_date = coalesce(excluded.founding_date, founding_date),
+                       description = coalesce(excluded.description, description), status = coalesce(excluded.status, status),
+                       source_links = coalesce(excluded.source_links, source_links)""",
+                company_rows,
+            )
+            db.executemany("INSERT OR IGNORE INTO companies (key, id, name) VALUES (?, ?, ?)", orphan_rows)
+            db.executemany(
+                """INSERT INTO investments (fund_id, company_key, round_type, date, amount, amount_value, amount_currency,
+                                            investor_role, confidence, source_links)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                investment_rows,
+            )
+            db.executemany("INSERT INTO co_investors (fund_id, company_key, investor, investor_key) VALUES (?, ?, ?, ?)",
+                           co_investor_rows)
+        return len(investment_rows)
+
+    def _rows(self, sql: str, params: List[Any]) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._db.execute(sql, params)]
+
+    def _company_keys(self, company: str) -> List[str]:
+        # Match by canonical name first, then by website domain ("acme.com", "https://www.acme.com")
+        key = canonicalize_name(company)
+        rows = self._rows("SELECT key FROM companies WHERE key = ?", [key]) if key else []
+        if not rows:
+            dom = domain_key(company) if "." in company else None
+            rows = self._rows("SELECT key FROM companies WHERE domain = ?", [dom]) if dom else []
+        return [r["key"] for r in rows]
+
+    def funds_for_company(self, company: str) -> List[Dict[str, Any]]:
+        """Which funds invested in `company` (name or website), with their rounds."""
+        return self.find_investments(company=company)
+
+    def find_investments(self, fund_id: str = None, company: str = None, round_type: str = None, year: int = None,
+                         date_from: str = None, date_to: str = None, co_investor: str = None,
+                         limit: int = None) -> List[Dict[str, Any]]:
+        """Investments matching all given filters, newest first.
+
+        `round_type` is case-insensitive; `year` / `date_from` / `date_to` (YYYY-MM-DD,
+        inclusive) filter on the normalized investment date; `co_investor` matches by
+        canonical name.
+        """
+        where, params = [], []
+        if fund_id is not None:
+            where.append("i.fund_id = ?")
+            params.append(fund_id)
+        if company is not None:
+            keys = self._company_keys(company)
+            if not keys:
+                return []
+            where.append(f"i.company_key IN ({', '.join('?' * len(keys))})")
+            params.extend(keys)
+        if round_type is not None:
+            where.append("i.round_type = ?")
+            params.append(round_type)
+        if year is not None:
+            # Range on the indexed date column rather than a function of it
+            where.append("i.date >= ? AND i.date < ?")
+            params.extend([f"{int(year):04d}-01-01", f"{int(year) + 1:04d}-01-01"])
+        if date_from is not None:
+            where.append("i.date >= ?")
+            params.append(date_from)
+        if date_to is not None:
+            where.append("i.date <= ?")
+            params.append(date_to)
+        if co_investor is not None:
+            where.append("(i.fund_id, i.company_key) IN (SELECT fund_id, company_key FROM co_investors WHERE investor_key = ?)")
+            params.append(canonicalize_name(co_investor))
+        sql = f"SELECT {_INVESTMENT_COLUMNS} FROM investments i JOIN companies c ON c.key = i.company_key"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY i.date DESC, i.id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        rows = self._rows(sql, params)
+        for row in rows:
+            row["co_investors"] = json.loads(row["co_investors"])
+        return rows
+
+    def companies_for_fund(self, fund_id: str) -> List[Dict[str, Any]]:
+        rows = self._rows(
+            """SELECT DISTINCT c.id, c.name, c.website, c.industry, c.hq, c.founding_date, c.description, c.status, c.source_links
+               FROM investments i JOIN companies c ON c.key = i.company_key WHERE i.fund_id = ? ORDER BY c.name""",
+            [fund_id],
+        )
+        for row in rows:
+            row["source_links"] = json.loads(row["source_links"]) if row["source_links"] else []
+        return rows
+
+    def funds(self) -> List[Dict[str, Any]]:
+        return self._rows(
+            """SELECT f.id, f.saved_at, count(i.id) AS investments FROM funds f LEFT JOIN investments i ON i.fund_id = f.id
+               GROUP BY f.id ORDER BY f.id""",
+            [],
+        )
+
+    def iter_investment_edges(self, batch_size: int = 1000) -> Iterator[Tuple[str, str, str]]:
+        """Yield (investor, company key, company name) for every saved investment.
+
+        Investors are the fund of each investment plus each of its co-investors, which is
+        what leet_apps.graph needs to build the co-investment graph.
+        """
+        with self._lock:
+            cursor = self._db.execute(
+                """SELECT i.fund_id, i.company_key, c.name FROM investments i JOIN companies c ON c.key = i.company_key
+                   UNION ALL
+                   SELECT ci.investor, ci.company_key, c.name FROM co_investors ci JOIN companies c ON c.key = ci.company_key"""
+            )
+        while True:
+            with self._lock:
+                batch = cursor.fetchmany(batch_size)
+            if not batch:
+                return
+            for row in batch:
+                yield tuple(row)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
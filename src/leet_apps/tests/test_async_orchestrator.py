@@ -0,0 +1,67 @@
+import asyncio
+
+from leet_apps.async_orchestrator import AsyncOrchestrator
+
+
+class _SyncConnector:
+    def find_portfolio(self, fund_input):
+        return [{"company_name": "Sync Co", "investment": {}, "source_links": []}]
+
+
+class _AsyncConnector:
+    async def afind_portfolio(self, fund_input):
+        await asyncio.sleep(0)
+        return [{"company_name": "Async Co", "investment": {}, "source_links": []}]
+
+
+def test_async_orchestrator_mixes_sync_and_async_connectors():
+    orch = AsyncOrchestrator(connectors=[_AsyncConnector(), _SyncConnector()], max_concurrency=2)
+    with orch:
+        results = dict(orch.run_many_sync(["Fund A", "Fund B"]))
+        single = asyncio.run(orch.arun("Fund C"))
+    assert set(results) == {"Fund A", "Fund B"}
+    for res in list(results.values()) + [single]:
+        assert [c["name"] for c in res["companies"]] == ["Async Co", "Sync Co"]
+    assert single["fund"]["id"] == "Fund C"
+
+
+def test_async_fund_deadline_starts_when_fund_starts():
+    import time
+
+    class Slow:
+        def find_portfolio(self, fund_input):
+            time.sleep(0.5)
+            return [{"company_name": f"Co {fund_input}"}]
+
+    # One worker: funds run one after another, so later funds are queued well past the deadline
+    with AsyncOrchestrator(connectors=[Slow()], max_workers=1) as orch:
+        orch.fund_deadline, orch.connector_deadlines = 1.0, {"Slow": 0.8}
+        results = dict(orch.run_many_sync(["a", "b", "c", "d"]))
+    assert set(results) == {"a", "b", "c", "d"}
+    for fund, res in results.items():
+        assert not res["fund"].get("partial"), res["fund"]
+        assert [c["name"] for c in res["companies"]] == [f"Co {fund}"]
+
+
+def test_async_fund_deadline_drops_connectors_still_queued():
+    import threading
+    import time
+
+    release = threading.Event()
+
+    class Slow:
+        def find_portfolio(self, fund_input):
+            release.wait(2)
+            return [{"company_name": "Late Co"}]
+
+    orch = AsyncOrchestrator(connectors=[Slow(), _SyncConnector()], max_workers=1)
+    orch.fund_deadline, orch.connector_deadlines = 0.3, {}
+    try:
+        start = time.monotonic()
+        res = asyncio.run(orch.arun("Fund A"))
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
+        orch.close()
+    assert elapsed < 1.0
+    assert res["fund"]["partial"] and res["fund"]["timed_out_sources"] == ["Slow", "_SyncConnector"]
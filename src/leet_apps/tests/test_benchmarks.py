@@ -0,0 +1,38 @@
+import requests
+
+from leet_apps.benchmarks import suite
+from leet_apps.benchmarks.standins import LocalTransport, StandInServer, SyntheticUniverse
+
+
+def test_standin_serves_connector_shapes():
+    universe = SyntheticUniverse(n_companies=50)
+    with StandInServer(universe, portfolio_size=10) as server:
+        transport = LocalTransport(server.base_url)
+        resp = transport.get("https://api.crunchbase.com/v3.1/odm-organizations", params={"query": "fund-1"})
+        items = resp.json()["data"]["items"]
+        assert [i["properties"]["name"] for i in items] == [c["name"] for c in universe.portfolio("fund-1", 10)]
+        assert len(transport.get("https://newsapi.org/v2/everything", params={"q": "fund-1"}).json()["articles"]) == 10
+        assert "<li>" in requests.get(server.fund_url("fund-1"), timeout=5).text
+        transport.close()
+
+
+def test_standin_error_rate():
+    with StandInServer(SyntheticUniverse(n_companies=5), error_rate=1.0) as server:
+        assert requests.get(server.fund_url("x"), timeout=5).status_code == 503
+        assert server.errors == 1
+
+
+def test_suite_run_and_compare():
+    results = suite.run(funds=2, portfolio=20, records=200, latency=0.0, jitter=0.0)
+    stages = results["stages"]
+    assert stages["orchestrator"]["items"] == 2 and stages["orchestrator"]["companies"] > 0
+    assert stages["dedupe"]["unique"] < 200
+    for name in ("normalize", "normalize_columnar", "summary", "export_json", "export_jsonl", "export_csv"):
+        assert stages[name]["seconds"] >= 0
+    assert stages["orchestrator"]["fund_samples"] == 3 and stages["orchestrator"]["fund_seconds_max"] > 0
+    assert results["targets"]["medium_fund"]["met"]
+
+    baseline = {"stages": {"dedupe": {"seconds": stages["dedupe"]["seconds"] / 10}}}
+    regressions = suite.compare(results, baseline, tolerance=0.2)
+    assert [r["stage"] for r in regressions] == ["dedupe"]
+    assert suite.compare(results, results) == []
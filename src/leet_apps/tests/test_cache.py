@@ -0,0 +1,105 @@
+from leet_apps.cache import ResponseCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_ttl_and_hit_miss_counters():
+    clock = _Clock()
+    cache = ResponseCache(ttls={"crunchbase": 10}, clock=clock)
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    assert cache.get_or_fetch("crunchbase", "Sequoia  Capital", fetch) == {"n": 1}
+    # normalized query hits the same entry
+    assert cache.get_or_fetch("crunchbase", "sequoia capital", fetch) == {"n": 1}
+    clock.now += 11
+    assert cache.get_or_fetch("crunchbase", "sequoia capital", fetch) == {"n": 2}
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
+
+
+def test_cache_evicts_least_recently_used():
+    clock = _Clock()
+    cache = ResponseCache(max_entries=2, clock=clock)
+    cache.set("news", "a", 1)
+    clock.now += 1
+    cache.set("news", "b", 2)
+    clock.now += 1
+    cache.get("news", "a")
+    clock.now += 1
+    cache.set("news", "c", 3)
+    assert cache.get("news", "b") is None
+    assert cache.get("news", "a")[0] == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_limit_holds_across_processes_sharing_the_file(tmp_path):
+    # Two instances on one file stand in for the CLI, scheduler and server processes
+    path = str(tmp_path / "responses.sqlite")
+    clock = _Clock()
+    first, second = ResponseCache(path, max_entries=3, clock=clock), ResponseCache(path, max_entries=3, clock=clock)
+    for i in range(4):
+        clock.now += 1
+        (first if i % 2 else second).set("news", f"q{i}", i)
+    assert first.stats()["entries"] == second.stats()["entries"] == 3
+    assert first.get("news", "q0") is None and second.get("news", "q3")[0] == 3
+    first.close()
+    second.close()
+
+
+def test_cache_stale_while_revalidate():
+    clock = _Clock()
+    cache = ResponseCache(default_ttl=10, stale_ttl=100, clock=clock)
+    cache.set("news", "q", "old")
+    clock.now += 50
+    assert cache.get_or_fetch("news", "q", lambda: "new") == "old"
+    for t in list(__import__("threading").enumerate()):
+        if t.name.startswith("cache-refresh"):
+            t.join()
+    assert cache.get("news", "q")[0] == "new"
+    assert cache.stats()["stale_hits"] == 1
+
+
+def test_crunchbase_call_api_uses_cache(monkeypatch):
+    from leet_apps.connectors import crunchbase
+
+    class _Resp:
+        status_code = 200
+
+        def json(self):
+            return {"data": {"items": [{"properties": {"name": "Acme"}}]}}
+
+    calls = []
+    monkeypatch.setattr(crunchbase.requests, "get", lambda *a, **k: calls.append(1) or _Resp())
+    conn = crunchbase.CrunchbaseConnector(api_key="k", cache=ResponseCache())
+    assert conn.find_portfolio("Fund") == conn.find_portfolio("fund")
+    assert len(calls) == 1
+
+
+def test_cache_conditional_revalidation_keeps_body_on_304():
+    from leet_apps.cache import NOT_MODIFIED
+
+    clock = _Clock()
+    cache = ResponseCache(default_ttl=10, clock=clock)
+    seen = []
+
+    def fetch(validators):
+        seen.append(validators)
+        return NOT_MODIFIED if validators else ({"body": 1}, {"etag": '"v1"'})
+
+    assert cache.get_or_fetch("news", "q", fetch, conditional=True) == {"body": 1}
+    clock.now += 11
+    assert cache.get_or_fetch("news", "q", fetch, conditional=True) == {"body": 1}
+    assert seen == [{}, {"etag": '"v1"'}]
+    assert cache.stats()["revalidated"] == 1
+    # revalidation resets the entry's age
+    assert cache.get("news", "q")[1] == 0
@@ -45,3 +45,55 @@ def test_cli_writes_csv_files(tmp_path):
         assert open(inv).read()
     finally:
         sys.argv = sys_argv_backup
+
+
+def test_cli_funds_file_batch(tmp_path):
+    from leet_apps.cli import main
+    from leet_apps.utils import fund_slug
+    funds = tmp_path / "funds.txt"
+    funds.write_text("Sequoia Capital\n\n# comment\nAccel Partners\n")
+    out_dir = tmp_path / "batch"
+    main(["--funds-file", str(funds), "--output", str(out_dir), "--format", "json"])
+    assert (out_dir / (fund_slug("Sequoia Capital") + ".json")).exists()
+    content = json.loads((out_dir / (fund_slug("Accel Partners") + ".json")).read_text())
+    assert content["fund"]["id"] == "Accel Partners"
+
+
+def test_fund_slug_keeps_distinct_funds_apart():
+    from leet_apps.utils import fund_slug
+
+    inputs = ["Fund/A", "Fund: A", "Fund A", "红杉中国", "高瓴资本", "https://a.com/x", "https://a.com/x/"]
+    slugs = [fund_slug(f) for f in inputs]
+    assert len(set(slugs)) == len(inputs)
+    assert slugs[2].startswith("Fund_A-") and slugs[3].startswith("fund-")
+    assert fund_slug("Fund A") == slugs[2]
+
+
+def test_cli_stream_writes_jsonl(tmp_path):
+    from leet_apps.cli import main
+
+    p = tmp_path / "out"
+    main(["--fund", "Sequoia Capital", "--output", str(p), "--stream", "--no-cache"])
+    events = [json.loads(line) for line in (tmp_path / "out.jsonl").read_text().splitlines()]
+    assert events[-1]["op"] == "end"
+    upserted = {e["company"]["id"] for e in events if e["op"] == "upsert"}
+    assert "Acme Robotics" in upserted
+
+
+def test_cli_import_stays_lazy():
+    from leet_apps.benchmarks.startup import heavy_imports
+
+    # Connector dependencies (requests, bs4), yaml and the process pool load only when a run needs them
+    assert heavy_imports() == []
+
+
+def test_cli_connectors_flag(tmp_path):
+    import pytest
+    from leet_apps.cli import main, parse_args
+
+    p = tmp_path / "out"
+    main(["--fund", "Sequoia Capital", "--output", str(p), "--no-cache", "--connectors", "pitchbook,linkedin"])
+    names = [c["name"] for c in json.loads(p.with_suffix(".json").read_text())["companies"]]
+    assert "Epsilon Energy" in names and "Acme Robotics" not in names
+    with pytest.raises(SystemExit):
+        parse_args(["--fund", "x", "--connectors", "crunchbase,nope"])
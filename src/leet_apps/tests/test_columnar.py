@@ -0,0 +1,69 @@
+import json
+import tracemalloc
+
+from leet_apps.columnar import ColumnarResult
+from leet_apps.exporter import export_csv, export_json, generate_summary
+from leet_apps.normalizer import normalize_results, normalize_results_columnar
+
+
+def _raw(n):
+    return [
+        {
+            "company_name": f"Company {i}",
+            "website": f"https://company{i}.example" if i % 3 else None,
+            "industry": ["Robotics", "Fintech", None][i % 3],
+            "hq": "San Francisco, CA",
+            "founding_date": "2015-06-01",
+            "status": "active",
+            "source_links": [f"https://crunchbase.com/org/company-{i}"],
+            "investment": {
+                "round_type": "Series A" if i % 2 else "Seed",
+                "date": "2018-09-12",
+                "amount": "$5,000,000" if i % 4 else None,
+                "co_investors": ["Sequoia Capital", "Accel"][: i % 3],
+                "source_links": ["https://example.com/article1"],
+            },
+        }
+        for i in range(n)
+    ]
+
+
+def test_columnar_rows_match_dict_form():
+    raw = _raw(12)
+    expected = normalize_results(raw, "f1")
+    result = normalize_results_columnar(raw, "f1")
+    assert result.to_dict() == expected
+    assert result["companies"][-1] == expected["companies"][-1]
+    assert ColumnarResult.from_dict(expected).to_dict() == expected
+    assert generate_summary(result) == generate_summary(expected)
+    assert result.companies.column("industry").counts() == {"Robotics": 4, "Fintech": 4, None: 4}
+
+
+def test_exporters_produce_identical_files(tmp_path):
+    raw = _raw(7)
+    as_dicts, as_columns = normalize_results(raw, "f1"), normalize_results_columnar(raw, "f1")
+    export_json(as_dicts, str(tmp_path / "a.json"))
+    export_json(as_columns, str(tmp_path / "b.json"))
+    assert (tmp_path / "a.json").read_text() == (tmp_path / "b.json").read_text()
+    export_json(normalize_results_columnar([], "f1"), str(tmp_path / "empty.json"))
+    assert json.loads((tmp_path / "empty.json").read_text())["companies"] == []
+
+    export_csv(as_dicts, str(tmp_path / "a"))
+    export_csv(as_columns, str(tmp_path / "b"))
+    for suffix in ("_companies.csv", "_investments.csv"):
+        assert (tmp_path / f"a{suffix}").read_text() == (tmp_path / f"b{suffix}").read_text()
+
+
+def test_columnar_result_is_smaller():
+    raw = _raw(5000)
+
+    def measure(build):
+        tracemalloc.start()
+        result = build(raw, "f1")
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return result, size
+
+    _, dict_size = measure(normalize_results)
+    _, columnar_size = measure(normalize_results_columnar)
+    assert columnar_size * 3 < dict_size
@@ -14,3 +14,103 @@ def test_crunchbase_connector_stub_basic():
     inv = first.get("investment", {})
     for ik in ["round_type", "date", "amount", "co_investors", "source_links"]:
         assert ik in inv
+
+
+class PagedTransport:
+    """Serves `pages` pages of 2 items each, page-numbered or by after_id cursor."""
+
+    def __init__(self, pages, cursor=False, gate=None):
+        self.pages = pages
+        self.cursor = cursor
+        self.gate = gate
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        import threading
+
+        self.requests.append(dict(params))
+        if self.cursor:
+            page = int(params.get("after_id", "c0")[1:]) + 1
+        else:
+            page = params.get("page", 1)
+        if page > 1 and self.gate is not None:
+            assert self.gate.wait(5)
+        items = [{"properties": {"name": f"Company {page}-{i}", "uuid": f"u{page}-{i}"}} for i in range(2)]
+        paging = {"after_id": f"c{page}"} if self.cursor and page < self.pages else {}
+        if not self.cursor:
+            paging = {"number_of_pages": self.pages, "current_page": page}
+        resp = type("Resp", (), {"status_code": 200, "headers": {}, "text": ""})()
+        resp.json = lambda: {"data": {"paging": paging, "items": items}}
+        return resp
+
+    def source_available(self, url):
+        return True
+
+
+def _names(records):
+    return [r["company_name"] for r in records]
+
+
+def test_crunchbase_fetches_numbered_pages_concurrently_in_order():
+    transport = PagedTransport(pages=5)
+    connector = CrunchbaseConnector(api_key="k", transport=transport, page_concurrency=3, page_size=2)
+    names = _names(connector.find_portfolio("Big Fund"))
+    assert names == [f"Company {p}-{i}" for p in range(1, 6) for i in range(2)]
+    assert sorted(r.get("page", 1) for r in transport.requests) == [1, 2, 3, 4, 5]
+    assert all(r["items_per_page"] == 2 for r in transport.requests)
+
+
+def test_crunchbase_page_budget_and_cursor_paging():
+    import pytest
+    from leet_apps.resilience import IncompleteResult
+
+    transport = PagedTransport(pages=10, cursor=True)
+    connector = CrunchbaseConnector(api_key="k", transport=transport, max_pages=3)
+    # A listing cut short by the page budget is flagged, carrying the records fetched so far
+    with pytest.raises(IncompleteResult) as exc:
+        connector.find_portfolio("Big Fund")
+    assert _names(exc.value.records) == [f"Company {p}-{i}" for p in range(1, 4) for i in range(2)]
+    assert [r.get("after_id") for r in transport.requests] == [None, "c1", "c2"]
+
+    numbered = PagedTransport(pages=10)
+    with pytest.raises(IncompleteResult) as exc:
+        CrunchbaseConnector(api_key="k", transport=numbered, max_pages=4).find_portfolio("F")
+    assert len(exc.value.records) == 8
+    assert len(CrunchbaseConnector(api_key="k", transport=PagedTransport(pages=4, cursor=True), max_pages=4)
+               .find_portfolio("F")) == 8
+
+
+class FailingPageTransport(PagedTransport):
+    def get(self, url, params=None, **kwargs):
+        if (params or {}).get("page") == 3:
+            raise RuntimeError("page 3 unavailable")
+        return super().get(url, params=params, **kwargs)
+
+
+def test_truncated_listing_marks_fund_partial_and_keeps_snapshot(tmp_path):
+    from leet_apps.incremental import IncrementalOrchestrator, SnapshotStore
+
+    store = SnapshotStore(str(tmp_path))
+    full = CrunchbaseConnector(api_key="k", transport=PagedTransport(pages=3), max_retries=0)
+    with IncrementalOrchestrator(connectors=[full], store=store) as orch:
+        assert len(orch.run("Big Fund")["companies"]) == 6
+
+    broken = CrunchbaseConnector(api_key="k", transport=FailingPageTransport(pages=3), max_retries=0)
+    with IncrementalOrchestrator(connectors=[broken], store=store) as orch:
+        res = orch.run("Big Fund")
+    assert res["fund"]["partial"] and res["fund"]["incomplete_sources"] == ["CrunchbaseConnector"]
+    # Page 2 still arrived; the missing page is not reported as removed companies
+    assert len(res["companies"]) == 4 and res["changes"]["removed"] == []
+    assert len(store.load("Big Fund")["records"]) == 6
+
+
+def test_crunchbase_yields_first_page_before_later_pages_arrive():
+    import threading
+
+    gate = threading.Event()
+    connector = CrunchbaseConnector(api_key="k", transport=PagedTransport(pages=3, gate=gate))
+    records = connector.iter_portfolio("Big Fund")
+    assert next(records)["company_name"] == "Company 1-0"
+    assert next(records)["company_name"] == "Company 1-1"
+    gate.set()
+    assert len(list(records)) == 4
@@ -0,0 +1,40 @@
+from leet_apps.entity_resolution import canonicalize_name, domain_key, resolve_entities
+from leet_apps.orchestrator import dedupe_records
+
+
+def test_canonicalize_name_and_domain_key():
+    assert canonicalize_name("Acme Robotics, Inc.") == "acme robotics"
+    assert canonicalize_name("ACME Robotics Co. Ltd") == "acme robotics"
+    assert canonicalize_name("Smith & Wesson") == "smith and wesson"
+    assert canonicalize_name("Inc") == "inc"
+    assert domain_key("https://www.Acme.example:443/about") == "acme.example"
+    assert domain_key("https://linkedin.com/company/acme") is None
+
+
+def test_resolve_entities_merges_suffix_domain_and_fuzzy_variants():
+    records = [
+        {"company_name": "Acme Robotics, Inc.", "website": None},
+        {"company_name": "Beta Analytics", "website": "https://betanalytics.example"},
+        {"company_name": "Acme Robotics", "website": "https://acme.example"},
+        {"company_name": "Beta Data", "website": "http://www.betanalytics.example/"},
+        {"company_name": "Acme Robotic", "website": None},
+        {"company_name": "Gamma Health", "website": None},
+        {"company_name": None, "website": None},
+    ]
+    assert resolve_entities(records) == [[0, 2, 4], [1, 3], [5], [6]]
+    assert resolve_entities(records, fuzzy_threshold=None) == [[0, 2], [1, 3], [4], [5], [6]]
+
+
+def test_dedupe_records_merges_links_and_fills_missing_fields():
+    records = [
+        {"company_name": "Acme Robotics", "industry": None, "investment": {"round_type": "Seed", "source_links": ["a"]},
+         "source_links": ["x"]},
+        {"company_name": "Acme Robotics LLC", "industry": "Robotics", "investment": {"amount": "$1M", "source_links": ["b"]},
+         "source_links": ["y", "x"]},
+    ]
+    merged = dedupe_records(records)
+    assert len(merged) == 1
+    assert merged[0]["company_name"] == "Acme Robotics"
+    assert merged[0]["industry"] == "Robotics"
+    assert merged[0]["source_links"] == ["x", "y"]
+    assert merged[0]["investment"] == {"round_type": "Seed", "amount": "$1M", "source_links": ["a", "b"]}
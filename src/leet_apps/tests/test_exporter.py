@@ -22,3 +22,98 @@ def test_export_csv(tmp_path):
     # Basic content checks
     assert 'Co' in open(comp).read()
     assert 'Seed' in open(inv).read()
+
+
+def _normalized():
+    from leet_apps.normalizer import normalize_results
+
+    raw = [{"company_name": f"Co {i}", "industry": ["Tech", None][i % 2], "status": "active", "description": "Café",
+            "source_links": [f"https://co{i}"], "investment": {"round_type": "Seed", "source_links": ["https://news/1"]}}
+           for i in range(5)]
+    data = normalize_results(raw, "f1")
+    data["changes"] = {"changed": True}
+    return data
+
+
+def test_export_json_streams_same_document_with_single_pass_summary(tmp_path):
+    import json
+    from leet_apps.exporter import generate_summary
+
+    data = _normalized()
+    expected = dict(data, summary=generate_summary(data))
+    assert expected["summary"]["industry_counts"] == {"Tech": 3, "unknown": 2}
+    assert expected["summary"]["unique_source_links"] == 6
+    p = tmp_path / "out.json"
+    export_json(data, str(p), backend="stdlib")
+    assert p.read_text() == json.dumps(expected, indent=2)
+
+    # Summary is dropped, not fatal, when it cannot be computed
+    export_json({"fund": {"id": "f"}, "companies": [{"industry": ["a", "b"]}], "investments": []}, str(p))
+    assert "summary" not in json.loads(p.read_text())
+
+
+def test_export_jsonl_and_orjson_backend(tmp_path):
+    import json
+    import pytest
+    from leet_apps.exporter import export_jsonl
+
+    data = _normalized()
+    p = tmp_path / "out.jsonl"
+    export_jsonl(data, str(p), backend="stdlib")
+    lines = [json.loads(line) for line in p.read_text().splitlines()]
+    assert lines[0] == {"fund": {"id": "f1"}}
+    assert [line["company"]["name"] for line in lines[1:-1]] == [f"Co {i}" for i in range(5)]
+    assert lines[-1]["summary"]["total_investments"] == 5
+
+    pytest.importorskip("orjson")
+    export_json(data, str(tmp_path / "a.json"), backend="stdlib")
+    export_json(data, str(tmp_path / "b.json"), backend="orjson")
+    assert json.loads((tmp_path / "a.json").read_text()) == json.loads((tmp_path / "b.json").read_text())
+
+
+def test_export_parquet_requires_pyarrow(tmp_path, monkeypatch):
+    import builtins
+    import pytest
+    from leet_apps.exporter import export_parquet
+
+    real_import = builtins.__import__
+
+    def no_pyarrow(name, *args, **kwargs):
+        if name.startswith("pyarrow"):
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_pyarrow)
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        export_parquet(_normalized(), str(tmp_path / "out"))
+
+
+def test_export_parquet_typed_columns(tmp_path):
+    import datetime
+    import pytest
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    import pyarrow as pa
+    from leet_apps.exporter import export_arrow, export_parquet
+    from leet_apps.normalizer import normalize_results
+
+    raw = [{"company_name": "Acme", "industry": "Robotics", "founding_date": "2015-06-01",
+            "investment": {"date": "09/12/2018", "amount": "$5M", "co_investors": ["A", "B"], "round_type": "Seed"}}]
+    data = normalize_results(raw, "f1")
+    export_parquet(data, str(tmp_path / "out"))
+    inv = pq.read_table(str(tmp_path / "out_investments.parquet"))
+    assert inv.schema.field("amount_value").type == pa.float64()
+    assert pa.types.is_dictionary(inv.schema.field("round_type").type)
+    row = inv.to_pylist()[0]
+    assert row["co_investors"] == ["A", "B"] and row["date"] == datetime.date(2018, 9, 12)
+    assert row["amount_value"] == 5e6
+
+    export_parquet(data, str(tmp_path / "ds"), partition_by_fund=True)
+    assert (tmp_path / "ds" / "companies" / "fund_id=f1").is_dir()
+    # A fund that no longer has any rows loses its stale partition
+    export_parquet({"fund": {"id": "f1"}, "companies": [], "investments": []}, str(tmp_path / "ds"), partition_by_fund=True)
+    assert not (tmp_path / "ds" / "companies" / "fund_id=f1").exists()
+    assert not (tmp_path / "ds" / "investments" / "fund_id=f1").exists()
+    export_arrow(data, str(tmp_path / "out"))
+    with pa.OSFile(str(tmp_path / "out_companies.arrow")) as source:
+        assert pa.ipc.open_file(source).read_all().num_rows == 1
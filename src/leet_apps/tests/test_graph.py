@@ -0,0 +1,49 @@
+import json
+
+from leet_apps.graph import CoInvestmentGraph
+from leet_apps.normalizer import normalize_results
+from leet_apps.store import PortfolioStore
+
+
+def _result(fund, rows):
+    raw = [{"company_name": name, "investment": {"round_type": "Seed", "co_investors": co}} for name, co in rows]
+    return normalize_results(raw, fund)
+
+
+RESULTS = [
+    _result("Fund A", [("Acme", ["Accel", "Index Ventures"]), ("Beta", ["Accel"]), ("Gamma", [])]),
+    _result("Fund B", [("Acme", []), ("Gamma", ["Benchmark"])]),
+    _result("Fund C", [("Delta", ["Benchmark"])]),
+]
+
+
+def test_graph_queries():
+    graph = CoInvestmentGraph.from_results(RESULTS)
+    assert graph.top_coinvestors("Fund A", k=2) == [("Accel", 2), ("Fund B", 2)]
+    assert graph.top_coinvestors("fund a", k=10) == [
+        ("Accel", 2), ("Fund B", 2), ("Index Ventures", 1), ("Benchmark", 1)]
+    assert graph.shared_portfolio("Fund A", "Fund B") == ["Acme", "Gamma"]
+    assert graph.shared_portfolio_count("Fund A", "Fund C") == 0
+    assert graph.investors_of("acme") == ["Accel", "Fund A", "Fund B", "Index Ventures"]
+    # Fund C is reached through Benchmark (Gamma, Delta)
+    assert graph.expand("Fund A", hops=1) == {"Fund B": 1, "Accel": 1, "Index Ventures": 1, "Benchmark": 1}
+    assert graph.expand("Fund A", hops=2)["Fund C"] == 2
+    assert graph.expand("Fund A", hops=3, min_shared=2) == {"Fund B": 1, "Accel": 1}
+    assert graph.top_coinvestors("Unknown") == [] and graph.expand("Unknown") == {}
+
+
+def test_graph_from_store_matches_results(tmp_path, monkeypatch, capsys):
+    with PortfolioStore() as store:
+        for result in RESULTS:
+            store.save_result(result)
+        graph = CoInvestmentGraph.from_store(store)
+    assert graph.top_coinvestors("Fund B") == CoInvestmentGraph.from_results(RESULTS).top_coinvestors("Fund B")
+
+    from leet_apps.cli import main
+
+    path = tmp_path / "store.sqlite"
+    with PortfolioStore(str(path)) as store:
+        for result in RESULTS:
+            store.save_result(result)
+    main(["query", "--store", str(path), "--shared", "Fund A", "Fund B"])
+    assert json.loads(capsys.readouterr().out) == ["Acme", "Gamma"]
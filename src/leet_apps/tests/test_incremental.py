@@ -0,0 +1,45 @@
+from leet_apps.incremental import IncrementalOrchestrator, SnapshotStore, diff_portfolios
+
+
+class _MutableConnector:
+    def __init__(self):
+        self.records = [
+            {"company_name": "Acme", "industry": "Robotics", "investment": {"amount": "$1M"}, "source_links": []},
+            {"company_name": "Beta", "industry": "Analytics", "investment": {}, "source_links": []},
+        ]
+
+    def find_portfolio(self, fund_input):
+        return [dict(r) for r in self.records]
+
+
+def test_incremental_skips_unchanged_and_reports_diff(tmp_path, monkeypatch):
+    conn = _MutableConnector()
+    store = SnapshotStore(str(tmp_path))
+    with IncrementalOrchestrator(connectors=[conn], store=store) as orch:
+        first = orch.run("Fund")
+        assert first["changes"]["changed"] is True
+        assert [a["company"]["name"] for a in first["changes"]["added"]] == ["Acme", "Beta"]
+
+        second = orch.run("Fund")
+        assert second["changes"]["changed"] is False
+        assert second["changes"]["unchanged_sources"] == ["0:_MutableConnector"]
+        assert [c["name"] for c in second["companies"]] == ["Acme", "Beta"]
+
+        conn.records[0]["industry"] = "Automation"
+        conn.records[1] = {"company_name": "Gamma", "investment": {}, "source_links": []}
+        calls = []
+        import leet_apps.incremental as inc
+        real = inc.normalize_company
+        monkeypatch.setattr(inc, "normalize_company", lambda raw: calls.append(raw["company_name"]) or real(raw))
+        third = orch.run("Fund")
+
+    changes = third["changes"]
+    assert calls == ["Acme", "Gamma"]
+    assert [a["company"]["name"] for a in changes["added"]] == ["Gamma"]
+    assert changes["removed"] == ["Beta"]
+    assert changes["updated"][0]["changed_fields"] == ["industry"]
+
+
+def test_diff_portfolios_without_previous_snapshot():
+    new = {"companies": [{"id": "A"}], "investments": [{"company_id": "A"}]}
+    assert diff_portfolios(None, new)["added"][0]["company"]["id"] == "A"
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from leet_apps import instrumentation
+from leet_apps.instrumentation import span
+
+
+@pytest.fixture
+def tracer():
+    yield instrumentation.enable()
+    instrumentation.disable()
+
+
+def test_disabled_spans_are_noops():
+    instrumentation.disable()
+    with span("disabled-stage") as s:
+        s.set("k", 1)
+    assert "disabled-stage" not in instrumentation.get_tracer().stage_stats()
+
+
+def test_spans_nest_and_aggregate(tracer):
+    with span("outer", trace_key="Fund A") as outer:
+        with span("inner", host="api.example"):
+            pass
+    with pytest.raises(ValueError):
+        with span("inner"):
+            raise ValueError("boom")
+    inner = [s for s in tracer.spans() if s.name == "inner"]
+    assert inner[0].parent_id == outer.span_id and inner[0].trace_id == outer.trace_id
+    assert inner[1].parent_id is None and inner[1].error == "ValueError: boom"
+    stats = tracer.stage_stats()
+    assert stats["inner"]["count"] == 2 and stats["inner"]["errors"] == 1
+
+    prom = tracer.to_prometheus()
+    assert 'fund_tracker_stage_seconds_count{stage="inner"} 2' in prom
+    assert 'fund_tracker_stage_seconds_bucket{stage="inner",le="+Inf"} 2' in prom
+    assert 'fund_tracker_stage_errors_total{stage="inner"} 1' in prom
+
+    otlp = json.loads(tracer.export("otlp"))
+    spans = otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    child = next(s for s in spans if s["name"] == "inner" and "parentSpanId" in s)
+    assert child["attributes"] == [{"key": "host", "value": {"stringValue": "api.example"}}]
+    assert {s["status"]["code"] for s in spans} == {1, 2}
+
+
+def test_orchestrator_stages_share_the_fund_trace(tracer):
+    from leet_apps.connectors.pitchbook import PitchBookConnector
+    from leet_apps.orchestrator import Orchestrator
+
+    with Orchestrator(connectors=[PitchBookConnector()]) as orch:
+        orch.run("Fund A")
+    by_name = {s.name: s for s in tracer.spans()}
+    assert {"connector.PitchBookConnector", "finalize", "dedupe", "normalize"} <= set(by_name)
+    assert by_name["connector.PitchBookConnector"].trace_id == by_name["finalize"].trace_id
+    assert by_name["dedupe"].parent_id == by_name["finalize"].span_id
+    assert by_name["connector.PitchBookConnector"].attrs["records"] == 2
+
+
+def test_cli_profile(tmp_path, capsys):
+    from leet_apps.cli import main
+
+    out = tmp_path / "trace.json"
+    try:
+        main(["--fund", "Sequoia Capital", "--profile", "--profile-output", str(out), "--output", str(tmp_path / "o")])
+    finally:
+        instrumentation.disable()
+    err = capsys.readouterr().err
+    assert "stage" in err and "export.json" in err
+    assert "normalize" in json.loads(out.read_text())["stages"]
@@ -0,0 +1,19 @@
+from leet_apps.mentions import AhoCorasick, MentionExtractor
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    assert sorted(automaton.find("ushers")) == [(1, 4), (2, 4), (2, 6)]
+    assert automaton.find("xyz") == []
+
+
+def test_extractor_matches_dictionary_on_word_boundaries():
+    extractor = MentionExtractor(["Acme", "Acme Robotics, Inc.", "Beta Analytics", "Gamma Health"])
+    text = "ACME Robotics raises $5M; Beta-Analytics and Acme team up. Acmeville and GammaHealth are not matches."
+    assert extractor.extract(text) == ["Acme Robotics, Inc.", "Beta Analytics", "Acme"]
+
+
+def test_extractor_falls_back_to_capitalized_phrases():
+    extractor = MentionExtractor()
+    assert extractor.extract("Acme Robotics Raises Seed and Acme Robotics Expands") == \
+        ["Acme Robotics Raises Seed", "Acme Robotics Expands"]
@@ -0,0 +1,65 @@
+from datetime import date
+
+from leet_apps.connectors.news import NewsConnector
+
+
+class WindowedTransport:
+    """NewsAPI stand-in: `per_window` articles per date window, split into pages."""
+
+    def __init__(self, per_window=3, page_size=2):
+        self.per_window = per_window
+        self.page_size = page_size
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        self.requests.append(dict(params))
+        page = params["page"]
+        window = params["from"]
+        articles = []
+        for i in range((page - 1) * self.page_size, min(page * self.page_size, self.per_window)):
+            articles.append({"title": f"Acme Robotics raises round {window}-{i}",
+                             "description": "Sequoia Capital led; Beta Analytics joined.",
+                             "url": f"https://news.example/{window}/{i}?utm_source=x"})
+        # A syndicated copy of the first story and a repeat of its URL
+        if page == 1:
+            articles.append({"title": f"Acme Robotics raises round {window}-0",
+                             "description": "Sequoia Capital led; Beta Analytics joined.",
+                             "url": "https://mirror.example/story"})
+            articles.append({"title": "Other headline", "url": f"https://www.news.example/{window}/0/"})
+        resp = type("Resp", (), {"status_code": 200, "headers": {}, "text": ""})()
+        resp.json = lambda: {"totalResults": self.per_window, "articles": articles}
+        return resp
+
+    def source_available(self, url):
+        return True
+
+
+def test_news_windows_cover_lookback_newest_first():
+    connector = NewsConnector(api_key="k", lookback_days=10, window_days=4)
+    assert connector._windows(date(2024, 3, 10)) == [
+        {"from": "2024-03-07", "to": "2024-03-10"},
+        {"from": "2024-03-03", "to": "2024-03-06"},
+        {"from": "2024-03-01", "to": "2024-03-02"},
+    ]
+
+
+def test_news_harvests_pages_dedups_and_aggregates_mentions():
+    transport = WindowedTransport(per_window=3, page_size=2)
+    connector = NewsConnector(api_key="k", transport=transport, page_size=2, lookback_days=14, window_days=7,
+                              known_companies=["Acme Robotics", "Beta Analytics", "Sequoia Capital"])
+    records = connector.find_portfolio("Sequoia Capital")
+    # Two windows x two pages
+    assert [page for _, page in sorted((r["from"], r["page"]) for r in transport.requests)] == [1, 2, 1, 2]
+    by_name = {r["company_name"]: r for r in records}
+    # The fund itself is not reported; one record per company
+    assert set(by_name) == {"Acme Robotics", "Beta Analytics"}
+    # 3 unique stories per window; the syndicated copy and the repeated URL are dropped
+    assert by_name["Acme Robotics"]["mention_count"] == 6
+    assert len(by_name["Acme Robotics"]["source_links"]) == 6
+
+
+def test_news_page_budget():
+    transport = WindowedTransport(per_window=10, page_size=2)
+    connector = NewsConnector(api_key="k", transport=transport, page_size=2, lookback_days=14, window_days=7, max_pages=3)
+    connector.find_portfolio("Sequoia Capital")
+    assert len(transport.requests) == 3
@@ -29,3 +29,16 @@ def test_normalize_results_basic():
     assert result["companies"][0]["name"] == "Acme Robotics"
     assert "investments" in result and len(result["investments"]) == 1
     assert result["investments"][0]["round_type"] == "Series A"
+
+
+def test_parallel_normalization_matches_serial_order():
+    from leet_apps.normalizer import normalize_results_columnar
+
+    raw = [{"company_name": f"Company {i}", "industry": "AI" if i % 2 else None,
+            "investment": {"round_type": "Seed", "date": f"2020-{i % 12 + 1:02d}", "amount": f"${i}M",
+                           "co_investors": [f"Investor {i % 3}"]}}
+           for i in range(23)]
+    serial = normalize_results(raw, "Fund")
+    parallel = normalize_results_columnar(raw, "Fund", processes=2, parallel_threshold=10, chunk_size=4)
+    assert len(parallel.investments) == 23
+    assert parallel.to_dict() == serial
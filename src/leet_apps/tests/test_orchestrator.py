@@ -10,3 +10,166 @@ def test_orchestrator_runs_basic():
     # run convenience
     r2 = run_for_fund("Sequoia Capital")
     assert "fund" in r2
+
+
+def test_orchestrator_run_many_streams_each_fund():
+    from leet_apps.connectors.pitchbook import PitchBookConnector
+    from leet_apps.connectors.linkedin import LinkedInConnector
+
+    funds = ["Fund A", "Fund B", "Fund C"]
+    with Orchestrator(connectors=[PitchBookConnector(), LinkedInConnector()]) as orch:
+        out = dict(orch.run_many(iter(funds)))
+        # pool is reused across calls
+        assert orch.run("Fund D")["fund"]["id"] == "Fund D"
+    assert set(out) == set(funds)
+    for fund, res in out.items():
+        assert res["fund"]["id"] == fund
+        names = [c["name"] for c in res["companies"]]
+        assert names == ["Epsilon Energy", "Zeta Fintech", "Theta Bio"]
+
+
+def test_stream_emits_before_slow_connector_and_merges_online():
+    import threading
+
+    release = threading.Event()
+
+    class Fast:
+        def iter_portfolio(self, fund_input):
+            yield {"company_name": "Acme Robotics", "website": None, "industry": None}
+            yield {"company_name": "Beta Analytics", "website": "https://beta.example"}
+
+    class Slow:
+        def find_portfolio(self, fund_input):
+            release.wait(5)
+            return [{"company_name": "Acme Robotics, Inc.", "industry": "Robotics"},
+                    {"company_name": "Beta Data", "website": "https://www.beta.example/"}]
+
+    with Orchestrator(connectors=[Slow(), Fast()]) as orch:
+        events = orch.stream("Fund A")
+        first = next(events)
+        # Fast connector output arrives while the slow one is still blocked
+        assert not release.is_set()
+        assert first["op"] == "upsert" and first["company"]["id"] == "Acme Robotics"
+        release.set()
+        rest = list(events)
+
+    upserts = [e for e in rest if e["op"] == "upsert"]
+    assert [e["company"]["id"] for e in upserts] == ["Beta Analytics", "Acme Robotics", "Beta Analytics"]
+    assert upserts[1]["company"]["industry"] == "Robotics"
+    assert rest[-1] == {"op": "end", "fund_id": "Fund A", "total_companies": 2}
+
+
+def test_run_returns_partial_result_when_connector_misses_deadline():
+    import threading
+    import time
+    from leet_apps.connectors.pitchbook import PitchBookConnector
+
+    release = threading.Event()
+
+    class Hanging:
+        def find_portfolio(self, fund_input):
+            release.wait(5)
+            return [{"company_name": "Late Co"}]
+
+    orch = Orchestrator(connectors=[Hanging(), PitchBookConnector()])
+    orch.connector_deadlines = {"Hanging": 0.2}
+    try:
+        start = time.monotonic()
+        res = orch.run("Fund A")
+        assert time.monotonic() - start < 2
+        assert res["fund"] == {"id": "Fund A", "partial": True, "timed_out_sources": ["Hanging"]}
+        assert "Late Co" not in [c["name"] for c in res["companies"]] and res["companies"]
+
+        # Overall fund deadline applies to connectors without their own budget
+        orch.connector_deadlines, orch.fund_deadline = {}, 0.2
+        assert orch.run("Fund B")["fund"]["timed_out_sources"] == ["Hanging"]
+    finally:
+        release.set()
+        orch.close()
+
+
+def test_run_many_fund_deadline_starts_when_fund_starts():
+    import time
+
+    class Sleeper:
+        def __init__(self, name):
+            self.name = name
+
+        def find_portfolio(self, fund_input):
+            time.sleep(0.3)
+            return [{"company_name": f"{self.name} {fund_input}"}]
+
+    # Three workers and three 0.3s connectors per fund: funds run one after another, so
+    # most of the batch is queued far longer than the fund deadline
+    connectors = [type(name, (Sleeper,), {})(name) for name in ("C", "D", "E")]
+    with Orchestrator(connectors=connectors, max_workers=3) as orch:
+        orch.fund_deadline, orch.connector_deadlines, orch.max_pending_funds = 1.0, {}, 12
+        out = dict(orch.run_many(f"F{i}" for i in range(6)))
+    assert len(out) == 6
+    for fund, res in out.items():
+        assert not res["fund"].get("partial"), res["fund"]
+        assert len(res["companies"]) == 3
+
+
+def test_large_funds_share_one_normalizer_pool_closed_with_orchestrator():
+    class ManyCompanies:
+        name = "many"
+
+        def find_portfolio(self, fund_input):
+            return [{"company_name": f"{fund_input} Co {i}"} for i in range(12)]
+
+    orch = Orchestrator(connectors=[ManyCompanies()])
+    orch.normalize_options.update(parallel_threshold=10, processes=2, chunk_size=4)
+    out = dict(orch.run_many(["Fund A", "Fund B"]))
+    pool = orch._normalizer_pool
+    assert pool is not None and pool.processes == 2
+    assert [c["name"] for c in out["Fund B"]["companies"]] == [f"Fund B Co {i}" for i in range(12)]
+    assert orch.run("Fund C") and orch._normalizer_pool is pool
+    orch.close()
+    assert orch._normalizer_pool is None and pool._executor is None
+
+
+def test_stream_keeps_first_id_when_name_arrives_later():
+    class Unnamed:
+        def iter_portfolio(self, fund_input):
+            yield {"website": "https://acme.example"}
+            yield {"company_name": "Acme Robotics", "website": "https://www.acme.example/"}
+
+    with Orchestrator(connectors=[Unnamed()]) as orch:
+        events = list(orch.stream("Fund A"))
+
+    upserts = [e for e in events if e["op"] == "upsert"]
+    assert [e["company"]["id"] for e in upserts] == ["entity-0", "entity-0"]
+    assert upserts[1]["company"]["name"] == "Acme Robotics"
+    assert not [e for e in events if e["op"] == "remove"]
+
+
+def test_fund_deadline_drops_connectors_still_queued():
+    import threading
+    import time
+
+    release = threading.Event()
+
+    class Slow:
+        def find_portfolio(self, fund_input):
+            release.wait(2)
+            return [{"company_name": "Late Co"}]
+
+    class Fast:
+        def find_portfolio(self, fund_input):
+            return [{"company_name": "Fast Co"}]
+
+    # One worker: Fast stays queued behind Slow until the fund deadline has passed
+    orch = Orchestrator(connectors=[Slow(), Fast()], max_workers=1)
+    orch.fund_deadline, orch.connector_deadlines = 0.3, {}
+    try:
+        start = time.monotonic()
+        cpu = time.process_time()
+        res = orch.run("Fund A")
+        elapsed, cpu = time.monotonic() - start, time.process_time() - cpu
+    finally:
+        release.set()
+        orch.close()
+    assert elapsed < 1.0 and cpu < 0.5
+    assert res["fund"]["partial"] and res["fund"]["timed_out_sources"] == ["Fast", "Slow"]
+    assert res["companies"] == []
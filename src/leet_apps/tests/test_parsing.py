@@ -0,0 +1,36 @@
+from leet_apps.parsing import cache_info, clear_caches, parse_amount, parse_date
+
+
+def test_parse_amount_formats():
+    assert parse_amount("$5,000,000") == (5e6, "USD")
+    assert parse_amount("USD 5M") == (5e6, "USD")
+    assert parse_amount("€2.5M") == (2.5e6, "EUR")
+    assert parse_amount("£300k") == (3e5, "GBP")
+    assert parse_amount("5 Million") == (5e6, None)
+    # Free-form strings go through the general scan
+    assert parse_amount("5M USD (est.)") == (5e6, None)
+    assert parse_amount("undisclosed") == (None, None)
+    assert parse_amount(None) == (None, None)
+
+
+def test_parse_date_formats():
+    assert parse_date("2018-09-12") == "2018-09-12"
+    assert parse_date("2018-09") == "2018-09-01"
+    assert parse_date("2018") == "2018-01-01"
+    assert parse_date("2018-09-12T10:00:00") == "2018-09-12"
+    assert parse_date("09/12/2018") == "2018-09-12"
+    assert parse_date("13/09/2018") == "2018-09-13"
+    assert parse_date("sep 12, 2018") == "2018-09-12"
+    assert parse_date("September 12, 2018") == "2018-09-12"
+    assert parse_date("02/30/2018") == "02/30/2018"
+    assert parse_date(" Q3 2018 ") == "Q3 2018"
+
+
+def test_repeated_strings_hit_the_cache():
+    clear_caches()
+    for _ in range(3):
+        parse_amount("$5,000,000")
+        parse_date("2018-09-12")
+    info = cache_info()
+    assert info["amount"]["hits"] == 2 and info["amount"]["misses"] == 1
+    assert info["date"]["hits"] == 2 and info["date"]["misses"] == 1
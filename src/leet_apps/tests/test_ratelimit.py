@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from leet_apps.ratelimit import QuotaExceeded, RateLimiter, parse_retry_after
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_limiter_burst_then_spaced_reservations():
+    clock = _Clock()
+    limiter = RateLimiter(default_rate=2.0, default_burst=2, clock=clock)
+    delays = [limiter.reserve("https://api.example/a") for _ in range(4)]
+    # two burst tokens are free, later callers get staggered waits rather than a shared lock
+    assert delays == [0.0, 0.0, 0.5, 1.0]
+    # other hosts have independent buckets
+    assert limiter.reserve("https://other.example/x") == 0.0
+
+
+def test_rate_limiter_quota_and_retry_after():
+    clock = _Clock()
+    limiter = RateLimiter(default_rate=10.0, default_burst=10, clock=clock,
+                          host_limits={"api.crunchbase.com": {"quota": 2}})
+    url = "https://api.crunchbase.com/v3.1/odm-organizations"
+    limiter.reserve(url)
+    limiter.reserve(url)
+    with pytest.raises(QuotaExceeded):
+        limiter.reserve(url)
+
+    class _Resp:
+        status_code = 429
+        headers = {"Retry-After": "30"}
+
+    limiter.record_response("https://newsapi.org/v2", _Resp())
+    assert limiter.reserve("https://newsapi.org/v2") == pytest.approx(30.0)
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=0) > 0
+
+
+def test_rate_limiter_async_acquire():
+    limiter = RateLimiter(default_rate=1000.0, default_burst=1, clock=_Clock())
+    asyncio.run(limiter.aacquire("https://api.example"))
+    asyncio.run(limiter.aacquire("https://api.example"))
+    assert limiter.reserve("https://api.example") > 0
+
+
+def test_utils_rate_limit_resolves_host_per_call(monkeypatch):
+    from leet_apps import utils
+    from leet_apps.ratelimit import RateLimiter as RL
+
+    waits = []
+    monkeypatch.setattr(utils, "_default_limiter", RL(sleep=waits.append))
+
+    @utils.rate_limit(min_interval=10.0)
+    def fetch(url):
+        return url
+
+    fetch("https://a.example/1")
+    fetch("https://b.example/1")
+    fetch("https://a.example/2")
+    assert len(waits) == 1 and waits[0] == pytest.approx(10.0, abs=0.1)
+
+
+def test_quota_store_shares_usage_across_limiters(tmp_path):
+    from leet_apps.ratelimit import QuotaStore
+
+    now = [1000.0]
+    path = str(tmp_path / "quota.sqlite")
+    limits = {"api.crunchbase.com": {"quota": 3, "quota_period": 60}}
+    url = "https://api.crunchbase.com/v3.1/odm-organizations"
+    # Two limiters on one file stand in for the scheduler daemon and a CLI run (or a restart)
+    first = RateLimiter(default_rate=1000, default_burst=1000, host_limits=limits, quota_store=QuotaStore(path, clock=lambda: now[0]))
+    second = RateLimiter(default_rate=1000, default_burst=1000, host_limits=limits, quota_store=QuotaStore(path, clock=lambda: now[0]))
+    first.reserve(url)
+    first.reserve(url)
+    assert second.remaining_quota(url) == 1
+    second.reserve(url)
+    with pytest.raises(QuotaExceeded):
+        first.reserve(url)
+
+    now[0] += 45
+    assert first.quota_resets_in(url) == pytest.approx(15)
+    now[0] += 15
+    assert second.remaining_quota(url) == 3
+    first.reserve(url)
+    assert second.remaining_quota(url) == 2
+
+
+def test_callers_queued_during_a_block_are_spaced_after_it():
+    from leet_apps.ratelimit import TokenBucket
+
+    clock = _Clock()
+    bucket = TokenBucket(rate=1.0, capacity=2, clock=clock)
+    bucket.block_for(30)
+    # A burst of `capacity` when the block lifts, then one caller per second
+    assert [bucket.reserve() for _ in range(4)] == [30.0, 30.0, 31.0, 32.0]
+    clock.now += 10
+    assert bucket.reserve() == 23.0
@@ -0,0 +1,27 @@
+import pytest
+
+from leet_apps.connectors import registry
+
+
+def test_build_connectors_from_config_and_names():
+    cache = object()
+    built = registry.build_connectors({"connectors": {"enabled": ["news", "linkedin"]}}, cache=cache, robots=None)
+    assert [type(c).__name__ for c in built] == ["NewsConnector", "LinkedInConnector"]
+    # Shared objects go only to connectors that accept them
+    assert built[0].cache is cache and not hasattr(built[1], "cache")
+
+    default = registry.build_connectors({})
+    assert [type(c).__name__ for c in default] == ["CrunchbaseConnector", "NewsConnector", "OfficialFundConnector"]
+    assert [type(c).__name__ for c in registry.build_connectors({}, ["pitchbook"])] == ["PitchBookConnector"]
+
+
+def test_unknown_connector_lists_available():
+    with pytest.raises(registry.UnknownConnector, match="crunchbase"):
+        registry.parse_names("crunchbase, missing")
+    assert registry.parse_names(" news ,pitchbook") == ["news", "pitchbook"]
+
+
+def test_build_connectors_passes_per_connector_options():
+    config = {"connectors": {"options": {"crunchbase": {"max_pages": 3, "page_concurrency": 2, "unknown": 1}}}}
+    (cb,) = registry.build_connectors(config, ["crunchbase"])
+    assert cb.max_pages == 3 and cb.page_concurrency == 2
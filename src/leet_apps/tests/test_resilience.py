@@ -0,0 +1,96 @@
+import time
+
+import pytest
+import requests
+
+from leet_apps.resilience import AdaptiveLimiter, CircuitBreaker, CircuitOpen, SourceGuards
+
+
+def test_circuit_breaker_opens_and_probes_half_open():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=lambda: now[0])
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    now[0] = 10.0
+    assert breaker.allow()  # the single half-open probe
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] = 20.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_adaptive_limiter_aimd():
+    limiter = AdaptiveLimiter(initial=4, min_limit=1, max_limit=8, latency_target=1.0)
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release(0.1, ok=True)
+    assert 4.9 < limiter.limit < 5.0
+    limiter.acquire()
+    limiter.release(2.0, ok=True)  # too slow counts as congestion
+    assert 2.4 < limiter.limit < 2.5
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release(0.1, ok=False)
+    assert limiter.limit == 1
+
+
+class _FailingTransport:
+    def __init__(self):
+        self.guards = SourceGuards(failure_threshold=1, reset_timeout=60)
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        def send():
+            self.calls += 1
+            raise requests.ConnectionError("down")
+
+        return self.guards.call(url, send)
+
+    def source_available(self, url):
+        return self.guards.available(url)
+
+
+def test_open_circuit_stops_connector_retries_across_funds():
+    from leet_apps.connectors.crunchbase import CrunchbaseConnector
+
+    transport = _FailingTransport()
+    cb = CrunchbaseConnector(api_key="k", max_retries=3, backoff_seconds=30, transport=transport)
+    start = time.monotonic()
+    for fund in ("Fund A", "Fund B", "Fund C"):
+        # Falls back to stub data without sleeping through the retries
+        assert [r["company_name"] for r in cb.find_portfolio(fund)] == ["Acme Robotics", "Beta Analytics"]
+    assert time.monotonic() - start < 5
+    assert transport.calls == 1
+    with pytest.raises(CircuitOpen):
+        transport.get("https://api.crunchbase.com/v3.1/odm-organizations")
+    assert transport.guards.snapshot()["api.crunchbase.com"]["state"] == "open"
+
+
+def test_refused_calls_spend_no_rate_limit_quota():
+    from leet_apps.ratelimit import QuotaExceeded, RateLimiter
+    from leet_apps.transport import HttpTransport
+
+    now = [0.0]
+    limiter = RateLimiter(default_rate=1000, default_burst=1000, host_limits={"api.example": {"quota": 1}},
+                          clock=lambda: now[0])
+    guards = SourceGuards(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    transport = HttpTransport(rate_limiter=limiter, guards=guards)
+    guards.breaker("https://api.example/x").record_failure()
+    for _ in range(3):
+        with pytest.raises(CircuitOpen):
+            transport.get("https://api.example/x")
+    assert limiter.remaining_quota("https://api.example/x") == 1
+
+    # Half-open: a probe that cannot get quota gives the probe back instead of wedging the breaker
+    now[0] = 10.0
+    limiter.reserve("https://api.example/x")
+    with pytest.raises(QuotaExceeded):
+        transport.get("https://api.example/x")
+    assert guards.available("https://api.example/x")
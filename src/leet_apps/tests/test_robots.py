@@ -0,0 +1,105 @@
+import threading
+import time
+
+from leet_apps.robots import RobotsCache
+from leet_apps.cache import ResponseCache
+
+
+class _Resp:
+    def __init__(self, status_code, text=""):
+        self.status_code = status_code
+        self.text = text
+
+
+class _Transport:
+    def __init__(self, responses, delay=0.0):
+        self.responses = list(responses)
+        self.delay = delay
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        time.sleep(self.delay)
+        r = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if isinstance(r, Exception):
+            raise r
+        return r
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_robots_single_flight_and_rules():
+    transport = _Transport([_Resp(200, "User-agent: *\nDisallow: /private\n")], delay=0.05)
+    robots = RobotsCache(transport=transport)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(robots.allowed("https://fund.example/portfolio")))
+               for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [True] * 8
+    assert transport.calls == 1
+    assert robots.allowed("https://fund.example/private/x") is False
+
+
+def test_robots_negative_result_expires():
+    clock = _Clock()
+    transport = _Transport([RuntimeError("boom"), _Resp(404)])
+    robots = RobotsCache(negative_ttl=60, transport=transport, clock=clock)
+    assert robots.allowed("https://fund.example/") is False
+    assert robots.allowed("https://fund.example/") is False
+    clock.now += 61
+    # 404 means no robots.txt: everything allowed
+    assert robots.allowed("https://fund.example/") is True
+    assert transport.calls == 2
+
+
+def test_robots_persisted_in_response_cache():
+    cache = ResponseCache()
+    first = RobotsCache(transport=_Transport([_Resp(403)]), cache=cache)
+    assert first.allowed("https://closed.example/") is False
+    second_transport = _Transport([_Resp(200, "")])
+    second = RobotsCache(transport=second_transport, cache=cache)
+    assert second.allowed("https://closed.example/") is False
+    assert second_transport.calls == 0
+
+
+def test_orchestrator_routes_robots_through_transport_and_prefetches():
+    from leet_apps.connectors.official_fund import OfficialFundConnector
+    from leet_apps.orchestrator import Orchestrator
+
+    class PageTransport(_Transport):
+        def __init__(self):
+            super().__init__([_Resp(200, "User-agent: *\nDisallow: /private\n")])
+            self.urls = []
+
+        def get(self, url, timeout=None, **kwargs):
+            self.urls.append(url)
+            if url.endswith("/robots.txt"):
+                return super().get(url, timeout)
+            resp = _Resp(200, "<h2>Portfolio</h2><p>Acme Robotics</p>")
+            resp.headers = {}
+            resp.raise_for_status = lambda: None
+            return resp
+
+    transport = PageTransport()
+    robots = RobotsCache()
+    connector = OfficialFundConnector(robots=robots)
+    prefetched = []
+    prefetch = robots.prefetch
+    robots.prefetch = lambda urls: (prefetched.extend(urls), prefetch(urls))
+    funds = ["https://fund.example/a", "https://fund.example/private/b", "Plain Name"]
+    with Orchestrator(connectors=[connector], transport=transport) as orch:
+        out = dict(orch.run_many(funds))
+    assert robots.transport is transport
+    assert prefetched == funds[:2]
+    assert transport.urls.count("https://fund.example/robots.txt") == 1
+    assert [c["name"] for c in out["https://fund.example/a"]["companies"]] == ["Acme Robotics"]
+    assert out["https://fund.example/private/b"]["companies"] == []
@@ -0,0 +1,137 @@
+import json
+
+from leet_apps.ratelimit import RateLimiter
+from leet_apps.scheduler import RefreshScheduler
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeOrchestrator:
+    def __init__(self, partial=()):
+        self.partial = set(partial)
+        self.batches = []
+        self.transport = None
+
+    def run_many(self, funds):
+        funds = list(funds)
+        self.batches.append(funds)
+        for fund in funds:
+            yield fund, {"fund": {"id": fund, "partial": fund in self.partial}, "companies": [], "investments": []}
+
+
+def test_due_order_follows_staleness_and_importance(tmp_path):
+    clock = FakeClock()
+    orch = FakeOrchestrator()
+    sched = RefreshScheduler(orch, interval=100, batch_size=2, clock=clock, sleep=clock.sleep)
+    sched.add("A", due=900)
+    sched.add("B", due=950, importance=2)
+    sched.add("C", due=950)
+    sched.add("D", due=2000)
+    assert sched.metrics()["due"] == 3
+    assert sched.run_once() == 2
+    assert orch.batches == [["A", "B"]]
+    sched.run_once()
+    assert orch.batches[-1] == ["C"]
+    assert sched.run_once() == 0
+    # B refreshes every 100 / 2 seconds, A every 100
+    funds = sched.funds()
+    assert funds["B"]["next_due"] == clock.now + 50 and funds["A"]["next_due"] == clock.now + 100
+
+
+def test_failures_back_off_and_state_survives_restart(tmp_path):
+    clock = FakeClock()
+    state = tmp_path / "sched.json"
+    got = []
+    sched = RefreshScheduler(FakeOrchestrator(partial={"Slow"}), state_path=str(state), interval=3600, retry_base=10,
+                             clock=clock, on_result=lambda f, r: got.append(f))
+    sched.add_many(["Fast", "Slow"])
+    sched.run_once()
+    assert got == ["Fast"]
+    entries = json.loads(state.read_text())["funds"]
+    assert entries["Slow"]["failures"] == 1 and entries["Slow"]["next_due"] == clock.now + 10
+    assert entries["Fast"]["last_refreshed"] == clock.now
+
+    clock.now += 10
+    orch = FakeOrchestrator()
+    restarted = RefreshScheduler(orch, state_path=str(state), interval=3600, clock=clock)
+    assert restarted.run_once() == 1
+    assert orch.batches == [["Slow"]]
+    assert restarted.funds()["Slow"]["failures"] == 0
+    assert restarted.remove("Fast") and "Fast" not in json.loads(state.read_text())["funds"]
+
+
+def test_source_budget_limits_dispatch():
+    clock = FakeClock()
+    orch = FakeOrchestrator()
+    orch.transport = type("T", (), {})()
+    orch.transport.rate_limiter = limiter = RateLimiter(default_rate=1000, default_burst=1000,
+                                                        host_limits={"api.crunchbase.com": {"quota": 5}})
+    sched = RefreshScheduler(orch, batch_size=10, reserve_calls={"api.crunchbase.com": 2}, clock=clock)
+    sched.add_many([f"F{i}" for i in range(6)])
+    assert sched.budget() == 3
+    assert sched.run_once() == 3
+    for _ in range(3):
+        limiter.reserve("https://api.crunchbase.com/x")
+    assert sched.run_once() == 0
+    metrics = sched.metrics()
+    assert metrics["budget_waits_total"] == 1 and metrics["due"] == 3 and metrics["queue_depth"] == 6
+    assert "fund_tracker_scheduler_due 3" in sched.to_prometheus()
+
+
+def test_cli_schedule_add_and_run_once(tmp_path, capsys, monkeypatch):
+    from leet_apps.cli import main
+
+    monkeypatch.setenv("FUND_TRACKER_QUOTA_PATH", str(tmp_path / "quota.sqlite"))
+    state = str(tmp_path / "s.json")
+    main(["schedule", "--add", "Fund A", "--importance", "2", "--state", state])
+    status = json.loads(capsys.readouterr().out)
+    assert status["funds"]["Fund A"]["importance"] == 2 and status["metrics"]["due"] == 1
+
+    main(["schedule", "--run", "--once", "--state", state, "--connectors", "pitchbook", "--no-cache",
+          "--state-dir", str(tmp_path / "snapshots"), "--output", str(tmp_path / "out")])
+    from leet_apps.utils import fund_slug
+
+    assert (tmp_path / "out" / (fund_slug("Fund A") + ".json")).exists()
+    assert json.loads(open(state).read())["funds"]["Fund A"]["last_refreshed"] is not None
+
+
+def test_run_forever_sleeps_while_budget_is_spent():
+    clock = FakeClock()
+    sleeps = []
+    orch = FakeOrchestrator()
+    orch.transport = type("T", (), {})()
+    orch.transport.rate_limiter = limiter = RateLimiter(default_rate=1000, default_burst=1000,
+                                                        host_limits={"api.crunchbase.com": {"quota": 2}})
+    sched = RefreshScheduler(orch, poll_seconds=30, reserve_calls={"api.crunchbase.com": 0}, clock=clock,
+                             sleep=sleeps.append)
+    sched.add("A")
+    for _ in range(2):
+        limiter.reserve("https://api.crunchbase.com/x")
+    sched.run_forever(max_cycles=5)
+    # Overdue fund but no budget: every cycle sleeps instead of spinning
+    assert orch.batches == [] and sleeps == [30] * 5
+
+
+def test_calls_per_fund_follows_connector_page_budgets():
+    from leet_apps.connectors.crunchbase import CrunchbaseConnector
+    from leet_apps.connectors.news import NewsConnector
+
+    orch = FakeOrchestrator()
+    orch.connectors = [CrunchbaseConnector(max_pages=20), NewsConnector(max_pages=8)]
+    orch.transport = type("T", (), {})()
+    orch.transport.rate_limiter = RateLimiter(default_rate=1000, default_burst=1000,
+                                              host_limits={"api.crunchbase.com": {"quota": 100}})
+    sched = RefreshScheduler(orch, reserve_calls={"api.crunchbase.com": 20})
+    assert sched.calls_for("api.crunchbase.com") == 20 and sched.calls_for("newsapi.org") == 8
+    assert sched.budget() == 4
+    assert RefreshScheduler(orch, calls_per_fund={"newsapi.org": 3}).calls_for("api.crunchbase.com") == 20
+    assert RefreshScheduler(orch, calls_per_fund=2).calls_for("newsapi.org") == 2
@@ -0,0 +1,89 @@
+import json
+import threading
+import time
+from urllib.request import urlopen
+
+import pytest
+
+from leet_apps.server import PortfolioAPI, make_server
+from leet_apps.utils import SingleFlight
+
+
+class SlowOrchestrator:
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.calls = []
+
+    def run(self, fund):
+        self.calls.append(fund)
+        time.sleep(self.delay)
+        return {"fund": {"id": fund}, "companies": [{"name": "Acme Robotics"}], "investments": []}
+
+
+def test_single_flight_shares_result_and_errors():
+    flight = SingleFlight()
+    started = threading.Event()
+    runs = []
+
+    def slow():
+        runs.append(1)
+        started.set()
+        time.sleep(0.1)
+        return "value"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("k", slow, return_shared=True)))
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=lambda: results.append(flight.do("k", slow, return_shared=True))) for _ in range(4)]
+    for t in followers:
+        t.start()
+    for t in [leader] + followers:
+        t.join()
+    assert len(runs) == 1
+    assert sorted(results) == [("value", False)] + [("value", True)] * 4
+
+    def boom():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        flight.do("k", boom)
+    assert flight.in_flight() == 0
+
+
+def test_concurrent_requests_coalesce_into_one_run():
+    orch = SlowOrchestrator()
+    api = PortfolioAPI(orch, result_ttl=0)
+    out = []
+    threads = [threading.Thread(target=lambda: out.append(api.portfolio("Fund A"))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert orch.calls == ["Fund A"] and len(out) == 8
+    assert api.coalesced == 7
+    # Without a result TTL the next request runs again
+    api.portfolio("Fund A")
+    assert len(orch.calls) == 2
+
+
+def test_http_routes():
+    orch = SlowOrchestrator(delay=0)
+    api = PortfolioAPI(orch, result_ttl=60)
+    server = make_server(api, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        body = json.loads(urlopen(f"{base}/funds/Sequoia%20Capital/portfolio").read())
+        assert body["fund"]["id"] == "Sequoia Capital"
+        summary = json.loads(urlopen(f"{base}/funds/Sequoia%20Capital/summary").read())
+        assert summary["total_companies"] == 1
+        assert orch.calls == ["Sequoia Capital"] and api.result_hits == 1
+        assert json.loads(urlopen(f"{base}/health").read()) == {"status": "ok"}
+        assert "fund_tracker_server_runs_total 1" in urlopen(f"{base}/metrics").read().decode()
+        with pytest.raises(Exception) as err:
+            urlopen(f"{base}/nope")
+        assert err.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
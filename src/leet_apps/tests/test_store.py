@@ -0,0 +1,55 @@
+import json
+
+from leet_apps.normalizer import normalize_results
+from leet_apps.store import PortfolioStore
+
+
+def _result(fund, rows):
+    raw = [{"company_name": name, "website": site, "industry": "Robotics",
+            "investment": {"round_type": rnd, "date": date, "amount": "$5M", "co_investors": co}}
+           for name, site, rnd, date, co in rows]
+    return normalize_results(raw, fund)
+
+
+def test_store_answers_queries_from_indexes():
+    with PortfolioStore() as store:
+        store.save_result(_result("Fund A", [
+            ("Acme Robotics", "https://acme.example", "Series B", "2019-03-01", ["Sequoia Capital"]),
+            ("Beta Analytics", None, "Seed", "2019-07-15", []),
+        ]))
+        store.save_result(_result("Fund B", [
+            ("Acme Robotics, Inc.", None, "series b", "2019-03-01", ["Accel"]),
+            ("Gamma Health", None, "Series B", "2020-01-10", ["Sequoia Capital"]),
+        ]))
+
+        assert [r["fund_id"] for r in store.funds_for_company("ACME Robotics")] == ["Fund A", "Fund B"]
+        assert [r["fund_id"] for r in store.funds_for_company("www.acme.example")] == ["Fund A", "Fund B"]
+        series_b_2019 = store.find_investments(round_type="Series B", year=2019)
+        assert {(r["fund_id"], r["company_name"]) for r in series_b_2019} == {("Fund A", "Acme Robotics"), ("Fund B", "Acme Robotics")}
+        assert [r["company_name"] for r in store.find_investments(co_investor="sequoia capital")] == ["Gamma Health", "Acme Robotics"]
+        assert store.find_investments(fund_id="Fund A", company="Beta Analytics")[0]["co_investors"] == []
+        assert store.funds_for_company("Unknown Co") == []
+
+        # Re-saving a fund replaces its investments
+        store.save_result(_result("Fund A", [("Beta Analytics", None, "Series A", "2021-01-01", [])]))
+        assert [r["round_type"] for r in store.find_investments(fund_id="Fund A")] == ["Series A"]
+        assert {f["id"]: f["investments"] for f in store.funds()} == {"Fund A": 1, "Fund B": 2}
+        edges = sorted((investor, name) for investor, _, name in store.iter_investment_edges(batch_size=2))
+        assert edges == [("Accel", "Acme Robotics"), ("Fund A", "Beta Analytics"), ("Fund B", "Acme Robotics"),
+                         ("Fund B", "Gamma Health"), ("Sequoia Capital", "Gamma Health")]
+
+        plan = " ".join(row[3] for row in store._db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM investments WHERE round_type = ? AND date >= ? AND date < ?",
+            ("Series B", "2019-01-01", "2020-01-01")))
+        assert "idx_investments_round_date" in plan
+
+
+def test_cli_save_and_query(tmp_path, monkeypatch, capsys):
+    from leet_apps.cli import main
+
+    monkeypatch.setenv("FUND_TRACKER_STORE_PATH", str(tmp_path / "store.sqlite"))
+    main(["--fund", "Sequoia Capital", "--output", str(tmp_path / "out"), "--no-cache", "--save"])
+    capsys.readouterr()
+    main(["query", "--company", "Acme Robotics"])
+    rows = json.loads(capsys.readouterr().out)
+    assert [r["fund_id"] for r in rows] == ["Sequoia Capital"]
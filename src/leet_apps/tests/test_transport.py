@@ -0,0 +1,79 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from leet_apps.transport import HttpTransport
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_transport_reuses_keep_alive_connections():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        transport = HttpTransport(pool_maxsize=2)
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        for _ in range(3):
+            assert transport.get(url).json() == {"ok": True}
+        stats = transport.stats()
+        assert stats["requests"] == 3
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 2
+        transport.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_orchestrator_injects_shared_transport():
+    from leet_apps.orchestrator import Orchestrator
+    from leet_apps.connectors.crunchbase import CrunchbaseConnector
+    from leet_apps.connectors.news import NewsConnector
+
+    own = HttpTransport()
+    cb, news = CrunchbaseConnector(), NewsConnector(transport=own)
+    orch = Orchestrator(connectors=[cb, news])
+    assert cb.transport is orch.transport
+    assert news.transport is own
+
+
+def test_slow_request_is_hedged_after_p95_latency():
+    import time
+
+    calls = []
+
+    class _SlowFirst(_Handler):
+        def do_GET(self):
+            calls.append(self.path)
+            if len(calls) == 1:
+                time.sleep(1.5)
+            _Handler.do_GET(self)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowFirst)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        transport = HttpTransport(hedging={"enabled": True, "min_samples": 5, "min_delay_seconds": 0.01})
+        host = f"127.0.0.1:{server.server_address[1]}"
+        for _ in range(5):
+            transport.latency.record(host, 0.05)
+        start = time.monotonic()
+        assert transport.get(f"http://{host}/data").json() == {"ok": True}
+        assert time.monotonic() - start < 1.0
+        stats = transport.stats()
+        assert stats["hedged_requests"] == 1 and stats["hedge_wins"] == 1
+        transport.close()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,241 @@
+"""
+Shared HTTP transport for connectors: pooled keep-alive connections with gzip.
+
+A single `requests.adapters.HTTPAdapter` (and therefore a single urllib3 PoolManager with
+per-host connection pools) is shared by every thread; each thread gets its own lightweight
+`requests.Session` mounted on that adapter, since sessions themselves are not thread-safe.
+
+When a rate limiter is configured (`rate_limits` in config.yaml), every request that is
+actually sent first acquires a token for its host and 429/Retry-After responses pause that host.
+
+The Orchestrator injects one transport into every connector that exposes a `transport`
+attribute, so all funds in a batch reuse the same TCP/TLS connections.
+
+Per-host circuit breakers and AIMD concurrency limits (`resilience` in config.yaml, see
+leet_apps.resilience) wrap every request, so a degraded source fails fast with CircuitOpen
+for all funds in the run.
+
+Hedged requests (`http.hedging` in config.yaml, off by default): the transport keeps a
+window of recent latencies per host, and an idempotent request (GET/HEAD) still outstanding
+after that host's p95 latency gets a duplicate sent. Whichever response arrives first is
+returned and the other is closed when it completes. Hedges cost extra upstream calls (and
+quota), so only the slow tail is duplicated.
+"""
+from typing import Any, Deque, Dict, Optional
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import contextvars
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from leet_apps.instrumentation import span
+from leet_apps.ratelimit import host_of
+
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+    "User-Agent": "fund-investment-tracker/0.1",
+}
+
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class LatencyTracker:
+    """Recent request latencies per host, for hedging delays."""
+
+    def __init__(self, window: int = 200, percentile: float = 0.95, min_samples: int = 20):
+        self.window = window
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, host: str, seconds: float):
+        with self._lock:
+            samples = self._samples.get(host)
+            if samples is None:
+                samples = self._samples[host] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def threshold(self, host: str) -> Optional[float]:
+        """Latency at `percentile` for the host, or None until `min_samples` are recorded."""
+        with self._lock:
+            samples = sorted(self._samples.get(host, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(self.percentile * len(samples)))]
+
+
+class HttpTransport:
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, timeout: float = 10.0,
+                 headers: Dict[str, str] = None, rate_limiter: Any = None, hedging: Dict[str, Any] = None,
+                 guards: Any = None):
+        # pool_connections: number of per-host pools kept; pool_maxsize: connections kept per host
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        # Optional leet_apps.ratelimit.RateLimiter applied per request host
+        self.rate_limiter = rate_limiter
+        # Optional leet_apps.resilience.SourceGuards (circuit breaker + adaptive concurrency per host)
+        self.guards = guards
+        self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._requests = 0
+        # Hedged requests (see module docstring); None when disabled
+        hedging = hedging or {}
+        self.latency = LatencyTracker(window=hedging.get("window", 200), percentile=hedging.get("percentile", 0.95),
+                                      min_samples=hedging.get("min_samples", 20)) if hedging.get("enabled") else None
+        self.min_hedge_delay = hedging.get("min_delay_seconds", 0.05)
+        self._hedge_pool = None
+        self._hedges = 0
+        self._hedge_wins = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "HttpTransport":
+        from leet_apps.ratelimit import RateLimiter
+        from leet_apps.resilience import SourceGuards
+
+        cfg = (config or {}).get("http", {}) or {}
+        return cls(
+            pool_connections=cfg.get("pool_connections", 10),
+            pool_maxsize=cfg.get("pool_maxsize", 10),
+            timeout=cfg.get("timeout_seconds", 10.0),
+            rate_limiter=RateLimiter.from_config(config),
+            hedging=cfg.get("hedging"),
+            guards=SourceGuards.from_config(config),
+        )
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            self._local.session = session
+        return session
+
+    def request(self, method: str, url: str, hedge: bool = None, **kwargs) -> requests.Response:
+        """Send a request; `hedge` overrides whether an idempotent request may be hedged."""
+        kwargs.setdefault("timeout", self.timeout)
+        if hedge is None:
+            hedge = method.upper() in IDEMPOTENT_METHODS
+        if self.latency is not None and hedge:
+            return self._hedged(method, url, kwargs)
+        return self._send(method, url, kwargs)
+
+    def _send(self, method: str, url: str, kwargs: Dict[str, Any]) -> requests.Response:
+        host = host_of(url)
+
+        def admit():
+            if self.rate_limiter is not None:
+                with span("ratelimit.wait", host=host):
+                    self.rate_limiter.acquire(url)
+
+        start = None
+
+        def send():
+            nonlocal start
+            start = time.monotonic()
+            with span("http.request", host=host, method=method.upper()) as s:
+                resp = self._session().request(method, url, **kwargs)
+                s.set("status", resp.status_code)
+            return resp
+
+        if self.guards is not None:
+            # The breaker is checked first: refused calls take no rate-limit token or quota
+            resp = self.guards.call(url, send, admit=admit)
+        else:
+            admit()
+            resp = send()
+        if self.latency is not None:
+            self.latency.record(host, time.monotonic() - start)
+        with self._lock:
+            self._requests += 1
+        if self.rate_limiter is not None:
+            self.rate_limiter.record_response(url, resp)
+        return resp
+
+    def _get_hedge_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(max_workers=2 * self.pool_maxsize, thread_name_prefix="hedge")
+            return self._hedge_pool
+
+    def _hedged(self, method: str, url: str, kwargs: Dict[str, Any]) -> requests.Response:
+        delay = self.latency.threshold(host_of(url))
+        if delay is None:
+            # Not enough samples for this host yet
+            return self._send(method, url, kwargs)
+        pool = self._get_hedge_pool()
+        # Copy the caller's context so both attempts are traced under the caller's span
+        primary = pool.submit(contextvars.copy_context().run, self._send, method, url, kwargs)
+        done, _ = wait([primary], timeout=max(delay, self.min_hedge_delay))
+        if done:
+            return primary.result()
+        backup = pool.submit(contextvars.copy_context().run, self._send, method, url, kwargs)
+        with self._lock:
+            self._hedges += 1
+        outstanding = {primary, backup}
+        error = None
+        while outstanding:
+            done, outstanding = wait(outstanding, return_when=FIRST_COMPLETED)
+            for fut in done:
+                if fut.exception() is not None:
+                    error = fut.exception()
+                    continue
+                if fut is backup:
+                    with self._lock:
+                        self._hedge_wins += 1
+                for other in outstanding:
+                    # Release the loser's connection back to the pool once it finishes
+                    other.add_done_callback(_close_response)
+                return fut.result()
+        raise error
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Drop-in replacement for requests.get."""
+        return self.request("GET", url, **kwargs)
+
+    def source_available(self, url: str) -> bool:
+        """False while the URL's host has an open circuit."""
+        return self.guards is None or self.guards.available(url)
+
+    def stats(self) -> Dict[str, int]:
+        """Connection reuse metrics aggregated over the live per-host pools."""
+        pools = self._adapter.poolmanager.pools
+        opened = 0
+        with pools.lock:
+            live = list(pools._container.values())
+        for pool in live:
+            opened += getattr(pool, "num_connections", 0)
+        with self._lock:
+            total, hedges, hedge_wins = self._requests, self._hedges, self._hedge_wins
+        return {
+            "requests": total,
+            "connections_opened": opened,
+            "connections_reused": max(total - opened, 0),
+            "host_pools": len(live),
+            "hedged_requests": hedges,
+            "hedge_wins": hedge_wins,
+            "sources": self.guards.snapshot() if self.guards is not None else {},
+        }
+
+    def close(self):
+        """Close all pooled connections. The transport reconnects transparently if used again."""
+        with self._lock:
+            pool, self._hedge_pool = self._hedge_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        self._adapter.close()
+
+
+def _close_response(fut):
+    if not fut.cancelled() and fut.exception() is None:
+        fut.result().close()
@@ -1,73 +1,138 @@
 """
-Utility helpers: simple rate limiter and caching helper for connectors (MVP).
+Utility helpers: rate limiting, robots.txt checks and caching helper for connectors (MVP).
 
-This provides a lightweight per-host rate limiter and an in-memory cache decorator useful
-for testing and to demonstrate N1 requirements.
+This provides a per-host rate limiting decorator (backed by leet_apps.ratelimit), a cached
+robots.txt check (backed by leet_apps.robots), a single-flight helper for deduplicating
+concurrent work, per-fund file names, and an in-memory cache decorator useful for testing
+and to demonstrate N1 requirements.
 """
-import time
+import hashlib
+import re
 import threading
 from functools import wraps
 
-# Simple per-host rate limiter using last-access timestamps
-# Robots.txt parser cache
-import urllib.robotparser
-import urllib.parse
 
-_robot_parsers = {}
+def fund_slug(fund_input: str, max_length: int = 64) -> str:
+    """Turn a fund name or URL into a safe file name stem that is unique per input.
+
+    The readable part keeps only [A-Za-z0-9._-], so different inputs ("Fund/A" and "Fund A",
+    any two non-Latin names) can reduce to the same text; a short hash of the exact input
+    keeps their files apart.
+    """
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", fund_input).strip("._")[:max_length] or "fund"
+    digest = hashlib.sha1(fund_input.encode("utf-8")).hexdigest()[:10]
+    return f"{slug}-{digest}"
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls for the same key.
+
+    The first caller for a key runs the function; callers arriving while it is in flight
+    wait for and share its result (or exception) instead of repeating the work.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, *args, return_shared: bool = False, **kwargs):
+        """Run (or join) the call for `key`.
+
+        With `return_shared`, returns (result, shared) where `shared` is True when another
+        caller's in-flight run was reused.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {"event": threading.Event(), "result": None, "error": None}
+        if not leader:
+            call["event"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return (call["result"], True) if return_shared else call["result"]
+        try:
+            call["result"] = fn(*args, **kwargs)
+            return (call["result"], False) if return_shared else call["result"]
+        except BaseException as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call["event"].set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+# Robots.txt checks are delegated to a shared RobotsCache (see leet_apps.robots)
+_default_robots = None
+_default_robots_lock = threading.Lock()
+
+
+def get_robots_cache():
+    """Return the process-wide RobotsCache used by allowed_to_fetch()."""
+    global _default_robots
+    with _default_robots_lock:
+        if _default_robots is None:
+            from leet_apps.robots import RobotsCache
+
+            _default_robots = RobotsCache()
+        return _default_robots
 
 
 def allowed_to_fetch(url: str, user_agent: str = "*") -> bool:
     """Check robots.txt for the given URL's host and return whether fetching is allowed.
 
-    Results are cached per host to avoid repeated network calls. If robots.txt cannot be
-    fetched or parsed, default to False (conservative).
+    Results are cached per host with a TTL (failures expire sooner), and concurrent checks
+    for the same host share one robots.txt fetch. If robots.txt cannot be fetched, default
+    to False (conservative) until the negative entry expires.
     """
     try:
-        parsed = urllib.parse.urlparse(url)
-        host = parsed.netloc
-        if not host:
-            return False
-        rp = _robot_parsers.get(host)
-        if rp is None:
-            robots_url = f"{parsed.scheme}://{host}/robots.txt"
-            rp = urllib.robotparser.RobotFileParser()
-            try:
-                rp.set_url(robots_url)
-                rp.read()
-            except Exception:
-                # If robots can't be read, be conservative and disallow
-                _robot_parsers[host] = None
-                return False
-            _robot_parsers[host] = rp
-        if _robot_parsers[host] is None:
-            return False
-        return _robot_parsers[host].can_fetch(user_agent, url)
+        return get_robots_cache().allowed(url, user_agent)
     except Exception:
         return False
 
-# Simple per-host rate limiter using last-access timestamps
-_host_locks = {}
-_host_last_access = {}
-_host_lock = threading.Lock()
 
+# Per-host rate limiting is delegated to a shared token-bucket limiter (see leet_apps.ratelimit)
+_default_limiter = None
+_default_limiter_lock = threading.Lock()
 
-def rate_limit(host: str, min_interval: float = 1.0):
-    """Decorator to ensure a minimum interval between actions for a given host."""
+
+def get_rate_limiter():
+    """Return the process-wide RateLimiter used by rate_limit()."""
+    global _default_limiter
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            from leet_apps.ratelimit import RateLimiter
+
+            _default_limiter = RateLimiter()
+        return _default_limiter
+
+
+def rate_limit(host: str = None, min_interval: float = 1.0, burst: int = 1):
+    """Decorator to ensure a minimum interval between actions for a given host.
+
+    If `host` is omitted, it is resolved per call from the first positional argument that
+    looks like a URL, so one decorated function can serve many hosts. Waiting happens
+    outside of any lock, so concurrent callers are spaced out rather than serialized.
+    """
 
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            with _host_lock:
-                lock = _host_locks.setdefault(host, threading.Lock())
-            with lock:
-                last = _host_last_access.get(host)
-                now = time.time()
-                if last is not None:
-                    elapsed = now - last
-                    if elapsed < min_interval:
-                        time.sleep(min_interval - elapsed)
-                _host_last_access[host] = time.time()
-                return func(*args, **kwargs)
+            target = host
+            if target is None:
+                target = next((a for a in args if isinstance(a, str) and "://" in a), None)
+            if target:
+                from leet_apps.ratelimit import host_of
+
+                limiter = get_rate_limiter()
+                limiter.configure_host(host_of(target), rate=1.0 / min_interval, burst=burst, replace=False)
+                limiter.acquire(target)
+            return func(*args, **kwargs)
 
         return wrapper
 